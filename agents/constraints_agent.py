@@ -143,7 +143,7 @@ class ConstraintAgent(BaseAgent):
     }
 
     def run_agent(self, memory: SharedMemory):
-        state = memory.get_full_state()
+        state = memory.working_state()
         constraints = state.get("constraints") or {}
         topology_key = state.get("selected_topology")
         eval_topology = canonical_topology_key(topology_key)
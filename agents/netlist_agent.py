@@ -8,6 +8,7 @@ from agents.design_status import DesignStatus
 from core.shared_memory import SharedMemory
 from core.topology_aliases import canonical_topology_key
 from llm.netlist_backends import cleanup_spice_netlist, generate_netlist_with_backends
+from llm.response_cache import consume_cache_activity
 
 
 class NetlistAgent(BaseAgent):
@@ -190,7 +191,10 @@ class NetlistAgent(BaseAgent):
                 "task": "netlist_backend_route",
                 "backend_used": result.backend_used,
                 "fallback_reason": result.fallback_reason,
+                "route": result.route,
+                "backend_latencies_s": result.backend_latencies_s,
                 "ok": bool(result.cleaned_netlist),
+                **consume_cache_activity(),
             },
         )
         metadata = {
@@ -200,6 +204,8 @@ class NetlistAgent(BaseAgent):
             "cleaned_netlist": result.cleaned_netlist,
             "fallback_reason": result.fallback_reason,
             "warnings": result.warnings,
+            "route": result.route,
+            "backend_latencies_s": result.backend_latencies_s,
         }
         return {
             "netlist": result.cleaned_netlist,
@@ -1493,6 +1499,7 @@ Hard requirements:
                     "agent": "NetlistAgent",
                     "task": "single_topology_netlist",
                     "ok": bool(result),
+                    **consume_cache_activity(),
                 },
             )
 
@@ -1555,6 +1562,7 @@ Hard requirements:
                     "agent": "NetlistAgent",
                     "task": "composite_netlist",
                     "ok": bool(result),
+                    **consume_cache_activity(),
                 },
             )
         if isinstance(result, dict):
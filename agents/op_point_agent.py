@@ -2,12 +2,12 @@
 
 import os
 import re
-import shutil
-import subprocess
 import tempfile
 
 from agents.base_agent import BaseAgent
 from agents.design_status import DesignStatus
+from core.ngspice_backend import resolve_ngspice_backend
+from core.simulation_cache import with_simulation_cache
 from core.shared_memory import SharedMemory
 
 
@@ -61,11 +61,8 @@ class OpPointAgent(BaseAgent):
     def __init__(self, llm=None, reference_catalog=None, ngspice_path=None, max_op_passes=2, max_retries=1, wait=0):
         super().__init__(llm=llm, reference_catalog=reference_catalog, max_retries=max_retries, wait=wait)
         self.max_op_passes = max_op_passes
-        configured = ngspice_path or os.getenv("NGSPICE_PATH")
-        if configured and os.path.exists(configured):
-            self.ngspice_path = configured
-        else:
-            self.ngspice_path = self._find_ngspice()
+        self.simulator = with_simulation_cache(resolve_ngspice_backend(ngspice_path))
+        self.ngspice_path = self.simulator.path if self.simulator else None
 
     def run_agent(self, memory: SharedMemory):
         topology = memory.read("selected_topology")
@@ -97,7 +94,7 @@ class OpPointAgent(BaseAgent):
             memory.write("op_point_error", "Missing netlist for OP sizing pass.")
             return None
 
-        if not self.ngspice_path:
+        if not self.simulator:
             payload = {
                 "supported": True,
                 "changed": False,
@@ -131,13 +128,8 @@ class OpPointAgent(BaseAgent):
             with open(netlist_path, "w") as f:
                 f.write(op_netlist)
 
-            result = subprocess.run(
-                [self.ngspice_path, "-b", "-o", "op_pass.log", netlist_path],
-                cwd=tmpdir,
-                capture_output=True,
-                text=True,
-            )
-            log_path = os.path.join(tmpdir, "op_pass.log")
+            result = self.simulator.run(netlist_path, cwd=tmpdir, log_name="op_pass.log")
+            log_path = result.log_path
             if result.returncode != 0 or not os.path.exists(log_path):
                 memory.write("status", DesignStatus.OP_SIZING_FAILED)
                 memory.write(
@@ -168,6 +160,7 @@ class OpPointAgent(BaseAgent):
                 "characterization": op_characterization,
                 "notes": notes,
                 "pass_index": pass_count + 1,
+                "simulation_cached": result.cached,
             }
             memory.write("op_point_results", payload)
             memory.write("sizing", sizing)
@@ -536,14 +529,3 @@ class OpPointAgent(BaseAgent):
             "estimated_power_mw": power_mw,
             "devices": device_summary,
         }
-
-    def _find_ngspice(self):
-        candidates = [
-            shutil.which("ngspice"),
-            "/opt/homebrew/bin/ngspice",
-            "/usr/local/bin/ngspice",
-        ]
-        for path in candidates:
-            if path and os.path.exists(path):
-                return path
-        return None
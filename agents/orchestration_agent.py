@@ -1,5 +1,6 @@
 # I13/agents/orchestration_agent.py
 
+from core.schematic_artifacts import complete_queued_schematics
 from flow.design_flow import build_design_flow
 
 
@@ -17,6 +18,7 @@ class OrchestrationAgent:
         max_iterations=3,
     ):
         self.memory = memory
+        self.simulation_agent = simulation_agent
         self.flow = build_design_flow(
             topology_agent=topology_agent,
             sizing_agent=sizing_agent,
@@ -30,4 +32,6 @@ class OrchestrationAgent:
 
     def run(self):
         self.flow.run(self.memory)
+        # Queued schematics are the only work the final report waits for.
+        complete_queued_schematics(self.memory, queue=self.simulation_agent.schematic_queue)
         return self.memory.get_full_state()
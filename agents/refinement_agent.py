@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Tuple
 from agents.base_agent import BaseAgent
 from agents.design_status import DesignStatus
 from core.shared_memory import SharedMemory
+from llm.response_cache import consume_cache_activity
 
 
 @dataclass
@@ -35,7 +36,7 @@ class RefinementAgent(BaseAgent):
         self.max_factor = max_factor
 
     def run_agent(self, memory: SharedMemory):
-        state = memory.get_full_state()
+        state = memory.working_state()
         constraints = state.get("constraints") or {}
         topo = state.get("selected_topology") or constraints.get("circuit_type")
         sizing = state.get("sizing") or {}
@@ -257,6 +258,7 @@ class RefinementAgent(BaseAgent):
                     "agent": "RefinementAgent",
                     "task": "numeric_refinement",
                     "ok": isinstance(result, dict),
+                    **consume_cache_activity(),
                 },
             )
         if not isinstance(result, dict):
@@ -0,0 +1,25 @@
+# I13/agents/schematic_agent.py
+
+from agents.base_agent import BaseAgent
+from core.schematic_artifacts import failed_schematic_metadata, render_schematic_artifacts
+from core.shared_memory import SharedMemory
+
+
+class SchematicAgent(BaseAgent):
+    """Renders the attempt's schematic as a parallel branch next to SimulationAgent."""
+
+    def run_agent(self, memory: SharedMemory):
+        attempt = memory.read("simulation_attempt") or {}
+        if not attempt.get("saved_netlist_path"):
+            memory.write("schematic_artifacts", failed_schematic_metadata("No prepared simulation attempt"))
+            return None
+        metadata = render_schematic_artifacts(
+            attempt["saved_netlist_path"],
+            attempt["base_dir"],
+            topology=attempt.get("topology"),
+            sizing=memory.read("sizing") or {},
+            constraints=attempt.get("constraints") or {},
+        )
+        metadata["attempt_dir"] = attempt["base_dir"]
+        memory.write("schematic_artifacts", metadata)
+        return metadata
@@ -1,18 +1,24 @@
 # I13/agents/simulation_agent.py
 
+import functools
+import hashlib
 import json
 import math
 import os
 import re
-import shutil
-import subprocess
 import tempfile
+import threading
+import time
 from html import escape
 from datetime import datetime
 from core.analog_defaults import ANALOG_DEFAULTS
 from core.demo_catalog import slugify_label
+from core.ngspice_backend import resolve_ngspice_backend
+from core.schematic_artifacts import pending_schematic_metadata, render_schematic_artifacts
+from core.simulation_cache import with_simulation_cache
 from core.simulation_plan import build_simulation_plan
 from core.topology_aliases import canonical_topology_key
+from core.waveforms import WaveformStore, add_rawfile_outputs, rawfile_outputs_enabled
 from core.verification_pipeline import (
     build_final_status_summary,
     build_structured_verification,
@@ -24,6 +30,31 @@ from agents.base_agent import BaseAgent
 from agents.design_status import DesignStatus
 from core.shared_memory import SharedMemory
 
+# pyplot keeps global figure state; concurrent design runs in threads take turns.
+_PYPLOT_LOCK = threading.RLock()
+
+
+def _serialize_pyplot(method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with _PYPLOT_LOCK:
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def _claim_run_dir(path: str) -> str:
+    # Concurrent runs of one case can stamp the same microsecond; never share a directory.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    candidate, suffix = path, 1
+    while True:
+        try:
+            os.mkdir(candidate)
+            return candidate
+        except FileExistsError:
+            candidate = f"{path}-{suffix}"
+            suffix += 1
+
 
 class SimulationAgent(BaseAgent):
     AC_EXPECTED_TOPOLOGIES = {
@@ -51,13 +82,23 @@ class SimulationAgent(BaseAgent):
         "current_sense_amp_helper",
     }
 
-    def __init__(self, llm=None, reference_catalog=None, ngspice_path=None, max_retries=1, wait=0):
+    def __init__(
+        self,
+        llm=None,
+        reference_catalog=None,
+        ngspice_path=None,
+        max_retries=1,
+        wait=0,
+        render_schematic=True,
+        schematic_queue=None,
+    ):
         super().__init__(llm=llm, reference_catalog=reference_catalog, max_retries=max_retries, wait=wait)
-        configured = ngspice_path or os.getenv("NGSPICE_PATH")
-        if configured and os.path.exists(configured):
-            self.ngspice_path = configured
-        else:
-            self.ngspice_path = self._find_ngspice()
+        # False when a SchematicAgent branch renders the schematic alongside ngspice.
+        self.render_schematic = render_schematic
+        # When set, schematics are rendered in the background and folded in at the end of the run.
+        self.schematic_queue = schematic_queue
+        self.simulator = with_simulation_cache(resolve_ngspice_backend(ngspice_path))
+        self.ngspice_path = self.simulator.path if self.simulator else None
 
     def run_agent(self, memory: SharedMemory):
         netlist = memory.read("netlist")
@@ -71,9 +112,10 @@ class SimulationAgent(BaseAgent):
             memory.write("simulation_error", "Missing netlist")
             return None
 
-        run_id = self._build_run_id(memory, topology)
-        base_dir = os.path.join("artifacts", "simulations", run_id)
-        os.makedirs(base_dir, exist_ok=True)
+        attempt = self._prepared_attempt(memory, netlist) or self.prepare_attempt(memory)
+        base_dir = attempt["base_dir"]
+        saved_netlist_path = attempt["saved_netlist_path"]
+        netlist_backend_metadata = memory.read("netlist_backend_metadata") or {}
         case_meta = memory.read("case_metadata") or {}
         simulation_plan = build_simulation_plan(
             topology=topology,
@@ -84,40 +126,21 @@ class SimulationAgent(BaseAgent):
             os.getenv("I13_FORCE_SKIP_SIMULATION", "0").strip() == "1"
         )
         planned_analyses = set(simulation_plan.get("analyses") or [])
-        manifest = {
-            "case_key": case_meta.get("case_key"),
-            "display_name": case_meta.get("display_name"),
-            "artifact_label": case_meta.get("artifact_label"),
-            "topology": topology,
-            "attempt": int(memory.read("iteration", 0)) + 1,
-            "analyses": simulation_plan.get("analyses", []),
-            "intent": simulation_plan.get("intent"),
-            "primary_metrics": simulation_plan.get("primary_metrics", []),
-            "simulation_plan": simulation_plan,
-        }
-        self._safe_write_text(
-            os.path.join(base_dir, "run_manifest.json"),
-            self._to_json(manifest),
-        )
-
-        saved_netlist_path = os.path.join(base_dir, "generated.sp")
-        with open(saved_netlist_path, "w") as f:
-            f.write(netlist)
-        netlist_backend_metadata = self._persist_netlist_backend_metadata(
-            memory=memory,
-            base_dir=base_dir,
-            cleaned_netlist_path=saved_netlist_path,
-        )
-        schematic_metadata = self._generate_schematic_artifacts(
-            saved_netlist_path,
-            base_dir,
-            topology=topology,
-            sizing=sizing,
-            constraints=constraints,
-        )
+        if self.schematic_queue is not None:
+            schematic_metadata = self._queue_schematic(memory, saved_netlist_path, base_dir, topology, sizing, constraints)
+        elif self.render_schematic:
+            schematic_metadata = self._generate_schematic_artifacts(
+                saved_netlist_path,
+                base_dir,
+                topology=topology,
+                sizing=sizing,
+                constraints=constraints,
+            )
+        else:
+            schematic_metadata = pending_schematic_metadata()
         analysis_data = {}
 
-        if force_skip_simulation or not self.ngspice_path:
+        if force_skip_simulation or not self.simulator:
             if force_skip_simulation:
                 skip_reason = (
                     case_meta.get("skip_simulation_reason")
@@ -173,12 +196,9 @@ class SimulationAgent(BaseAgent):
                 status=DesignStatus.SIMULATION_COMPLETE,
             )
 
-        result = subprocess.run(
-            [self.ngspice_path, "-b", "-o", "ngspice.log", "generated.sp"],
-            cwd=base_dir,
-            capture_output=True,
-            text=True
-        )
+        sim_start = time.perf_counter()
+        result = self.simulator.run("generated.sp", cwd=base_dir, log_name="ngspice.log")
+        simulation_time_s = time.perf_counter() - sim_start
 
         sim = {
             "stdout": result.stdout,
@@ -187,6 +207,10 @@ class SimulationAgent(BaseAgent):
             "saved_netlist_path": saved_netlist_path,
             "artifact_dir": base_dir,
             "ngspice_path": self.ngspice_path,
+            "simulator_backend": result.backend,
+            "simulation_cached": result.cached,
+            "simulation_cache_key": result.cache_key,
+            "simulation_time_s": simulation_time_s,
             "analyses": simulation_plan.get("analyses", []),
             "intent": simulation_plan.get("intent"),
             "simulation_provenance": "Executed directly from artifact generated.sp",
@@ -221,6 +245,11 @@ class SimulationAgent(BaseAgent):
                 status=DesignStatus.SIMULATION_FAILED,
             )
 
+        # Every output of this attempt is read at most once through the store.
+        waveforms = WaveformStore(base_dir)
+        if waveforms.waveforms:
+            sim["waveform_vectors"] = waveforms.waveforms.summary()
+
         ac_csv = os.path.join(base_dir, "ac_out.csv")
         ac_phase_csv = os.path.join(base_dir, "ac_phase.csv")
         dc_csv = os.path.join(base_dir, "dc_out.csv")
@@ -235,9 +264,9 @@ class SimulationAgent(BaseAgent):
         # -------------------------
         if os.path.exists(ac_csv):
             sim["ac_csv"] = ac_csv
-            sim["ac_preview"] = self._preview_file(ac_csv, max_lines=8)
+            sim["ac_preview"] = waveforms.preview(ac_csv, max_lines=8)
 
-            ac_data = self._read_ngspice_ac(ac_csv)
+            ac_data = waveforms.series(ac_csv)
             analysis_data["ac_data"] = ac_data
             ac_validation = self._validate_xy_data(
                 name="ac_dataset",
@@ -300,7 +329,7 @@ class SimulationAgent(BaseAgent):
                 )
             if os.path.exists(ac_phase_csv):
                 sim["ac_phase_csv"] = ac_phase_csv
-                ac_phase_data = self._read_wrdata_xy(ac_phase_csv)
+                ac_phase_data = waveforms.series(ac_phase_csv)
                 analysis_data["ac_phase_data"] = ac_phase_data
         elif "ac" in planned_analyses:
             sim["plot_validations"].append(
@@ -326,9 +355,9 @@ class SimulationAgent(BaseAgent):
         # -------------------------
         if os.path.exists(dc_csv):
             sim["dc_csv"] = dc_csv
-            sim["dc_preview"] = self._preview_file(dc_csv, max_lines=8)
+            sim["dc_preview"] = waveforms.preview(dc_csv, max_lines=8)
 
-            dc_data = self._read_wrdata_xy(dc_csv)
+            dc_data = waveforms.series(dc_csv)
             analysis_data["dc_data"] = dc_data
             sim["plot_validations"].append(
                 self._validate_xy_data(
@@ -367,14 +396,14 @@ class SimulationAgent(BaseAgent):
 
         if os.path.exists(tran_in_csv):
             sim["tran_in_csv"] = tran_in_csv
-            tran_in_data = self._read_wrdata_xy(tran_in_csv)
+            tran_in_data = waveforms.series(tran_in_csv)
             analysis_data["tran_in_data"] = tran_in_data
             tran_series["V(in)"] = tran_in_data
 
         if os.path.exists(tran_out_csv):
             sim["tran_out_csv"] = tran_out_csv
-            sim["tran_preview"] = self._preview_file(tran_out_csv, max_lines=5)
-            tran_out_data = self._read_wrdata_xy(tran_out_csv)
+            sim["tran_preview"] = waveforms.preview(tran_out_csv, max_lines=5)
+            tran_out_data = waveforms.series(tran_out_csv)
             analysis_data["tran_out_data"] = tran_out_data
             tran_series["V(out)"] = tran_out_data
 
@@ -391,7 +420,7 @@ class SimulationAgent(BaseAgent):
             candidate = os.path.join(base_dir, filename)
             if os.path.exists(candidate):
                 sim[sim_key] = candidate
-                tran_series[label] = self._read_wrdata_xy(candidate)
+                tran_series[label] = waveforms.series(candidate)
                 if sim_key == "tran_outn_csv":
                     tran_outn_data = tran_series[label]
                     analysis_data["tran_outn_data"] = tran_outn_data
@@ -399,13 +428,13 @@ class SimulationAgent(BaseAgent):
         tran_qb_csv = os.path.join(base_dir, "tran_qb.csv")
         if os.path.exists(tran_qb_csv):
             sim["tran_qb_csv"] = tran_qb_csv
-            tran_qb_data = self._read_wrdata_xy(tran_qb_csv)
+            tran_qb_data = waveforms.series(tran_qb_csv)
             tran_series["V(QB)"] = tran_qb_data
 
         tran_diff_csv = os.path.join(base_dir, "tran_diff.csv")
         if os.path.exists(tran_diff_csv):
             sim["tran_diff_csv"] = tran_diff_csv
-            tran_diff_data = self._read_wrdata_xy(tran_diff_csv)
+            tran_diff_data = waveforms.series(tran_diff_csv)
             analysis_data["tran_diff_data"] = tran_diff_data
             tran_series["V(outp,outn)"] = tran_diff_data
 
@@ -446,8 +475,8 @@ class SimulationAgent(BaseAgent):
 
         if os.path.exists(log_path):
             sim["log_path"] = log_path
-            sim["log_preview"] = self._preview_file(log_path, max_lines=20)
-            device_metrics = self._extract_device_metrics_from_log(log_path)
+            sim["log_preview"] = waveforms.text_preview(log_path, max_lines=20)
+            device_metrics = self._extract_device_metrics_from_text(waveforms.text(log_path))
             if device_metrics:
                 sim["device_metrics"] = device_metrics
 
@@ -705,7 +734,8 @@ class SimulationAgent(BaseAgent):
                 verification_summary=verification_summary,
                 verification_reference_summary=verification_reference_summary,
                 base_dir=base_dir,
-                log_text=self._read_text(log_path),
+                log_text=waveforms.text(log_path),
+                waveforms=waveforms,
                 status=DesignStatus.SIMULATION_COMPLETE,
             )
 
@@ -733,6 +763,7 @@ class SimulationAgent(BaseAgent):
         base_dir=None,
         log_text="",
         status=DesignStatus.SIMULATION_COMPLETE,
+        waveforms=None,
     ):
         analysis_metrics = collect_analysis_metrics(
             topology=topology_eval,
@@ -743,6 +774,7 @@ class SimulationAgent(BaseAgent):
             analysis_data=analysis_data or {},
             op_point_results=memory.read("op_point_results") or {},
             log_text=log_text,
+            waveforms=waveforms,
         )
         summary = build_structured_verification(
             topology=topology_eval,
@@ -789,15 +821,68 @@ class SimulationAgent(BaseAgent):
         memory.write("status", status)
         return sim
 
-    def _find_ngspice(self):
-        candidates = [
-            shutil.which("ngspice"),
-            "/opt/homebrew/bin/ngspice",
-            "/usr/local/bin/ngspice",
-        ]
-        for path in candidates:
-            if path and os.path.exists(path):
-                return path
+    def prepare_attempt(self, memory: SharedMemory):
+        """Create this attempt's artifact directory with run_manifest.json and generated.sp."""
+        netlist = memory.read("netlist")
+        if not netlist:
+            return None
+        topology = memory.read("selected_topology")
+        constraints = self._merged_constraints(memory)
+        run_id = self._build_run_id(memory, topology)
+        base_dir = _claim_run_dir(os.path.join("artifacts", "simulations", run_id))
+        case_meta = memory.read("case_metadata") or {}
+        simulation_plan = build_simulation_plan(
+            topology=topology,
+            constraints=constraints,
+            override=case_meta.get("simulation_plan") or {},
+        )
+        manifest = {
+            "case_key": case_meta.get("case_key"),
+            "display_name": case_meta.get("display_name"),
+            "artifact_label": case_meta.get("artifact_label"),
+            "topology": topology,
+            "attempt": int(memory.read("iteration", 0)) + 1,
+            "analyses": simulation_plan.get("analyses", []),
+            "intent": simulation_plan.get("intent"),
+            "primary_metrics": simulation_plan.get("primary_metrics", []),
+            "simulation_plan": simulation_plan,
+        }
+        self._safe_write_text(
+            os.path.join(base_dir, "run_manifest.json"),
+            self._to_json(manifest),
+        )
+
+        saved_netlist_path = os.path.join(base_dir, "generated.sp")
+        with open(saved_netlist_path, "w") as f:
+            f.write(add_rawfile_outputs(netlist) if rawfile_outputs_enabled() else netlist)
+        self._persist_netlist_backend_metadata(
+            memory=memory,
+            base_dir=base_dir,
+            cleaned_netlist_path=saved_netlist_path,
+        )
+        attempt = {
+            "base_dir": base_dir,
+            "saved_netlist_path": saved_netlist_path,
+            "netlist_sha1": hashlib.sha1(netlist.encode("utf-8")).hexdigest(),
+            "iteration": int(memory.read("iteration", 0)),
+            "topology": topology,
+            "constraints": constraints,
+        }
+        memory.write("simulation_attempt", attempt)
+        return attempt
+
+    def _prepared_attempt(self, memory: SharedMemory, netlist: str):
+        # Only reuse an attempt prepared for this exact netlist and iteration,
+        # and only when a sibling branch is rendering the schematic from it.
+        if self.render_schematic:
+            return None
+        attempt = memory.read("simulation_attempt") or {}
+        if (
+            attempt.get("netlist_sha1") == hashlib.sha1(netlist.encode("utf-8")).hexdigest()
+            and attempt.get("iteration") == int(memory.read("iteration", 0))
+            and os.path.isdir(attempt.get("base_dir") or "")
+        ):
+            return attempt
         return None
 
     def _persist_netlist_backend_metadata(self, memory: SharedMemory, base_dir: str, cleaned_netlist_path: str):
@@ -833,34 +918,14 @@ class SimulationAgent(BaseAgent):
         return metadata
 
     def _generate_schematic_artifacts(self, netlist_path: str, base_dir: str, topology: str = None, sizing: dict = None, constraints: dict = None):
-        png_path = os.path.join(base_dir, "schematic.png")
-        try:
-            from tools.netlist_to_schematic import generate_schematic
+        return render_schematic_artifacts(netlist_path, base_dir, topology=topology, sizing=sizing, constraints=constraints)
 
-            result = generate_schematic(
-                netlist_path,
-                png_path,
-                topology=topology,
-                sizing=sizing or {},
-                constraints=constraints or {},
-            )
-            metadata_path = os.path.join(base_dir, "schematic_metadata.json")
-            self._safe_write_text(metadata_path, self._to_json(result))
-            return {
-                "schematic_png_path": result.get("schematic_png_path"),
-                "schematic_svg_path": result.get("schematic_svg_path"),
-                "schematic_status": result.get("schematic_status", "failed"),
-                "schematic_failure_reason": result.get("schematic_failure_reason"),
-                "schematic_metadata_path": metadata_path,
-            }
-        except Exception as exc:
-            return {
-                "schematic_png_path": None,
-                "schematic_svg_path": None,
-                "schematic_status": "failed",
-                "schematic_failure_reason": str(exc),
-                "schematic_metadata_path": None,
-            }
+    def _queue_schematic(self, memory: SharedMemory, netlist_path: str, base_dir: str, topology, sizing, constraints):
+        key = self.schematic_queue.submit(netlist_path, base_dir, topology=topology, sizing=sizing, constraints=constraints)
+        requests = list(memory.read("schematic_requests") or [])
+        requests.append({"key": key, "attempt_dir": base_dir})
+        memory.write("schematic_requests", requests)
+        return {**pending_schematic_metadata(), "schematic_render_key": key}
 
     def _analysis_topology(self, topology: str):
         canonical = canonical_topology_key(topology)
@@ -905,94 +970,6 @@ class SimulationAgent(BaseAgent):
     def _to_json(self, value):
         return json.dumps(value, indent=2, sort_keys=True)
 
-    def _preview_file(self, path, max_lines=5):
-        preview = []
-        try:
-            with open(path, "r") as f:
-                for _ in range(max_lines):
-                    line = f.readline()
-                    if not line:
-                        break
-                    preview.append(line.rstrip())
-        except Exception:
-            pass
-        return preview
-
-    def _extract_numeric_tokens(self, line):
-        matches = re.findall(r"[-+]?(?:\d*\.\d+|\d+)(?:[eE][-+]?\d+)?", line)
-        values = []
-        for token in matches:
-            try:
-                values.append(float(token))
-            except ValueError:
-                pass
-        return values
-
-    def _read_ngspice_ac(self, path):
-        """
-        For the observed AC CSV format, the useful data is:
-        - first column: frequency
-        - last column: linear magnitude of output
-
-        Example row:
-        1E+00  1E+00  0E+00  1E+00  9.999995E-01
-
-        We therefore use:
-        x = nums[0]
-        y = nums[-1]
-        """
-        xs = []
-        ys = []
-
-        with open(path, "r") as f:
-            for raw_line in f:
-                line = raw_line.strip()
-                if not line:
-                    continue
-
-                nums = self._extract_numeric_tokens(line)
-                if len(nums) < 2:
-                    continue
-
-                x = nums[0]
-                y = nums[-1]
-
-                xs.append(x)
-                ys.append(y)
-
-        return {"x": xs, "y": ys}
-
-    def _read_wrdata_xy(self, path):
-        """
-        Parser for transient CSV-like wrdata output.
-        Typical format observed:
-        time  time  value
-
-        We therefore use:
-        x = first column
-        y = last column
-        """
-        xs = []
-        ys = []
-
-        with open(path, "r") as f:
-            for raw_line in f:
-                line = raw_line.strip()
-                if not line:
-                    continue
-
-                nums = self._extract_numeric_tokens(line)
-                if len(nums) < 2:
-                    continue
-
-                x = nums[0]
-                y = nums[-1]
-
-                xs.append(x)
-                ys.append(y)
-
-        return {"x": xs, "y": ys}
-
     def _validate_xy_data(self, name, data, min_points=3, x_monotonic=False, x_positive=False):
         xs = list((data or {}).get("x") or [])
         ys = list((data or {}).get("y") or [])
@@ -1291,6 +1268,7 @@ class SimulationAgent(BaseAgent):
 
         return 1.0 / (2.0 * math.pi * r * c)
 
+    @_serialize_pyplot
     def _plot_ac(self, data, out_path, input_ac_mag=1.0):
         """
         Input y-values are output magnitudes.
@@ -1326,6 +1304,7 @@ class SimulationAgent(BaseAgent):
             ylabel="Gain (dB)",
         )
 
+    @_serialize_pyplot
     def _plot_tran(self, tran_in_data, tran_out_data, out_path):
         if not tran_out_data or not tran_out_data["x"] or not tran_out_data["y"]:
             return
@@ -1361,6 +1340,7 @@ class SimulationAgent(BaseAgent):
             ylabel="Voltage (V)",
         )
 
+    @_serialize_pyplot
     def _plot_tran_series(self, series_map, out_path):
         ordered = []
         palette = [
@@ -1410,6 +1390,7 @@ class SimulationAgent(BaseAgent):
             ylabel="Voltage (V)",
         )
 
+    @_serialize_pyplot
     def _plot_dc(self, dc_data, out_path, xlabel="Input", ylabel="Output"):
         if not dc_data or not dc_data["x"] or not dc_data["y"]:
             return
@@ -1644,7 +1625,9 @@ class SimulationAgent(BaseAgent):
                 text = f.read()
         except Exception:
             return {}
+        return self._extract_device_metrics_from_text(text)
 
+    def _extract_device_metrics_from_text(self, text):
         metrics = {}
         pattern = re.compile(
             r"@(?P<device>[a-z0-9_]+)\[(?P<metric>[a-z0-9_]+)\]\s*=\s*(?P<value>[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)",
@@ -5,6 +5,7 @@ from agents.base_agent import BaseAgent
 from agents.design_status import DesignStatus
 from core.shared_memory import SharedMemory
 from core.topology_aliases import canonical_topology_key
+from llm.response_cache import consume_cache_activity
 
 
 @dataclass
@@ -47,7 +48,7 @@ class SizingAgent(BaseAgent):
         return sizing
 
     def run_agent(self, memory: SharedMemory):
-        state = memory.get_full_state()
+        state = memory.working_state()
         constraints = state.get("constraints", {})
         topology = state.get("selected_topology")
         topology_plan = state.get("topology_plan") or {}
@@ -310,6 +311,7 @@ class SizingAgent(BaseAgent):
                     "agent": "SizingAgent",
                     "task": "composite_sizing_hints",
                     "ok": isinstance(result, dict),
+                    **consume_cache_activity(),
                 },
             )
         if not isinstance(result, dict):
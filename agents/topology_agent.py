@@ -5,8 +5,11 @@ import re
 from agents.base_agent import BaseAgent
 from agents.design_status import DesignStatus
 from core.shared_memory import SharedMemory
+from core.stage_reuse import record_stage_reuse
+from core.sweep_registry import strip_sweep_override_note
 from core.topology_library import TOPOLOGY_LIBRARY
 from core.analog_defaults import ANALOG_DEFAULTS
+from llm.response_cache import consume_cache_activity
 
 
 class TopologyAgent(BaseAgent):
@@ -20,9 +23,75 @@ class TopologyAgent(BaseAgent):
         "preamp",
         "driver stage",
     )
+    REUSED_STATE_KEYS = (
+        "selected_topology",
+        "selected_topologies",
+        "topology_plan",
+        "topology_metadata",
+        "topology_confidence",
+        "topology_reasoning",
+        "topology_reference_summary",
+    )
+
+    def __init__(self, llm=None, reference_catalog=None, max_retries=1, wait=0, stage_cache=None):
+        super().__init__(llm=llm, reference_catalog=reference_catalog, max_retries=max_retries, wait=wait)
+        self.stage_cache = stage_cache
 
     def run_agent(self, memory: SharedMemory):
-        spec_text = (memory.read("specification") or "").strip()
+        if self.stage_cache is None:
+            return self._select_topology(memory)
+        key = self.stage_cache.key("topology", self.dependency_inputs(memory))
+        cached = self.stage_cache.get("topology", key)
+        if cached is not None:
+            return self._replay_selection(memory, cached, key)
+        result = self._select_topology(memory)
+        if memory.read("status") == DesignStatus.TOPOLOGY_SELECTED:
+            self.stage_cache.put(
+                "topology",
+                key,
+                {"state": {name: memory.read(name) for name in self.REUSED_STATE_KEYS}, "result": result},
+            )
+        record_stage_reuse(memory, "topology", reused=False, key=key)
+        return result
+
+    def dependency_inputs(self, memory: SharedMemory) -> dict:
+        """Stage-reuse key: what topology selection reads, minus sweep-override notes in the specification."""
+        constraints = self._merged_defaults(memory.read("constraints") or {})
+        case_meta = memory.read("case_metadata") or {}
+        forced_topology = case_meta.get("forced_topology") or constraints.get("forced_topology")
+        # A forced single topology only reads the stage lists; selection reads every constraint.
+        if forced_topology in TOPOLOGY_LIBRARY and forced_topology != "composite_pipeline":
+            used = {key: constraints.get(key) for key in ("stage_topologies", "stage_constraints")}
+        else:
+            used = constraints
+        return {
+            "specification": strip_sweep_override_note((memory.read("specification") or "").strip()),
+            "forced_topology": forced_topology,
+            "constraints": used,
+            "llm": type(self.llm).__name__ if self.llm is not None else None,
+        }
+
+    def _replay_selection(self, memory: SharedMemory, cached: dict, key: str):
+        state = cached.get("state") or {}
+        for name in self.REUSED_STATE_KEYS:
+            memory.write(name, state.get(name))
+        memory.write("status", DesignStatus.TOPOLOGY_SELECTED)
+        memory.append_history(
+            "topology_selected",
+            {
+                "topology": state.get("selected_topology"),
+                "selected_topologies": state.get("selected_topologies"),
+                "plan_mode": (state.get("topology_plan") or {}).get("mode"),
+                "reused": True,
+            },
+        )
+        hit_ids = [item.get("id") for item in (state.get("topology_reference_summary") or {}).get("used") or []]
+        record_stage_reuse(memory, "topology", reused=True, key=key, detail={"hit_ids": hit_ids})
+        return cached.get("result")
+
+    def _select_topology(self, memory: SharedMemory):
+        # Selection must read exactly what dependency_inputs keys on, so drop sweep-override notes here too.
+        spec_text = strip_sweep_override_note((memory.read("specification") or "").strip())
         spec = spec_text.lower()
         constraints = self._merged_defaults(memory.read("constraints") or {})
         case_meta = memory.read("case_metadata") or {}
@@ -613,6 +682,7 @@ class TopologyAgent(BaseAgent):
                     "agent": "TopologyAgent",
                     "task": "topology_selection",
                     "ok": isinstance(result, dict),
+                    **consume_cache_activity(),
                 },
             )
 
@@ -667,6 +737,7 @@ class TopologyAgent(BaseAgent):
                     "agent": "TopologyAgent",
                     "task": "stage_plan",
                     "ok": isinstance(result, dict),
+                    **consume_cache_activity(),
                 },
             )
 
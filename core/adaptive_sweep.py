@@ -0,0 +1,192 @@
+# I13/core/adaptive_sweep.py
+
+import math
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Callable, List, Optional
+
+DEFAULT_COARSE_POINTS = 5
+DEFAULT_POINT_BUDGET = 25
+DEFAULT_TOLERANCE = 0.01
+DEFAULT_METRIC_JUMP = 0.25
+# Bounds spanning at least this ratio are gridded and bisected in log space.
+_LOG_SPAN_RATIO = 100.0
+
+
+def log_spaced(low: float, high: float) -> bool:
+    """Whether a positive range is wide enough to grid and bisect in log space."""
+    return low > 0 and high / low >= _LOG_SPAN_RATIO
+
+
+def adaptive_point_budget(default: int = DEFAULT_POINT_BUDGET) -> int:
+    return max(2, int(os.getenv("I13_ADAPTIVE_BUDGET", str(default))))
+
+
+@dataclass
+class SpecBoundary:
+    """A pair of neighbouring points whose sweep status differs after refinement."""
+
+    low: float
+    high: float
+    low_status: str
+    high_status: str
+    estimate: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class AdaptiveSweepResult:
+    rows: List[dict]
+    rounds: int
+    log_scale: bool
+    stop_reason: str
+    boundaries: List[SpecBoundary] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {
+            "points": len(self.rows),
+            "rounds": self.rounds,
+            "log_scale": self.log_scale,
+            "stop_reason": self.stop_reason,
+            "boundaries": [item.to_dict() for item in self.boundaries],
+        }
+
+
+class _Axis:
+    def __init__(self, low: float, high: float, log_scale: bool):
+        self.log_scale = log_scale
+        self._low = math.log10(low) if log_scale else low
+        self._high = math.log10(high) if log_scale else high
+
+    def grid(self, count: int) -> List[float]:
+        count = max(2, int(count))
+        step = (self._high - self._low) / (count - 1)
+        return [self._value(self._low + step * index) for index in range(count)]
+
+    def midpoint(self, a: float, b: float) -> float:
+        return self._value((self._coord(a) + self._coord(b)) / 2.0)
+
+    def width(self, a: float, b: float) -> float:
+        """Interval width as a fraction of the full sweep span (in the axis' own scale)."""
+        span = self._high - self._low
+        return abs(self._coord(b) - self._coord(a)) / span if span else 0.0
+
+    def _coord(self, value: float) -> float:
+        return math.log10(value) if self.log_scale else value
+
+    def _value(self, coord: float) -> float:
+        return float(f"{(10.0 ** coord) if self.log_scale else coord:.6g}")
+
+
+def _numeric(value) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def _interpolation_deviation(a: float, b: float, c: float, x: float) -> float:
+    """Relative miss of b (at x in [0, 1] between a and c) against linear and log interpolation."""
+    misses = [abs(b - (a + (c - a) * x)) / max(abs(b), abs(a + (c - a) * x), 1e-300)]
+    if a * b > 0 and b * c > 0:
+        predicted = math.copysign(math.exp(math.log(abs(a)) + (math.log(abs(c)) - math.log(abs(a))) * x), b)
+        misses.append(abs(b - predicted) / max(abs(b), abs(predicted)))
+    return min(misses)
+
+
+def _jump_intervals(ordered: List[dict], axis: "_Axis", value_key: str, metric_jump: float) -> List[tuple]:
+    # A point whose metric strays from what its neighbours predict marks a
+    # jump; refine the adjacent interval where the metric moves the most.
+    found = {}
+    for index in range(1, len(ordered) - 1):
+        left, middle, right = ordered[index - 1 : index + 2]
+        values = [_numeric(row.get("measured_result")) for row in (left, middle, right)]
+        if None in values:
+            continue
+        coords = [axis._coord(float(row[value_key])) for row in (left, middle, right)]
+        if coords[2] == coords[0]:
+            continue
+        deviation = _interpolation_deviation(*values, (coords[1] - coords[0]) / (coords[2] - coords[0]))
+        if deviation <= metric_jump:
+            continue
+        pair = (index - 1, index) if abs(values[1] - values[0]) >= abs(values[2] - values[1]) else (index, index + 1)
+        found[pair] = max(found.get(pair, 0.0), deviation)
+    return [(pair, deviation) for pair, deviation in found.items()]
+
+
+def adaptive_sweep(
+    evaluate: Callable[[List[float]], List[dict]],
+    low: float,
+    high: float,
+    coarse_points: int = DEFAULT_COARSE_POINTS,
+    max_points: int = DEFAULT_POINT_BUDGET,
+    tolerance: float = DEFAULT_TOLERANCE,
+    metric_jump: float = DEFAULT_METRIC_JUMP,
+    log_scale: Optional[bool] = None,
+    value_key: str = "requested_spec",
+) -> AdaptiveSweepResult:
+    """Grid [low, high] coarsely, then bisect pass/fail flips to tolerance before refining metric jumps."""
+    low, high = sorted((float(low), float(high)))
+    if log_scale is None:
+        log_scale = log_spaced(low, high)
+    axis = _Axis(low, high, log_scale)
+    max_points = max(2, int(max_points))
+
+    rows = []
+    seen = set()
+
+    def run_round(values, round_index):
+        values = [value for value in values if value not in seen]
+        seen.update(values)
+        for row in evaluate(values):
+            row["adaptive_round"] = round_index
+            rows.append(row)
+
+    run_round(axis.grid(min(coarse_points, max_points)), 0)
+    rounds = 1
+    stop_reason = "converged"
+    while True:
+        ordered = sorted(rows, key=lambda row: float(row[value_key]))
+        values = [float(row[value_key]) for row in ordered]
+
+        def midpoints_for(pairs):
+            chosen = []
+            for left, right in pairs:
+                a, b = values[left], values[right]
+                midpoint = axis.midpoint(a, b)
+                if axis.width(a, b) > tolerance and midpoint not in seen and a < midpoint < b and midpoint not in chosen:
+                    chosen.append(midpoint)
+            return chosen
+
+        # Pass/fail flips are bisected down to the tolerance (widest first)
+        # before any budget goes to metric jumps.
+        flips = [(index, index + 1) for index in range(len(ordered) - 1) if ordered[index].get("pass_fail") != ordered[index + 1].get("pass_fail")]
+        midpoints = midpoints_for(sorted(flips, key=lambda pair: -axis.width(values[pair[0]], values[pair[1]])))
+        if not midpoints:
+            jumps = sorted(_jump_intervals(ordered, axis, value_key, metric_jump), key=lambda item: -item[1])
+            midpoints = midpoints_for(pair for pair, _ in jumps)
+        if not midpoints:
+            break
+        remaining = max_points - len(rows)
+        if remaining <= 0:
+            stop_reason = "point_budget"
+            break
+        run_round(midpoints[:remaining], rounds)
+        rounds += 1
+
+    ordered = sorted(rows, key=lambda row: float(row[value_key]))
+    boundaries = [
+        SpecBoundary(
+            low=float(left[value_key]),
+            high=float(right[value_key]),
+            low_status=left.get("pass_fail"),
+            high_status=right.get("pass_fail"),
+            estimate=axis.midpoint(float(left[value_key]), float(right[value_key])),
+        )
+        for left, right in zip(ordered, ordered[1:])
+        if left.get("pass_fail") != right.get("pass_fail")
+    ]
+    return AdaptiveSweepResult(rows=ordered, rounds=rounds, log_scale=log_scale, stop_reason=stop_reason, boundaries=boundaries)
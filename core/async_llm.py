@@ -0,0 +1,176 @@
+# I13/core/async_llm.py
+
+import asyncio
+import os
+import threading
+from typing import Any
+
+from core.llm_interface import LLMInterface
+from llm.response_cache import begin_cache_activity, consume_cache_activity, merge_cache_activity
+
+
+DEFAULT_LLM_CONCURRENCY = 4
+
+
+class SharedEventLoop:
+    """One asyncio loop on a daemon thread, shared by every design run in the process."""
+
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="i13-llm-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro, timeout: float = None):
+        """Run a coroutine on the shared loop from any other thread and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop()).result(timeout)
+
+    def close(self):
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join(timeout=5)
+                self._loop.close()
+            self._loop = None
+            self._thread = None
+
+
+_SHARED_LOOP = SharedEventLoop()
+
+
+def shared_event_loop() -> SharedEventLoop:
+    return _SHARED_LOOP
+
+
+def resolve_llm_concurrency(value=None) -> int:
+    raw = value if value is not None else os.getenv("I13_LLM_CONCURRENCY", str(DEFAULT_LLM_CONCURRENCY))
+    try:
+        return max(1, int(str(raw).strip()))
+    except ValueError:
+        return DEFAULT_LLM_CONCURRENCY
+
+
+class BoundedAsyncLLM(LLMInterface):
+    """LLM wrapper that runs every call on one shared event loop with at most max_concurrency in flight."""
+
+    def __init__(self, llm: LLMInterface, max_concurrency: int = None, loop: SharedEventLoop = None):
+        self.llm = llm
+        self.max_concurrency = resolve_llm_concurrency(max_concurrency)
+        self._loop = loop or shared_event_loop()
+        self._semaphore = None
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def __getattr__(self, name):
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    async def agenerate(self, prompt: str) -> Any:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            with self._stats_lock:
+                self.calls += 1
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                return await self.llm.agenerate(prompt)
+            finally:
+                with self._stats_lock:
+                    self.in_flight -= 1
+
+    def generate(self, prompt: str) -> Any:
+        if self._loop.in_loop_thread():
+            raise RuntimeError("BoundedAsyncLLM.generate() called from the shared loop; await agenerate() instead.")
+        result, cache_activity = self._loop.run(self._agenerate_with_cache_activity(prompt))
+        # Response-cache hits/misses were counted inside the loop task; hand them to the calling agent.
+        merge_cache_activity(cache_activity)
+        return result
+
+    async def _agenerate_with_cache_activity(self, prompt: str):
+        # The task context is copied from the calling thread; count into a counter of its own.
+        begin_cache_activity(fresh=True)
+        result = await self.agenerate(prompt)
+        return result, consume_cache_activity()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "max_concurrency": self.max_concurrency,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+
+async def arun_with_shared_llm(func, items, llm: LLMInterface, max_concurrency: int = None, max_parallel_runs: int = None, on_result=None):
+    """Call func(item, client) on worker threads sharing one bounded LLM client; results follow items order."""
+    items = list(items)
+    client = llm if isinstance(llm, BoundedAsyncLLM) else BoundedAsyncLLM(llm, max_concurrency=max_concurrency)
+    runs = asyncio.Semaphore(max(1, int(max_parallel_runs or len(items) or 1)))
+
+    async def run_one(index, item):
+        async with runs:
+            result = await asyncio.to_thread(func, item, client)
+        # Runs on the caller's loop, so callbacks never race each other.
+        if on_result is not None:
+            on_result(index, result)
+        return result
+
+    return await asyncio.gather(*(run_one(index, item) for index, item in enumerate(items)))
+
+
+def run_with_shared_llm(func, items, llm: LLMInterface, max_concurrency: int = None, max_parallel_runs: int = None, on_result=None):
+    return asyncio.run(
+        arun_with_shared_llm(
+            func,
+            items,
+            llm,
+            max_concurrency=max_concurrency,
+            max_parallel_runs=max_parallel_runs,
+            on_result=on_result,
+        )
+    )
+
+
+async def arun_cases(case_names, llm: LLMInterface, max_concurrency: int = None, max_parallel_runs: int = None, runtime_options: dict = None):
+    """Run design cases concurrently against one bounded LLM client; results follow case_names order."""
+    from main import run_case
+
+    def run_one(case_name, client):
+        return run_case(case_name, llm_override=client, runtime_options=runtime_options)
+
+    return await arun_with_shared_llm(
+        run_one,
+        case_names,
+        llm,
+        max_concurrency=max_concurrency,
+        max_parallel_runs=max_parallel_runs,
+    )
+
+
+def run_cases_concurrently(case_names, llm: LLMInterface, max_concurrency: int = None, max_parallel_runs: int = None, runtime_options: dict = None):
+    return asyncio.run(
+        arun_cases(
+            case_names,
+            llm,
+            max_concurrency=max_concurrency,
+            max_parallel_runs=max_parallel_runs,
+            runtime_options=runtime_options,
+        )
+    )
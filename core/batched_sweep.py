@@ -0,0 +1,269 @@
+# I13/core/batched_sweep.py
+
+import os
+import re
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+from core.demo_catalog import get_demo_case
+from core.ngspice_backend import resolve_ngspice_backend
+from core.simulation_cache import (
+    SimulationCache,
+    included_sources,
+    ngspice_version,
+    simulation_cache_enabled,
+    simulation_cache_key,
+)
+from core.sweep_registry import get_case_sweep_schema
+from core.waveforms import add_rawfile_outputs, rawfile_outputs_enabled
+
+BATCHED_DECK_NAME = "batched.sp"
+_LOG_NAME = "ngspice.log"
+# Two-terminal passives whose value is the only thing `alter` needs to change.
+_PASSIVE_ELEMENT = re.compile(r"^([rlc]\w*)\s+(\S+)\s+(\S+)\s+(\S+)$", re.IGNORECASE)
+_OUTPUT_COMMAND = re.compile(r"^(wrdata|write)(\s+)(\S+?)(\.\w+)?(\s+.*)?$", re.IGNORECASE)
+_EXIT_COMMAND = re.compile(r"^(quit|exit)\b", re.IGNORECASE)
+_POINT_MARKER = "I13_BATCH_POINT"
+
+
+def batched_sweep_enabled() -> bool:
+    return os.getenv("I13_SWEEP_BATCHED", "0").strip() == "1"
+
+
+def batched_sweep_supported(case_name: str, sweep_param: str) -> bool:
+    schema = get_case_sweep_schema(case_name)
+    return bool(((schema.get("sweep_parameters") or {}).get(sweep_param) or {}).get("native_batch"))
+
+
+@dataclass
+class BatchedSweepResult:
+    status: str
+    points: int
+    seeded: int = 0
+    deck_path: Optional[str] = None
+    returncode: Optional[int] = None
+    simulation_time_s: float = 0.0
+    varied_elements: Tuple[str, ...] = ()
+    reason: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def design_point_netlist(case_name: str, case_override: dict, reference_catalog=None) -> Optional[str]:
+    """Netlist one sweep point with the deterministic agents, as the first attempt's generated.sp; None on failure."""
+    from agents.constraints_agent import ConstraintAgent
+    from agents.design_status import DesignStatus
+    from agents.netlist_agent import NetlistAgent
+    from agents.sizing_agent import SizingAgent
+    from agents.topology_agent import TopologyAgent
+    from core.reference_knowledge import load_reference_catalog, resolve_reference_paths
+    from core.shared_memory import SharedMemory
+
+    case = get_demo_case(case_name)
+    reference_catalog = reference_catalog or load_reference_catalog(resolve_reference_paths())
+    memory = SharedMemory()
+    memory.write("specification", case_override.get("specification") or case["specification"])
+    memory.write("constraints", {**(case.get("constraints") or {}), **(case_override.get("constraints") or {})})
+    memory.write(
+        "case_metadata",
+        {
+            "case_key": case.get("case_key"),
+            "display_name": case.get("display_name"),
+            "forced_topology": case.get("forced_topology"),
+            "demo_model": case.get("demo_model", "native"),
+            "readiness": case.get("readiness", "stable"),
+            "artifact_label": case_override.get("artifact_label") or case.get("artifact_label"),
+            "simulation_plan": case.get("simulation_plan", {}),
+        },
+    )
+    stages = (
+        (TopologyAgent(llm=None, reference_catalog=reference_catalog), DesignStatus.TOPOLOGY_SELECTED),
+        (SizingAgent(llm=None, reference_catalog=reference_catalog), DesignStatus.SIZING_COMPLETE),
+        (ConstraintAgent(reference_catalog=reference_catalog), DesignStatus.CONSTRAINTS_OK),
+        (NetlistAgent(llm=None, reference_catalog=reference_catalog), DesignStatus.NETLIST_GENERATED),
+    )
+    for agent, expected in stages:
+        agent.run_agent(memory)
+        if memory.read("status") != expected:
+            return None
+    netlist = memory.read("netlist")
+    return add_rawfile_outputs(netlist) if rawfile_outputs_enabled() else netlist
+
+
+def _split_netlist(netlist: str) -> Tuple[List[str], List[str]]:
+    circuit, control, in_control = [], [], False
+    for raw in (netlist or "").splitlines():
+        line = re.sub(r"\s+", " ", raw).strip()
+        if not line or line.startswith("*"):
+            continue
+        lower = line.lower()
+        if lower == ".control":
+            in_control = True
+        elif lower == ".endc":
+            in_control = False
+        elif lower == ".end":
+            continue
+        elif in_control:
+            control.append(line)
+        else:
+            circuit.append(line)
+    if not control:
+        raise ValueError("Netlist has no .control block to repeat per point")
+    return circuit, control
+
+
+def _point_outputs(control: List[str], index: int) -> Tuple[List[str], dict]:
+    lines, outputs = [], {}
+    for line in control:
+        if _EXIT_COMMAND.match(line):
+            continue
+        match = _OUTPUT_COMMAND.match(line)
+        if match:
+            stem, ext = match.group(3), match.group(4) or ""
+            batched_name = f"{stem}_p{index:03d}{ext}"
+            outputs[batched_name] = f"{stem}{ext}"
+            line = f"{match.group(1)}{match.group(2)}{batched_name}{match.group(5) or ''}"
+        lines.append(line)
+    return lines, outputs
+
+
+def build_batched_deck(netlists: List[str]) -> Tuple[str, List[dict], Tuple[str, ...]]:
+    """Fold netlists that differ only in R/L/C values into one deck of alter'd .control blocks."""
+    if not netlists:
+        raise ValueError("No sweep points to batch")
+    base_circuit, base_control = _split_netlist(netlists[0])
+    values = []
+    varied = []
+    for netlist in netlists:
+        circuit, control = _split_netlist(netlist)
+        if control != base_control or len(circuit) != len(base_circuit):
+            raise ValueError("Sweep points change the analyses or circuit structure, not just passive values")
+        point = {}
+        for base_line, line in zip(base_circuit, circuit):
+            if line == base_line:
+                continue
+            base_match, match = _PASSIVE_ELEMENT.match(base_line), _PASSIVE_ELEMENT.match(line)
+            if not base_match or not match or base_match.group(1, 2, 3) != match.group(1, 2, 3):
+                raise ValueError(f"Sweep points differ beyond a passive value: '{base_line}' vs '{line}'")
+            name = match.group(1)
+            if name not in varied:
+                varied.append(name)
+            point[name] = match.group(4)
+        values.append(point)
+
+    base_values = {}
+    for line in base_circuit:
+        match = _PASSIVE_ELEMENT.match(line)
+        if match and match.group(1) in varied:
+            base_values[match.group(1)] = match.group(4)
+
+    control_lines, outputs = [], []
+    for index, point in enumerate(values):
+        control_lines.append(f"echo {_POINT_MARKER} {index:03d} begin")
+        if index:
+            control_lines.append("destroy all")
+            control_lines.extend(f"alter {name} = {point.get(name, base_values[name])}" for name in varied)
+        lines, point_outputs = _point_outputs(base_control, index)
+        control_lines.extend(lines)
+        control_lines.append(f"echo {_POINT_MARKER} {index:03d} end")
+        outputs.append(point_outputs)
+    deck = "\n".join(
+        [f"* Batched sweep: {len(netlists)} points, varying {', '.join(varied) or 'nothing'}"]
+        + base_circuit
+        + [".control"]
+        + control_lines
+        + ["quit", ".endc", ".end"]
+    )
+    return deck + "\n", outputs, tuple(varied)
+
+
+def point_output_slice(text: str, index: int) -> str:
+    """The shared preamble of a batched log/stdout plus only point `index`'s block."""
+    lines = (text or "").splitlines()
+    marker = f"{_POINT_MARKER} {index:03d} "
+    begin = next((i for i, line in enumerate(lines) if marker + "begin" in line), None)
+    if begin is None:
+        return text or ""
+    end = next((i for i, line in enumerate(lines) if marker + "end" in line), len(lines))
+    first = next(i for i, line in enumerate(lines) if _POINT_MARKER in line)
+    return "\n".join(lines[:first] + lines[begin + 1 : end]) + "\n"
+
+
+def _point_stderr(stderr: str, log_text: str, index: int) -> str:
+    # stderr carries no markers; keep the lines the log places in this point's block.
+    if f"{_POINT_MARKER} {index:03d} begin" not in (log_text or ""):
+        return stderr or ""
+    own = set(point_output_slice(log_text, index).splitlines())
+    return "\n".join(line for line in (stderr or "").splitlines() if line in own)
+
+
+def run_batched_sweep(case_name: str, overrides: List[dict], work_dir: str, backend=None, cache: SimulationCache = None) -> BatchedSweepResult:
+    """Simulate every sweep point in one ngspice run and seed the simulation cache with each point's outputs."""
+    points = len(overrides)
+    if not simulation_cache_enabled():
+        return BatchedSweepResult("skipped", points, reason="I13_SIM_CACHE=0; batched results are handed over through the simulation cache")
+    backend = backend or resolve_ngspice_backend()
+    if backend is None:
+        return BatchedSweepResult("skipped", points, reason="ngspice not found")
+
+    netlists = [design_point_netlist(case_name, override) for override in overrides]
+    if any(netlist is None for netlist in netlists):
+        return BatchedSweepResult("skipped", points, reason="A sweep point could not be netlisted ahead of the run")
+    try:
+        deck, outputs, varied = build_batched_deck(netlists)
+    except ValueError as exc:
+        return BatchedSweepResult("skipped", points, reason=str(exc))
+
+    os.makedirs(work_dir, exist_ok=True)
+    deck_path = os.path.join(work_dir, BATCHED_DECK_NAME)
+    with open(deck_path, "w") as f:
+        f.write(deck)
+    start = time.perf_counter()
+    result = backend.run(BATCHED_DECK_NAME, cwd=work_dir, log_name=_LOG_NAME)
+    elapsed = time.perf_counter() - start
+    summary = BatchedSweepResult(
+        "failed",
+        points,
+        deck_path=deck_path,
+        returncode=result.returncode,
+        simulation_time_s=elapsed,
+        varied_elements=varied,
+    )
+    if result.returncode != 0:
+        summary.reason = "ngspice failed on the batched deck"
+        return summary
+
+    cache = cache or SimulationCache()
+    version = f"{ngspice_version(backend)}|log={_LOG_NAME}"
+    log_text = ""
+    if os.path.exists(result.log_path):
+        with open(result.log_path, "r", errors="replace") as handle:
+            log_text = handle.read()
+    for index, (netlist, point_outputs) in enumerate(zip(netlists, outputs)):
+        point_dir = os.path.join(work_dir, f"point_{index:03d}")
+        os.makedirs(point_dir, exist_ok=True)
+        included = included_sources(netlist, work_dir)
+        if included is None or not all(os.path.exists(os.path.join(work_dir, name)) for name in point_outputs):
+            continue
+        for batched_name, name in point_outputs.items():
+            shutil.copy2(os.path.join(work_dir, batched_name), os.path.join(point_dir, name))
+        # Each point only sees its own block, so one point's errors cannot
+        # mark its neighbours as convergence failures.
+        with open(os.path.join(point_dir, _LOG_NAME), "w") as handle:
+            handle.write(point_output_slice(log_text, index))
+        meta = {
+            "returncode": 0,
+            "stdout": point_output_slice(result.stdout, index),
+            "stderr": _point_stderr(result.stderr, log_text, index),
+            "backend": result.backend,
+        }
+        files = sorted(os.listdir(point_dir))
+        cache.store(simulation_cache_key(netlist, version, included), point_dir, files, meta)
+        summary.seeded += 1
+    summary.status = "seeded" if summary.seeded == points else "partial"
+    if summary.seeded < points:
+        summary.reason = f"{points - summary.seeded} point(s) produced no outputs and will simulate individually"
+    return summary
@@ -0,0 +1,166 @@
+# I13/core/design_space.py
+
+import csv
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from core.adaptive_sweep import log_spaced
+from core.sweep_registry import get_case_sweep_schema
+
+SAMPLING_METHODS = ("factorial", "lhs", "sobol")
+
+# Joe & Kuo primitive polynomials and initial direction numbers (dimensions 2-10);
+# dimension 1 is the van der Corput sequence.
+_SOBOL_DIRECTIONS = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+)
+_SOBOL_BITS = 30
+
+
+@dataclass(frozen=True)
+class ParameterRange:
+    name: str
+    low: float
+    high: float
+    log_scale: bool
+
+    @classmethod
+    def from_schema(cls, case_name: str, name: str, low: float = None, high: float = None) -> "ParameterRange":
+        meta = (get_case_sweep_schema(case_name).get("sweep_parameters") or {}).get(name)
+        if meta is None:
+            raise ValueError(f"Sweep parameter '{name}' is not declared for case '{case_name}'")
+        low = float(meta["min"] if low is None else low)
+        high = float(meta["max"] if high is None else high)
+        if low > high:
+            low, high = high, low
+        return cls(name, low, high, log_spaced(low, high))
+
+    def scale(self, unit: float) -> float:
+        """Map a unit-interval coordinate onto the range (log-uniform for wide ranges)."""
+        if self.log_scale:
+            value = 10.0 ** (math.log10(self.low) + unit * (math.log10(self.high) - math.log10(self.low)))
+        else:
+            value = self.low + unit * (self.high - self.low)
+        return float(f"{value:.6g}")
+
+
+def factorial_samples(dims: int, levels: int) -> List[List[float]]:
+    levels = max(2, int(levels))
+    axis = [index / (levels - 1) for index in range(levels)]
+    return [list(point) for point in itertools.product(axis, repeat=dims)]
+
+
+def latin_hypercube_samples(dims: int, count: int, seed: int = 0) -> List[List[float]]:
+    """One point per stratum along every axis, strata paired at random and jittered within."""
+    rng = random.Random(seed)
+    columns = []
+    for _ in range(dims):
+        strata = list(range(count))
+        rng.shuffle(strata)
+        columns.append([(stratum + rng.random()) / count for stratum in strata])
+    return [list(point) for point in zip(*columns)]
+
+
+def sobol_samples(dims: int, count: int) -> List[List[float]]:
+    """Unscrambled Sobol' points in gray-code order, starting at the origin."""
+    if dims > len(_SOBOL_DIRECTIONS) + 1:
+        raise ValueError(f"Sobol sampling supports at most {len(_SOBOL_DIRECTIONS) + 1} parameters")
+    directions = [[1 << (_SOBOL_BITS - bit) for bit in range(1, _SOBOL_BITS + 1)]]
+    for degree, poly, initial in _SOBOL_DIRECTIONS[: dims - 1]:
+        m = list(initial)
+        for k in range(degree, _SOBOL_BITS):
+            value = m[k - degree] ^ (m[k - degree] << degree)
+            for bit in range(1, degree):
+                if (poly >> (degree - 1 - bit)) & 1:
+                    value ^= m[k - bit] << bit
+            m.append(value)
+        directions.append([m[bit] << (_SOBOL_BITS - 1 - bit) for bit in range(_SOBOL_BITS)])
+
+    state = [0] * dims
+    points = [[0.0] * dims]
+    for index in range(1, count):
+        # The lowest zero bit of index - 1 (= lowest set bit of index) picks the direction number.
+        bit = (index & -index).bit_length() - 1
+        state = [value ^ directions[dim][bit] for dim, value in enumerate(state)]
+        points.append([value / (1 << _SOBOL_BITS) for value in state])
+    return points[:count]
+
+
+def sample_design_space(
+    ranges: Sequence[ParameterRange],
+    method: str = "factorial",
+    count: Optional[int] = None,
+    levels: int = 3,
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """One {parameter: value} dict per point: factorial `levels`-per-axis grid, or `count` lhs/sobol draws."""
+    dims = len(ranges)
+    if not dims:
+        raise ValueError("At least one parameter range is required")
+    if method == "factorial":
+        unit_points = factorial_samples(dims, levels)
+    elif method == "lhs":
+        unit_points = latin_hypercube_samples(dims, max(1, int(count or 16)), seed=seed)
+    elif method == "sobol":
+        unit_points = sobol_samples(dims, max(1, int(count or 16)))
+    else:
+        raise ValueError(f"Unknown sampling method '{method}'; choose from {', '.join(SAMPLING_METHODS)}")
+
+    samples, seen = [], set()
+    for unit in unit_points:
+        sample = {item.name: item.scale(coord) for item, coord in zip(ranges, unit)}
+        key = tuple(sample.values())
+        if key not in seen:
+            seen.add(key)
+            samples.append(sample)
+    return samples
+
+
+def write_columnar_table(path, rows: List[dict], columns: Sequence[str], numeric_columns: Sequence[str] = ()) -> dict:
+    """Write the grid as a column-selected CSV, plus typed Parquet when pyarrow is installed."""
+    path = str(path)
+    with open(path, "w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(columns), extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return {"csv": path, "parquet": None}
+    parquet_path = path.rsplit(".", 1)[0] + ".parquet"
+    table = pyarrow.table(
+        {column: _parquet_column(pyarrow, [row.get(column) for row in rows], column in numeric_columns) for column in columns}
+    )
+    pyarrow.parquet.write_table(table, parquet_path)
+    return {"csv": path, "parquet": parquet_path}
+
+
+def _parquet_column(pyarrow, values: list, numeric: bool = False):
+    # "" and None mark a missing measurement; numeric columns stay numeric
+    # (nulls for the gaps) and only genuinely textual columns become strings.
+    present = [value for value in values if value not in ("", None)]
+    numbers = all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present)
+    if present and numbers and not numeric and all(isinstance(value, int) for value in present):
+        return pyarrow.array([None if value in ("", None) else value for value in values], type=pyarrow.int64())
+    if numeric or (present and numbers):
+        return pyarrow.array([_float_or_none(value) for value in values], type=pyarrow.float64())
+    return pyarrow.array([None if value is None else str(value) for value in values], type=pyarrow.string())
+
+
+def _float_or_none(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
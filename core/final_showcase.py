@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 
 from core.demo_safe import summarize_sizing
+from core.shared_memory import iter_history
 
 
 FINAL_SHOWCASE_PRIMARY_COMMAND = "venv/bin/python3 main.py showcase"
@@ -103,7 +104,7 @@ def _topology_reasoning(final_state: dict) -> str:
 def _stage_status_summary(final_state: dict) -> list[dict]:
     counts = {}
     order = []
-    for item in final_state.get("history") or []:
+    for item in iter_history(final_state):
         if item.get("event") != "agent_executed":
             continue
         data = item.get("data") or {}
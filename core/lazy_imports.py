@@ -0,0 +1,167 @@
+# I13/core/lazy_imports.py
+
+import atexit
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+import time
+import types
+from typing import Dict, List, Optional
+
+
+# Optional dependencies that cost tens to hundreds of milliseconds to import and that most
+# CLI commands never touch. Import them through lazy_import()/optional_lazy_import() or
+# inside the function that needs them.
+HEAVY_MODULES = ("matplotlib", "lcapy", "openai", "gradio_client", "torch", "streamlit", "numpy")
+
+
+def import_profile_enabled() -> bool:
+    return os.getenv("I13_IMPORT_PROFILE", "0").strip() == "1"
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self):
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+_LAZY_MODULES: Dict[str, LazyModule] = {}
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy for module `name`; the import happens when an attribute is first used."""
+    if name not in _LAZY_MODULES:
+        _LAZY_MODULES[name] = LazyModule(name)
+    return _LAZY_MODULES[name]
+
+
+def module_available(name: str) -> bool:
+    """True if `name` can be imported, checked without importing it (only its parent packages)."""
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def optional_lazy_import(name: str) -> Optional[LazyModule]:
+    """lazy_import(name) when the module is installed, else None (the usual `np is None` fallback check)."""
+    return lazy_import(name) if module_available(name) else None
+
+
+# Not an importlib.abc subclass: importing importlib.abc would add to startup time.
+class ImportProfiler:
+    """Meta-path hook recording cumulative and self time of each first import, like -X importtime."""
+
+    def __init__(self):
+        self.records: List[dict] = []
+        self._stack: List[dict] = []
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            spec = importlib.util.find_spec(fullname)
+        except (ImportError, ValueError):
+            spec = None
+        finally:
+            self._local.busy = False
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return None
+        spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _enter(self, name: str) -> dict:
+        record = {"module": name, "start": time.perf_counter(), "children_s": 0.0, "depth": len(self._stack)}
+        self._stack.append(record)
+        return record
+
+    def _exit(self, record: dict) -> None:
+        elapsed = time.perf_counter() - record.pop("start")
+        if self._stack and self._stack[-1] is record:
+            self._stack.pop()
+        if self._stack:
+            self._stack[-1]["children_s"] += elapsed
+        record["cumulative_s"] = elapsed
+        record["self_s"] = max(0.0, elapsed - record.pop("children_s"))
+        self.records.append(record)
+
+    def report(self, top: int = 25) -> str:
+        total = sum(item["cumulative_s"] for item in self.records if item["depth"] == 0)
+        lines = [f"[ImportProfile] {len(self.records)} modules imported in {total * 1e3:.1f} ms (top-level cumulative)"]
+        lines.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for item in sorted(self.records, key=lambda entry: -entry["cumulative_s"])[:top]:
+            lines.append(
+                f"{item['cumulative_s'] * 1e3:14.2f} {item['self_s'] * 1e3:9.2f}  {'  ' * item['depth']}{item['module']}"
+            )
+        loaded = sorted(name for name in HEAVY_MODULES if name in sys.modules)
+        lines.append("[ImportProfile] heavy modules loaded: " + (", ".join(loaded) if loaded else "none"))
+        return "\n".join(lines)
+
+
+class _TimedLoader:
+    def __init__(self, loader, profiler: ImportProfiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        record = self._profiler._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(record)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+_PROFILER: Optional[ImportProfiler] = None
+
+
+def install_import_profiler(stream=None) -> ImportProfiler:
+    """Start timing imports and print the breakdown to stderr when the process exits."""
+    global _PROFILER
+    if _PROFILER is None:
+        _PROFILER = ImportProfiler()
+        sys.meta_path.insert(0, _PROFILER)
+        atexit.register(lambda: print(_PROFILER.report(), file=stream or sys.stderr))
+    return _PROFILER
+
+
+def install_import_profiler_from_env() -> Optional[ImportProfiler]:
+    return install_import_profiler() if import_profile_enabled() else None
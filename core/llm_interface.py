@@ -1,8 +1,13 @@
 # I13/core/llm_interface.py
 
+import asyncio
 from typing import Any
 
 
 class LLMInterface:
     def generate(self, prompt: str) -> Any:
         raise NotImplementedError
+
+    async def agenerate(self, prompt: str) -> Any:
+        """Async variant; backends without a native async client run generate() in a worker thread."""
+        return await asyncio.to_thread(self.generate, prompt)
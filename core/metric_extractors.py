@@ -1,10 +1,50 @@
+import functools
 import math
+import os
 import re
 
 
+_VECTOR_BACKEND = {}
+
+
+def _vector_backend():
+    """NumPy extractor module per I13_METRIC_BACKEND (auto/numpy/python), or None for the Python loops."""
+    mode = os.getenv("I13_METRIC_BACKEND", "auto").strip().lower() or "auto"
+    if mode == "python":
+        return None
+    if "module" not in _VECTOR_BACKEND:
+        try:
+            from core import metric_extractors_numpy
+        except ImportError:
+            metric_extractors_numpy = None
+        _VECTOR_BACKEND["module"] = metric_extractors_numpy
+    if _VECTOR_BACKEND["module"] is None and mode == "numpy":
+        raise RuntimeError("I13_METRIC_BACKEND=numpy but NumPy is not installed.")
+    return _VECTOR_BACKEND["module"]
+
+
+def _vectorized(func):
+    """Dispatch to the same-named NumPy extractor when available; func stays reachable as .python."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        backend = _vector_backend()
+        if backend is not None:
+            return getattr(backend, func.__name__)(*args, **kwargs)
+        return func(*args, **kwargs)
+
+    wrapper.python = func
+    return wrapper
+
+
+def _series_values(data, key):
+    values = (data or {}).get(key)
+    return [] if values is None else values
+
+
 def _series_xy(data):
-    xs = [float(value) for value in ((data or {}).get("x") or [])]
-    ys = [float(value) for value in ((data or {}).get("y") or [])]
+    xs = [float(value) for value in _series_values(data, "x")]
+    ys = [float(value) for value in _series_values(data, "y")]
     points = min(len(xs), len(ys))
     return xs[:points], ys[:points]
 
@@ -95,6 +135,15 @@ def _unwrap_phase_deg(phases):
     return unwrapped
 
 
+def _wrap_phase_margin(phase_at_unity):
+    while phase_at_unity > 0.0:
+        phase_at_unity -= 360.0
+    while phase_at_unity <= -360.0:
+        phase_at_unity += 360.0
+    return 180.0 + phase_at_unity
+
+
+@_vectorized
 def extract_phase_margin(ac_data, phase_data, input_ac_mag=1.0):
     xs_mag, gains, _ = _extract_gain_series(ac_data, input_ac_mag=input_ac_mag)
     xs_phase, phases = _series_xy(phase_data)
@@ -137,14 +186,10 @@ def extract_phase_margin(ac_data, phase_data, input_ac_mag=1.0):
 
     if phase_at_unity is None:
         return None
-
-    while phase_at_unity > 0.0:
-        phase_at_unity -= 360.0
-    while phase_at_unity <= -360.0:
-        phase_at_unity += 360.0
-    return 180.0 + phase_at_unity
+    return _wrap_phase_margin(phase_at_unity)
 
 
+@_vectorized
 def extract_ac_metrics(ac_data, input_ac_mag=1.0, phase_data=None):
     xs, gains, gains_db = _extract_gain_series(ac_data, input_ac_mag=input_ac_mag)
     metrics = {"sample_count": len(xs)}
@@ -186,7 +231,7 @@ def extract_ac_metrics(ac_data, input_ac_mag=1.0, phase_data=None):
             break
 
     if phase_data:
-        phase_margin = extract_phase_margin(
+        phase_margin = extract_phase_margin.python(
             ac_data=ac_data,
             phase_data=phase_data,
             input_ac_mag=input_ac_mag,
@@ -197,6 +242,7 @@ def extract_ac_metrics(ac_data, input_ac_mag=1.0, phase_data=None):
     return metrics
 
 
+@_vectorized
 def extract_dc_metrics(dc_data):
     xs, ys = _series_xy(dc_data)
     metrics = {"sample_count": len(xs)}
@@ -219,8 +265,9 @@ def extract_dc_metrics(dc_data):
     return metrics
 
 
+@_vectorized
 def extract_current_mirror_dc_metrics(dc_data, target_current_a=None, tolerance=0.10):
-    metrics = extract_dc_metrics(dc_data)
+    metrics = extract_dc_metrics.python(dc_data)
     xs, ys = _series_xy(dc_data)
     if not xs or not ys:
         return metrics
@@ -243,6 +290,7 @@ def extract_current_mirror_dc_metrics(dc_data, target_current_a=None, tolerance=
     return metrics
 
 
+@_vectorized
 def extract_line_regulation_metrics(dc_data):
     metrics = {}
     xs, ys = _series_xy(dc_data)
@@ -259,6 +307,7 @@ def extract_line_regulation_metrics(dc_data):
     return metrics
 
 
+@_vectorized
 def extract_transient_metrics(tran_out_data, tran_in_data=None, tran_outn_data=None):
     tx, vy = _series_xy(tran_out_data)
     metrics = {"sample_count": len(tx)}
@@ -302,11 +351,16 @@ def extract_transient_metrics(tran_out_data, tran_in_data=None, tran_outn_data=N
         else:
             metrics["fall_time_90_10_s"] = rise_interval
 
+    # Settled from the sample after the last excursion outside the band; a
+    # single reverse scan instead of re-checking every suffix.
     tol = max(abs(out_delta) * 0.02, 1e-6)
-    for idx in range(len(vy)):
-        if all(abs(value - out_final) <= tol for value in vy[idx:]):
-            metrics["settling_time_s"] = float(tx[idx]) - float(tx[0])
+    settle_idx = 0
+    for idx in range(len(vy) - 1, -1, -1):
+        if not abs(vy[idx] - out_final) <= tol:
+            settle_idx = idx + 1
             break
+    if settle_idx < len(vy):
+        metrics["settling_time_s"] = float(tx[settle_idx]) - float(tx[0])
 
     if abs(out_delta) > 1e-9:
         out_max = max(vy)
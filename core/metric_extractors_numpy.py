@@ -0,0 +1,265 @@
+# I13/core/metric_extractors_numpy.py
+# NumPy versions of the core.metric_extractors scans; results stay plain Python values.
+
+import math
+
+import numpy as np
+
+from core import metric_extractors as scalar
+
+
+def _series_xy(data):
+    xs = np.asarray(scalar._series_values(data, "x"), dtype=float).ravel()
+    ys = np.asarray(scalar._series_values(data, "y"), dtype=float).ravel()
+    points = min(xs.size, ys.size)
+    return xs[:points], ys[:points]
+
+
+def _first_index(mask):
+    if not mask.size:
+        return None
+    idx = int(np.argmax(mask))
+    return idx if mask[idx] else None
+
+
+def _first_level_crossing(ys, target):
+    """First idx >= 1 where the segment ys[idx-1] -> ys[idx] touches target (either direction)."""
+    prev, cur = ys[:-1], ys[1:]
+    mask = ((prev >= target) & (target >= cur)) | ((prev <= target) & (target <= cur))
+    found = _first_index(mask)
+    return None if found is None else found + 1
+
+
+def _interpolate_crossing(xs, ys, target, log_x):
+    idx = _first_level_crossing(ys, target)
+    if idx is None:
+        return None
+    return scalar._interpolate_x_for_target(xs[idx - 1], ys[idx - 1], xs[idx], ys[idx], target, log_x=log_x)
+
+
+def _crossing_time(xs, ys, target, rising=True):
+    if xs.size < 2 or ys.size < 2:
+        return None
+    prev, cur = ys[:-1], ys[1:]
+    if rising:
+        mask = (prev <= target) & (target <= cur)
+    else:
+        mask = (prev >= target) & (target >= cur)
+    found = _first_index(mask)
+    if found is None:
+        return None
+    idx = found + 1
+    return scalar._interpolate_x_for_target(xs[idx - 1], ys[idx - 1], xs[idx], ys[idx], target, log_x=False)
+
+
+def _extract_gain_series(ac_data, input_ac_mag=1.0):
+    xs, ys = _series_xy(ac_data)
+    if xs.size < 2 or ys.size < 2:
+        empty = np.empty(0)
+        return empty, empty, empty
+
+    input_ac_mag = max(float(input_ac_mag), 1e-20)
+    gains = np.maximum(np.abs(ys) / input_ac_mag, 1e-20)
+    return xs, gains, 20.0 * np.log10(gains)
+
+
+def extract_phase_margin(ac_data, phase_data, input_ac_mag=1.0):
+    xs_mag, gains, _ = _extract_gain_series(ac_data, input_ac_mag=input_ac_mag)
+    xs_phase, phases = _series_xy(phase_data)
+    if xs_mag.size < 3 or xs_phase.size < 3 or phases.size < 3:
+        return None
+
+    unity_hz = _interpolate_crossing(xs_mag, gains, 1.0, log_x=True)
+    if unity_hz is None:
+        return None
+
+    phases = np.unwrap(phases, period=360.0)
+    x1, x2 = xs_phase[:-1], xs_phase[1:]
+    found = _first_index(((x1 <= unity_hz) & (unity_hz <= x2)) | ((x2 <= unity_hz) & (unity_hz <= x1)))
+    if found is None:
+        return None
+    idx = found + 1
+    phase_at_unity = scalar._interpolate_y_for_x(
+        xs_phase[idx - 1],
+        phases[idx - 1],
+        xs_phase[idx],
+        phases[idx],
+        unity_hz,
+        log_x=True,
+    )
+    return scalar._wrap_phase_margin(phase_at_unity)
+
+
+def extract_ac_metrics(ac_data, input_ac_mag=1.0, phase_data=None):
+    xs, gains, gains_db = _extract_gain_series(ac_data, input_ac_mag=input_ac_mag)
+    metrics = {"sample_count": int(xs.size)}
+    if xs.size < 3 or gains.size < 3:
+        return metrics
+
+    peak_idx = int(np.argmax(gains_db))
+    metrics["gain_db"] = float(gains_db[0])
+    metrics["peak_gain_db"] = float(gains_db[peak_idx])
+    metrics["peak_frequency_hz"] = float(xs[peak_idx])
+
+    bandwidth = _interpolate_crossing(xs, gains, float(gains[0]) / math.sqrt(2.0), log_x=True)
+    if bandwidth is not None:
+        metrics["bandwidth_hz"] = bandwidth
+    ugbw = _interpolate_crossing(xs, gains, 1.0, log_x=True)
+    if ugbw is not None:
+        metrics["ugbw_hz"] = ugbw
+
+    if phase_data:
+        phase_margin = extract_phase_margin(
+            ac_data=ac_data,
+            phase_data=phase_data,
+            input_ac_mag=input_ac_mag,
+        )
+        if phase_margin is not None:
+            metrics["phase_margin_deg"] = phase_margin
+
+    return metrics
+
+
+def extract_dc_metrics(dc_data):
+    xs, ys = _series_xy(dc_data)
+    metrics = {"sample_count": int(xs.size)}
+    if not xs.size or not ys.size:
+        return metrics
+
+    out_min = float(ys.min())
+    out_max = float(ys.max())
+    steps = np.diff(ys)
+    metrics.update(
+        {
+            "sweep_start": float(xs[0]),
+            "sweep_stop": float(xs[-1]),
+            "sweep_span": float(xs[-1] - xs[0]),
+            "output_min_v": out_min,
+            "output_max_v": out_max,
+            "output_swing_v": out_max - out_min,
+            "output_midpoint_v": 0.5 * (out_max + out_min),
+            "monotonic_non_decreasing": bool(np.all(steps >= 0)),
+            "monotonic_non_increasing": bool(np.all(steps <= 0)),
+        }
+    )
+    return metrics
+
+
+def extract_current_mirror_dc_metrics(dc_data, target_current_a=None, tolerance=0.10):
+    metrics = extract_dc_metrics(dc_data)
+    xs, ys = _series_xy(dc_data)
+    if not xs.size or not ys.size:
+        return metrics
+
+    abs_currents = np.abs(ys)
+    metrics["iout_max_a"] = float(abs_currents.max())
+    metrics["iout_min_a"] = float(abs_currents.min())
+    metrics["iout_final_a"] = float(abs_currents[-1])
+
+    if target_current_a is None:
+        return metrics
+
+    target_current_a = abs(float(target_current_a))
+    lower_bound = max(target_current_a * (1.0 - float(tolerance)), 0.0)
+    idx = _first_index(abs_currents >= lower_bound)
+    if idx is not None:
+        metrics["compliance_voltage_v"] = float(xs[idx])
+        metrics["iout_at_compliance_a"] = float(abs_currents[idx])
+    return metrics
+
+
+def extract_line_regulation_metrics(dc_data):
+    metrics = {}
+    xs, ys = _series_xy(dc_data)
+    if xs.size < 2 or ys.size < 2:
+        return metrics
+
+    dvin = float(xs[-1] - xs[0])
+    if abs(dvin) < 1e-30:
+        return metrics
+
+    dvout = float(ys[-1] - ys[0])
+    metrics["line_regulation_v_per_v"] = dvout / dvin
+    metrics["line_regulation_mv_per_v"] = 1000.0 * metrics["line_regulation_v_per_v"]
+    return metrics
+
+
+def extract_transient_metrics(tran_out_data, tran_in_data=None, tran_outn_data=None):
+    tx, vy = _series_xy(tran_out_data)
+    metrics = {"sample_count": int(tx.size)}
+    if tx.size < 3 or vy.size < 3:
+        return metrics
+
+    out_min = float(vy.min())
+    out_max = float(vy.max())
+    metrics["output_min_v"] = out_min
+    metrics["output_max_v"] = out_max
+    metrics["output_swing_v"] = out_max - out_min
+    metrics["output_final_v"] = float(vy[-1])
+
+    edge = max(3, vy.size // 20)
+    out_initial = float(vy[:edge].sum()) / edge
+    out_final = float(vy[-edge:].sum()) / edge
+    out_delta = out_final - out_initial
+    metrics["out_initial_v"] = out_initial
+    metrics["out_final_v"] = out_final
+    metrics["out_step_v"] = out_delta
+
+    if tran_in_data:
+        _, in_y = _series_xy(tran_in_data)
+        if in_y.size >= edge:
+            in_initial = float(in_y[:edge].sum()) / edge
+            in_final = float(in_y[-edge:].sum()) / edge
+            in_delta = in_final - in_initial
+            metrics["in_initial_v"] = in_initial
+            metrics["in_final_v"] = in_final
+            metrics["in_step_v"] = in_delta
+            if abs(in_delta) > 1e-12:
+                transient_gain = out_delta / in_delta
+                metrics["transient_gain_vv"] = transient_gain
+                metrics["transient_gain_db"] = 20.0 * math.log10(max(abs(transient_gain), 1e-20))
+
+    direction_rising = out_delta >= 0
+    t10 = _crossing_time(tx, vy, out_initial + 0.10 * out_delta, rising=direction_rising)
+    t90 = _crossing_time(tx, vy, out_initial + 0.90 * out_delta, rising=direction_rising)
+    if t10 is not None and t90 is not None:
+        rise_interval = max(float(t90) - float(t10), 0.0)
+        if direction_rising:
+            metrics["rise_time_10_90_s"] = rise_interval
+        else:
+            metrics["fall_time_90_10_s"] = rise_interval
+
+    tol = max(abs(out_delta) * 0.02, 1e-6)
+    outside = ~(np.abs(vy - out_final) <= tol)
+    last_outside = _first_index(outside[::-1])
+    settle_idx = 0 if last_outside is None else vy.size - last_outside
+    if settle_idx < vy.size:
+        metrics["settling_time_s"] = float(tx[settle_idx] - tx[0])
+
+    if abs(out_delta) > 1e-9:
+        if direction_rising:
+            metrics["overshoot_pct"] = max(0.0, (out_max - out_final) / abs(out_delta) * 100.0)
+            metrics["undershoot_pct"] = max(0.0, (out_initial - out_min) / abs(out_delta) * 100.0)
+        else:
+            metrics["overshoot_pct"] = max(0.0, (out_final - out_min) / abs(out_delta) * 100.0)
+            metrics["undershoot_pct"] = max(0.0, (out_max - out_initial) / abs(out_delta) * 100.0)
+
+    dt = np.diff(tx)
+    forward = dt > 0
+    if np.any(forward):
+        max_slew = float((np.abs(np.diff(vy))[forward] / dt[forward]).max())
+        metrics["max_slew_v_per_s"] = max_slew
+        metrics["max_slew_v_per_us"] = max_slew / 1e6
+
+    if tran_outn_data:
+        _, outn = _series_xy(tran_outn_data)
+        samples = min(vy.size, outn.size)
+        if samples:
+            cm_series = (vy[:samples] + outn[:samples]) / 2.0
+            diff_series = vy[:samples] - outn[:samples]
+            metrics["common_mode_final_v"] = float(cm_series[-1])
+            metrics["common_mode_range_v"] = float(cm_series.max() - cm_series.min())
+            metrics["differential_final_v"] = float(diff_series[-1])
+            metrics["differential_swing_v"] = float(diff_series.max() - diff_series.min())
+
+    return metrics
@@ -0,0 +1,375 @@
+# I13/core/ngspice_backend.py
+
+import ctypes
+import ctypes.util
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.stage_timing import record_subprocess_time
+
+
+NGSPICE_EXECUTABLE_CANDIDATES = (
+    "/opt/homebrew/bin/ngspice",
+    "/usr/local/bin/ngspice",
+)
+NGSPICE_LIBRARY_CANDIDATES = (
+    "/opt/homebrew/lib/libngspice.dylib",
+    "/usr/local/lib/libngspice.dylib",
+    "/usr/local/lib/libngspice.so",
+    "/usr/lib/libngspice.so",
+    "/usr/lib/x86_64-linux-gnu/libngspice.so.0",
+    "/usr/lib/aarch64-linux-gnu/libngspice.so.0",
+)
+
+# Control lines that write files; their first argument is rewritten to an
+# absolute path so the shared engine never depends on the process cwd.
+_FILE_WRITING_COMMAND = re.compile(r"^(\s*)(wrdata|wrs2p|write)(\s+)(\S+)(.*)$", re.IGNORECASE)
+_EXIT_COMMAND = re.compile(r"^\s*(quit|exit)\b.*$", re.IGNORECASE)
+_SET_COMMAND = re.compile(r"^\s*set\s+(.+)$", re.IGNORECASE)
+
+
+class NgspiceEngineExited(RuntimeError):
+    pass
+
+
+def deck_variables(netlist_text: str) -> List[str]:
+    """Names of the interpreter variables the deck `set`s (e.g. filetype, wr_singlescale)."""
+    names = []
+    for line in netlist_text.splitlines():
+        match = _SET_COMMAND.match(line)
+        if not match:
+            continue
+        for token in re.sub(r"\s*=\s*", "=", match.group(1)).split():
+            name = token.split("=", 1)[0]
+            if re.fullmatch(r"[A-Za-z_]\w*", name) and name not in names:
+                names.append(name)
+    return names
+
+
+def deck_output_files(netlist_text: str) -> List[str]:
+    """Targets of the deck's wrdata/wrs2p/write commands, in order (a bare `write` means rawspice.raw)."""
+    targets = []
+    for line in netlist_text.splitlines():
+        match = _FILE_WRITING_COMMAND.match(line)
+        if match:
+            targets.append(match.group(4))
+        elif line.strip().lower() == "write":
+            targets.append("rawspice.raw")
+    return targets
+
+
+def sanitize_for_shared_engine(netlist_text: str, out_dir: str) -> str:
+    """Drop quit/exit and make wrdata/write targets absolute for the in-process engine."""
+    out_dir = os.path.abspath(out_dir)
+    sanitized = []
+    for line in netlist_text.splitlines():
+        if _EXIT_COMMAND.match(line):
+            continue
+        match = _FILE_WRITING_COMMAND.match(line)
+        if match and not os.path.isabs(match.group(4)):
+            line = "".join(
+                (
+                    match.group(1),
+                    match.group(2),
+                    match.group(3),
+                    os.path.join(out_dir, match.group(4)),
+                    match.group(5),
+                )
+            )
+        sanitized.append(line)
+    return "\n".join(sanitized) + "\n"
+
+
+@dataclass
+class NgspiceRun:
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    log_path: str
+    backend: str
+    vectors: Dict[str, Dict[str, list]] = field(default_factory=dict)
+    cached: bool = False
+    cache_key: Optional[str] = None
+
+
+def find_ngspice_executable(configured: str = None) -> Optional[str]:
+    configured = configured or os.getenv("NGSPICE_PATH")
+    if configured and os.path.exists(configured):
+        return configured
+    for path in (shutil.which("ngspice"),) + NGSPICE_EXECUTABLE_CANDIDATES:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def find_ngspice_library(configured: str = None) -> Optional[str]:
+    configured = configured or os.getenv("NGSPICE_LIBRARY_PATH")
+    if configured:
+        return configured if os.path.exists(configured) else None
+    found = ctypes.util.find_library("ngspice")
+    if found:
+        return found
+    for path in NGSPICE_LIBRARY_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class SubprocessNgspice:
+    """One `ngspice -b` process per run (the original execution path)."""
+
+    name = "subprocess"
+
+    def __init__(self, executable: str):
+        self.path = executable
+
+    def run(self, netlist_path: str, cwd: str, log_name: str = "ngspice.log") -> NgspiceRun:
+        start = time.perf_counter()
+        result = subprocess.run(
+            [self.path, "-b", "-o", log_name, netlist_path],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+        )
+        record_subprocess_time(time.perf_counter() - start)
+        return NgspiceRun(
+            returncode=result.returncode,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            log_path=os.path.join(cwd, log_name),
+            backend=self.name,
+        )
+
+
+class _VectorInfo(ctypes.Structure):
+    _fields_ = [
+        ("v_name", ctypes.c_char_p),
+        ("v_type", ctypes.c_int),
+        ("v_flags", ctypes.c_short),
+        ("v_realdata", ctypes.POINTER(ctypes.c_double)),
+        ("v_compdata", ctypes.POINTER(ctypes.c_double)),
+        ("v_length", ctypes.c_int),
+    ]
+
+
+_SendChar = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p)
+_SendStat = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p)
+_ControlledExit = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.c_int, ctypes.c_bool, ctypes.c_bool, ctypes.c_int, ctypes.c_void_p
+)
+_SendData = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_void_p)
+_SendInitData = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p)
+_BGThreadRunning = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_bool, ctypes.c_int, ctypes.c_void_p)
+
+
+class SharedNgspice:
+    """Long-lived libngspice engine, loaded once per process and reused for every run."""
+
+    name = "shared"
+
+    def __init__(self, library_path: str):
+        self.path = library_path
+        self._lib = ctypes.CDLL(library_path)
+        self._lock = threading.Lock()
+        self._stdout: List[str] = []
+        self._stderr: List[str] = []
+        self._output: List[str] = []
+        self._exit_status: Optional[int] = None
+        self.exited = False
+        # Keep callback objects referenced for the lifetime of the engine.
+        self._callbacks = (
+            _SendChar(self._on_char),
+            _SendStat(lambda text, ident, user: 0),
+            _ControlledExit(self._on_exit),
+            _SendData(lambda data, count, ident, user: 0),
+            _SendInitData(lambda data, ident, user: 0),
+            _BGThreadRunning(lambda running, ident, user: 0),
+        )
+        self._lib.ngSpice_Init.argtypes = [
+            _SendChar,
+            _SendStat,
+            _ControlledExit,
+            _SendData,
+            _SendInitData,
+            _BGThreadRunning,
+            ctypes.c_void_p,
+        ]
+        self._lib.ngSpice_Command.argtypes = [ctypes.c_char_p]
+        self._lib.ngSpice_Command.restype = ctypes.c_int
+        self._lib.ngSpice_AllPlots.restype = ctypes.POINTER(ctypes.c_char_p)
+        self._lib.ngSpice_AllVecs.argtypes = [ctypes.c_char_p]
+        self._lib.ngSpice_AllVecs.restype = ctypes.POINTER(ctypes.c_char_p)
+        self._lib.ngGet_Vec_Info.argtypes = [ctypes.c_char_p]
+        self._lib.ngGet_Vec_Info.restype = ctypes.POINTER(_VectorInfo)
+        self._lib.ngSpice_Init(*self._callbacks, None)
+
+    def _on_char(self, text, ident, user):
+        line = (text or b"").decode(errors="replace")
+        # Arrival order is kept for the log so `echo` markers bracket errors too.
+        self._output.append(line.split(" ", 1)[1] if line.startswith(("stderr ", "stdout ")) else line)
+        if line.startswith("stderr "):
+            self._stderr.append(line[len("stderr "):])
+        else:
+            self._stdout.append(line[len("stdout "):] if line.startswith("stdout ") else line)
+        return 0
+
+    def _on_exit(self, status, immediate, quit_upon_exit, ident, user):
+        # After a controlled exit the library must not be driven again.
+        self._exit_status = int(status)
+        self.exited = True
+        return 0
+
+    def _command(self, command: str) -> int:
+        return int(self._lib.ngSpice_Command(command.encode()))
+
+    def _string_list(self, pointer) -> List[str]:
+        values = []
+        if not pointer:
+            return values
+        index = 0
+        while pointer[index]:
+            values.append(pointer[index].decode(errors="replace"))
+            index += 1
+        return values
+
+    def _collect_vectors(self) -> Dict[str, Dict[str, list]]:
+        plots = {}
+        for plot in self._string_list(self._lib.ngSpice_AllPlots()):
+            if plot == "const":
+                continue
+            vectors = {}
+            for name in self._string_list(self._lib.ngSpice_AllVecs(plot.encode())):
+                info = self._lib.ngGet_Vec_Info(f"{plot}.{name}".encode())
+                if not info:
+                    continue
+                vec = info.contents
+                length = int(vec.v_length)
+                if vec.v_realdata:
+                    vectors[name] = vec.v_realdata[:length]
+                elif vec.v_compdata:
+                    raw = vec.v_compdata[: 2 * length]
+                    vectors[name] = [complex(raw[idx], raw[idx + 1]) for idx in range(0, 2 * length, 2)]
+            plots[plot] = vectors
+        return plots
+
+    def run(self, netlist_path: str, cwd: str, log_name: str = "ngspice.log") -> NgspiceRun:
+        source_path = netlist_path if os.path.isabs(netlist_path) else os.path.join(cwd, netlist_path)
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        shared_path = os.path.join(os.path.dirname(os.path.abspath(source_path)), f".{stem}.shared.sp")
+        log_path = os.path.join(cwd, log_name)
+
+        with self._lock:
+            if self.exited:
+                raise NgspiceEngineExited(f"libngspice at {self.path} already exited")
+            self._stdout, self._stderr, self._output, self._exit_status = [], [], [], None
+            variables = []
+            try:
+                with open(source_path, "r") as handle:
+                    netlist_text = handle.read()
+                variables = deck_variables(netlist_text)
+                with open(shared_path, "w") as handle:
+                    handle.write(sanitize_for_shared_engine(netlist_text, cwd))
+                status = self._command(f"source {shared_path}")
+                if not self.exited:
+                    vectors = self._collect_vectors()
+            finally:
+                if not self.exited:
+                    # Options such as filetype=binary must not leak into the next deck.
+                    for name in variables:
+                        self._command(f"unset {name}")
+                    self._command("destroy all")
+                    self._command("remcirc")
+                if os.path.exists(shared_path):
+                    os.remove(shared_path)
+            if self.exited:
+                _forget_shared_engine(self)
+                raise NgspiceEngineExited(f"libngspice exited with status {self._exit_status} while running {source_path}")
+            stdout = "\n".join(self._stdout)
+            stderr = "\n".join(self._stderr)
+            output = "\n".join(self._output)
+
+        with open(log_path, "w") as handle:
+            handle.write(output + "\n")
+
+        return NgspiceRun(
+            returncode=1 if status else 0,
+            stdout=stdout,
+            stderr=stderr,
+            log_path=log_path,
+            backend=self.name,
+            vectors=vectors,
+        )
+
+
+class FallbackNgspice:
+    """Use the shared engine, rerunning a deck on the subprocess path when it fails or the engine exits."""
+
+    def __init__(self, primary: SharedNgspice, fallback: SubprocessNgspice):
+        self.primary = primary
+        self.fallback = fallback
+        self.name = primary.name
+        self.path = fallback.path
+
+    def run(self, netlist_path: str, cwd: str, log_name: str = "ngspice.log") -> NgspiceRun:
+        if not self.primary.exited:
+            try:
+                result = self.primary.run(netlist_path, cwd, log_name)
+            except Exception:
+                result = None
+            if result is not None and result.returncode == 0:
+                return result
+        return self.fallback.run(netlist_path, cwd, log_name)
+
+
+_SHARED_ENGINES: Dict[str, SharedNgspice] = {}
+_EXITED_LIBRARIES = set()
+_SHARED_ENGINE_LOCK = threading.Lock()
+
+
+def _forget_shared_engine(engine: SharedNgspice) -> None:
+    # The exited library stays loaded in this process, so it is never reused.
+    with _SHARED_ENGINE_LOCK:
+        _EXITED_LIBRARIES.add(engine.path)
+        if _SHARED_ENGINES.get(engine.path) is engine:
+            del _SHARED_ENGINES[engine.path]
+
+
+def _shared_engine(library_path: str) -> Optional[SharedNgspice]:
+    with _SHARED_ENGINE_LOCK:
+        if library_path in _EXITED_LIBRARIES:
+            return None
+        if library_path not in _SHARED_ENGINES:
+            try:
+                _SHARED_ENGINES[library_path] = SharedNgspice(library_path)
+            except Exception:
+                return None
+        return _SHARED_ENGINES[library_path]
+
+
+def configured_ngspice_backend() -> str:
+    raw = os.getenv("I13_NGSPICE_BACKEND", "auto").strip().lower()
+    aliases = {"batch": "subprocess", "process": "subprocess", "lib": "shared", "libngspice": "shared"}
+    return aliases.get(raw, raw) or "auto"
+
+
+def resolve_ngspice_backend(ngspice_path: str = None):
+    """Pick the simulator backend from I13_NGSPICE_BACKEND; None when no ngspice is available."""
+    mode = configured_ngspice_backend()
+    executable = find_ngspice_executable(ngspice_path)
+    subprocess_backend = SubprocessNgspice(executable) if executable else None
+    if mode == "subprocess":
+        return subprocess_backend
+
+    library = find_ngspice_library()
+    engine = _shared_engine(library) if library else None
+    if engine is None:
+        return None if mode == "shared" else subprocess_backend
+    if subprocess_backend is None or mode == "shared":
+        return engine
+    return FallbackNgspice(engine, subprocess_backend)
@@ -0,0 +1,40 @@
+# I13/core/parallel_executor.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def resolve_jobs(jobs=None, env_var: str = "I13_JOBS") -> int:
+    """Return a positive worker count from an explicit value or the environment."""
+    raw = jobs if jobs is not None else os.getenv(env_var, "1")
+    try:
+        value = int(str(raw).strip() or "1")
+    except ValueError:
+        value = 1
+    if value <= 0:
+        value = os.cpu_count() or 1
+    return max(1, value)
+
+
+def run_ordered(func, items, jobs=1, on_result=None):
+    """Run func over items, in a process pool when jobs > 1, returning results in input order."""
+    items = list(items)
+    jobs = max(1, min(int(jobs or 1), len(items) or 1))
+    results = [None] * len(items)
+
+    if jobs == 1:
+        for index, item in enumerate(items):
+            results[index] = func(item)
+            if on_result is not None:
+                on_result(index, results[index])
+        return results
+
+    # on_result runs in the parent as items finish; func and items must pickle.
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(func, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            index = futures[future]
+            results[index] = future.result()
+            if on_result is not None:
+                on_result(index, results[index])
+    return results
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple
 
+from core.ngspice_backend import configured_ngspice_backend, find_ngspice_executable, find_ngspice_library
 from core.runtime_backend import resolve_llm_backend
 
 MAC_TEXBIN = "/Library/TeX/texbin"
@@ -105,18 +106,16 @@ def _check_packages(resolution) -> PreflightCheck:
 
 
 def _check_ngspice() -> PreflightCheck:
-    candidates = [
-        os.getenv("NGSPICE_PATH", "").strip(),
-        shutil.which("ngspice"),
-        "/opt/homebrew/bin/ngspice",
-        "/usr/local/bin/ngspice",
-    ]
-    candidate = next((item for item in candidates if item and os.path.exists(item)), None)
-    if candidate:
+    candidate = find_ngspice_executable()
+    library = find_ngspice_library()
+    backend = configured_ngspice_backend()
+    if candidate or (library and backend != "subprocess"):
+        found = [f"ngspice at {candidate}" if candidate else "no ngspice executable"]
+        found.append(f"shared library at {library}" if library else "no libngspice shared library")
         return PreflightCheck(
             name="ngspice availability",
             status="PASS",
-            detail=f"Found ngspice at {candidate}.",
+            detail=f"Found {'; '.join(found)} (I13_NGSPICE_BACKEND={backend}).",
         )
     return PreflightCheck(
         name="ngspice availability",
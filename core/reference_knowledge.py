@@ -1,9 +1,14 @@
+import hashlib
 import json
+import math
 import os
+import pickle
 import re
-from collections import Counter
+import tempfile
+import threading
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
@@ -17,7 +22,39 @@ DEFAULT_REFERENCE_ROOTS = (
     "references/knowledge",
     "references/schemas",
 )
+# Ranking used by ReferenceCatalog.search when I13_REFERENCE_RANKING is unset: "legacy" or "bm25f".
+DEFAULT_REFERENCE_RANKING = "legacy"
+# BM25F per-field boosts; the relative weights follow the legacy scorer's field bonuses.
+REFERENCE_FIELD_BOOSTS = {
+    "topologies": 4.0,
+    "title": 3.0,
+    "tags": 2.5,
+    "summary": 1.75,
+    "body": 0.75,
+}
+BM25F_K1 = 1.2
+BM25F_B = 0.75
 SUPPORTED_EXTENSIONS = {".json", ".yaml", ".yml", ".md", ".markdown"}
+QUERY_CACHE_SIZE = 256
+DEFAULT_REFERENCE_CACHE_DIR = os.path.join("artifacts", "cache", "references")
+# Bump when ReferenceEntry, the index layout or record normalization changes.
+SNAPSHOT_FORMAT_VERSION = 2
+
+_FIELD_TITLE = 1
+_FIELD_SUMMARY = 2
+_FIELD_TEXT = 4
+# _score_entry matches query tokens as substrings. A token is made of [a-z0-9_] only, so it can only
+# occur inside one maximal run of those characters; indexing the runs reproduces the substring test.
+_WORD_RUN = re.compile(r"[a-z0-9_]+")
+
+
+@dataclass(frozen=True)
+class SearchFields:
+    title: str
+    summary: str
+    text: str
+    tags: frozenset
+    topologies: frozenset
 
 
 @dataclass(frozen=True)
@@ -69,6 +106,125 @@ class ReferenceEntry:
             chunks.append(json.dumps(self.data, sort_keys=True))
         return "\n".join(str(item) for item in chunks if item)
 
+    @cached_property
+    def search_fields(self) -> SearchFields:
+        """Lowercased fields used by scoring, computed once per entry instead of once per query."""
+        return SearchFields(
+            title=self.title.lower(),
+            summary=self.summary.lower(),
+            text=self.searchable_text().lower(),
+            tags=frozenset(tag.lower() for tag in self.tags),
+            topologies=frozenset(item.lower() for item in self.topologies),
+        )
+
+
+class _ReferenceIndex:
+    """Inverted index from word runs (and raw topology names) to entry positions."""
+
+    def __init__(self, entries: Sequence[ReferenceEntry]):
+        self.runs: Dict[str, Dict[int, int]] = {}
+        self.topologies: Dict[str, List[int]] = {}
+        for position, entry in enumerate(entries):
+            fields = entry.search_fields
+            for mask, text in ((_FIELD_TITLE, fields.title), (_FIELD_SUMMARY, fields.summary), (_FIELD_TEXT, fields.text)):
+                for run in set(_WORD_RUN.findall(text)):
+                    postings = self.runs.setdefault(run, {})
+                    postings[position] = postings.get(position, 0) | mask
+            for topology in set(entry.topologies):
+                self.topologies.setdefault(topology, []).append(position)
+        self._token_postings: Dict[str, Dict[int, int]] = {}
+
+    def postings(self, token: str) -> Dict[int, int]:
+        """Entry position -> bitmask of fields that contain token as a substring."""
+        cached = self._token_postings.get(token)
+        if cached is not None:
+            return cached
+        merged: Dict[int, int] = {}
+        for run, postings in self.runs.items():
+            if token in run:
+                for position, mask in postings.items():
+                    merged[position] = merged.get(position, 0) | mask
+        if len(self._token_postings) >= 4096:
+            self._token_postings.clear()
+        self._token_postings[token] = merged
+        return merged
+
+    def with_topologies(self, topologies: Iterable[str]) -> set:
+        positions = set()
+        for topology in topologies:
+            positions.update(self.topologies.get(topology, ()))
+        return positions
+
+
+class _BM25FIndex:
+    """Exact-token BM25F statistics: per-field term counts and lengths, document frequencies, postings."""
+
+    FIELDS = ("topologies", "title", "tags", "summary", "body")
+
+    def __init__(self, entries: Sequence[ReferenceEntry], field_boosts: Dict[str, float], k1: float = BM25F_K1, b: float = BM25F_B):
+        self.field_boosts = {name: float(field_boosts.get(name, 0.0)) for name in self.FIELDS}
+        self.k1 = k1
+        self.b = b
+        self.term_counts: List[Dict[str, Counter]] = []
+        self.lengths: List[Dict[str, int]] = []
+        self.postings: Dict[str, List[int]] = {}
+        totals = Counter()
+        for position, entry in enumerate(entries):
+            fields = {name: Counter(_tokenize(text)) for name, text in _bm25f_field_texts(entry).items()}
+            lengths = {name: sum(counts.values()) for name, counts in fields.items()}
+            totals.update(lengths)
+            self.term_counts.append(fields)
+            self.lengths.append(lengths)
+            for term in set().union(*fields.values()):
+                self.postings.setdefault(term, []).append(position)
+        count = max(1, len(entries))
+        self.average_lengths = {name: (totals[name] / count) or 1.0 for name in self.FIELDS}
+        self.idf = {
+            term: math.log(1.0 + (len(entries) - len(positions) + 0.5) / (len(positions) + 0.5))
+            for term, positions in self.postings.items()
+        }
+
+    def candidates(self, query_tokens: Sequence[str]) -> set:
+        positions = set()
+        for token in query_tokens:
+            positions.update(self.postings.get(token, ()))
+        return positions
+
+    def term_score(self, position: int, token: str) -> float:
+        idf = self.idf.get(token)
+        if idf is None:
+            return 0.0
+        counts = self.term_counts[position]
+        lengths = self.lengths[position]
+        weighted_tf = 0.0
+        for name, boost in self.field_boosts.items():
+            tf = counts[name].get(token, 0)
+            if not tf or not boost:
+                continue
+            norm = 1.0 - self.b + self.b * lengths[name] / self.average_lengths[name]
+            weighted_tf += boost * tf / norm
+        if not weighted_tf:
+            return 0.0
+        return idf * weighted_tf / (self.k1 + weighted_tf)
+
+
+def _bm25f_field_texts(entry: ReferenceEntry) -> Dict[str, str]:
+    body = [entry.ref_id, entry.schema, entry.content_type, entry.body, entry.vendor]
+    if entry.data:
+        body.append(json.dumps(entry.data, sort_keys=True))
+    return {
+        "topologies": " ".join(entry.topologies),
+        "title": entry.title,
+        "tags": " ".join(entry.tags),
+        "summary": entry.summary,
+        "body": "\n".join(str(item) for item in body if item),
+    }
+
+
+def resolve_reference_ranking(value: Optional[str] = None) -> str:
+    raw = (value or os.getenv("I13_REFERENCE_RANKING", DEFAULT_REFERENCE_RANKING)).strip().lower()
+    return raw if raw in {"legacy", "bm25f"} else DEFAULT_REFERENCE_RANKING
+
 
 class ReferenceCatalog:
     def __init__(
@@ -76,10 +232,25 @@ class ReferenceCatalog:
         entries: Optional[Sequence[ReferenceEntry]] = None,
         roots: Optional[Sequence[str]] = None,
         warnings: Optional[Sequence[str]] = None,
+        field_boosts: Optional[Dict[str, float]] = None,
     ):
         self.entries = list(entries or [])
         self.roots = list(roots or [])
         self.warnings = list(warnings or [])
+        self._index = _ReferenceIndex(self.entries)
+        self._bm25f = _BM25FIndex(self.entries, field_boosts or REFERENCE_FIELD_BOOSTS)
+        self._query_cache: "OrderedDict[tuple, List[Tuple[float, List[str], ReferenceEntry]]]" = OrderedDict()
+        self._query_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_query_lock", None)
+        state["_query_cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._query_lock = threading.Lock()
 
     @classmethod
     def from_paths(cls, paths: Sequence[str]) -> "ReferenceCatalog":
@@ -91,14 +262,7 @@ class ReferenceCatalog:
             if not root_path.exists():
                 warnings.append(f"Reference root not found: {root_path}")
                 continue
-            if root_path.is_file():
-                candidate_files = [root_path]
-            else:
-                candidate_files = sorted(
-                    path for path in root_path.rglob("*")
-                    if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
-                )
-            for file_path in candidate_files:
+            for file_path in _reference_files(root_path):
                 try:
                     entries.extend(_load_reference_file(file_path))
                 except Exception as exc:
@@ -127,23 +291,107 @@ class ReferenceCatalog:
         content_types: Optional[Sequence[str]] = None,
         vendor: Optional[str] = None,
         limit: int = 5,
+        ranking: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        filters = {
-            "topologies": {item for item in (topologies or []) if item},
-            "schemas": {item for item in (schemas or []) if item},
-            "content_types": {item for item in (content_types or []) if item},
-        }
+        ranking = resolve_reference_ranking(ranking)
+        cache_key = (
+            query,
+            tuple(topologies or ()),
+            tuple(schemas or ()),
+            tuple(content_types or ()),
+            vendor,
+            limit,
+            ranking,
+        )
+        with self._query_lock:
+            ranked = self._query_cache.get(cache_key)
+            if ranked is not None:
+                self._query_cache.move_to_end(cache_key)
+        if ranked is None:
+            rank = self._rank_bm25f if ranking == "bm25f" else self._rank
+            ranked = rank(query, topologies, schemas, content_types, vendor, limit)
+            with self._query_lock:
+                self._query_cache[cache_key] = ranked
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return [entry.to_summary(score=score, matched_terms=matched) for score, matched, entry in ranked]
+
+    def _rank(self, query, topologies, schemas, content_types, vendor, limit) -> List[Tuple[float, List[str], ReferenceEntry]]:
+        filters = _search_filters(topologies, schemas, content_types)
         query_tokens = _tokenize(query)
-        scored: List[Tuple[float, List[str], ReferenceEntry]] = []
 
-        for entry in self.entries:
-            if vendor and entry.vendor not in {vendor, "generic"}:
+        if filters["topologies"]:
+            candidates = self._index.with_topologies(filters["topologies"])
+        else:
+            candidates = set()
+            for token in query_tokens:
+                candidates.update(self._index.postings(token))
+
+        scored: List[Tuple[float, List[str], ReferenceEntry]] = []
+        for position in sorted(candidates):
+            entry = self.entries[position]
+            if not _passes_filters(entry, filters, vendor):
+                continue
+            field_masks = [self._index.postings(token).get(position, 0) for token in query_tokens]
+            score, matched_terms = _score_indexed(entry, query_tokens, field_masks, filters["topologies"])
+            if score <= 0.0:
                 continue
-            if filters["schemas"] and entry.schema not in filters["schemas"]:
+            scored.append((score, matched_terms, entry))
+
+        scored.sort(key=lambda item: (-item[0], item[2].title.lower(), item[2].ref_id))
+        return scored[: max(1, int(limit))]
+
+    def _rank_bm25f(self, query, topologies, schemas, content_types, vendor, limit) -> List[Tuple[float, List[str], ReferenceEntry]]:
+        filters = _search_filters(topologies, schemas, content_types)
+        query_tokens = _tokenize(query)
+        if filters["topologies"]:
+            candidates = self._index.with_topologies(filters["topologies"])
+        else:
+            candidates = self._bm25f.candidates(query_tokens)
+
+        topology_boost = self._bm25f.field_boosts["topologies"]
+        scored: List[Tuple[float, List[str], ReferenceEntry]] = []
+        for position in sorted(candidates):
+            entry = self.entries[position]
+            if not _passes_filters(entry, filters, vendor):
                 continue
-            if filters["content_types"] and entry.content_type not in filters["content_types"]:
+            score = 0.0
+            matched_terms: List[str] = []
+            # Topology filters act as in the legacy scorer: a hard filter plus a fixed bonus per match.
+            for topology in filters["topologies"]:
+                topo = topology.lower()
+                if topo in entry.search_fields.topologies:
+                    score += topology_boost
+                    matched_terms.append(f"topology:{topo}")
+            for token in query_tokens:
+                token_score = self._bm25f.term_score(position, token)
+                if token_score > 0.0:
+                    score += token_score
+                    matched_terms.append(token)
+            if score <= 0.0:
                 continue
-            if filters["topologies"] and not (filters["topologies"] & set(entry.topologies)):
+            scored.append((score, matched_terms[:12], entry))
+
+        scored.sort(key=lambda item: (-item[0], item[2].title.lower(), item[2].ref_id))
+        return scored[: max(1, int(limit))]
+
+    def _search_linear(
+        self,
+        query: str = "",
+        *,
+        topologies: Optional[Sequence[str]] = None,
+        schemas: Optional[Sequence[str]] = None,
+        content_types: Optional[Sequence[str]] = None,
+        vendor: Optional[str] = None,
+        limit: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Reference implementation of search(): score every entry with _score_entry."""
+        filters = _search_filters(topologies, schemas, content_types)
+        query_tokens = _tokenize(query)
+        scored: List[Tuple[float, List[str], ReferenceEntry]] = []
+
+        for entry in self.entries:
+            if not _passes_filters(entry, filters, vendor):
                 continue
 
             score, matched_terms = _score_entry(entry, query_tokens, filters["topologies"])
@@ -157,10 +405,87 @@ class ReferenceCatalog:
         return [entry.to_summary(score=score, matched_terms=matched) for score, matched, entry in scored[: max(1, int(limit))]]
 
 
+def _search_filters(topologies, schemas, content_types) -> Dict[str, set]:
+    return {
+        "topologies": {item for item in (topologies or []) if item},
+        "schemas": {item for item in (schemas or []) if item},
+        "content_types": {item for item in (content_types or []) if item},
+    }
+
+
+def _passes_filters(entry: ReferenceEntry, filters: Dict[str, set], vendor: Optional[str]) -> bool:
+    if vendor and entry.vendor not in {vendor, "generic"}:
+        return False
+    if filters["schemas"] and entry.schema not in filters["schemas"]:
+        return False
+    if filters["content_types"] and entry.content_type not in filters["content_types"]:
+        return False
+    if filters["topologies"] and not (filters["topologies"] & set(entry.topologies)):
+        return False
+    return True
+
+
 @lru_cache(maxsize=8)
 def load_reference_catalog(paths_key: Optional[Tuple[str, ...]] = None) -> ReferenceCatalog:
     paths = list(paths_key or resolve_reference_paths())
-    return ReferenceCatalog.from_paths(paths)
+    if os.getenv("I13_REFERENCE_CACHE", "1").strip() != "1":
+        return ReferenceCatalog.from_paths(paths)
+    return load_catalog_snapshot(paths)
+
+
+def _reference_files(root_path: Path) -> List[Path]:
+    if root_path.is_file():
+        return [root_path]
+    return sorted(
+        path for path in root_path.rglob("*")
+        if path.is_file() and path.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
+
+def catalog_fingerprint(paths: Sequence[str]) -> str:
+    """Hash of every reference file's path, size and mtime, plus anything else that changes parsing."""
+    digest = hashlib.sha256()
+    digest.update(f"v{SNAPSHOT_FORMAT_VERSION}|yaml={yaml is not None}".encode())
+    for root in paths:
+        root_path = Path(root)
+        digest.update(f"\nroot:{root_path}".encode())
+        if not root_path.exists():
+            digest.update(b":missing")
+            continue
+        for file_path in _reference_files(root_path):
+            stat = file_path.stat()
+            digest.update(f"\n{file_path}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def load_catalog_snapshot(paths: Sequence[str], cache_dir: Optional[str] = None) -> ReferenceCatalog:
+    """Load the catalog (entries plus search index) from a pickled snapshot unless a reference file changed."""
+    cache_dir = cache_dir or os.getenv("I13_REFERENCE_CACHE_DIR", DEFAULT_REFERENCE_CACHE_DIR)
+    normalized_roots = [str(Path(path)) for path in paths]
+    roots_key = hashlib.sha256("\n".join(normalized_roots).encode()).hexdigest()[:16]
+    snapshot_path = os.path.join(cache_dir, f"catalog-{roots_key}.pickle")
+    fingerprint = catalog_fingerprint(normalized_roots)
+
+    try:
+        with open(snapshot_path, "rb") as handle:
+            snapshot = pickle.load(handle)
+        if snapshot.get("fingerprint") == fingerprint:
+            return snapshot["catalog"]
+    except Exception:
+        pass
+
+    catalog = ReferenceCatalog.from_paths(normalized_roots)
+    staging = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=".catalog-", dir=cache_dir)
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump({"fingerprint": fingerprint, "catalog": catalog}, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(staging, snapshot_path)
+    except Exception:
+        if staging and os.path.exists(staging):
+            os.remove(staging)
+    return catalog
 
 
 def resolve_reference_paths(paths: Optional[Sequence[str]] = None) -> Tuple[str, ...]:
@@ -328,11 +653,29 @@ def _tokenize(text: str) -> List[str]:
 
 
 def _score_entry(entry: ReferenceEntry, query_tokens: Sequence[str], topology_filters: Sequence[str]) -> Tuple[float, List[str]]:
-    searchable = entry.searchable_text().lower()
-    title_text = entry.title.lower()
-    summary_text = entry.summary.lower()
-    tags = {tag.lower() for tag in entry.tags}
-    topologies = {item.lower() for item in entry.topologies}
+    fields = entry.search_fields
+    field_masks = []
+    for token in query_tokens:
+        mask = 0
+        if token in fields.title:
+            mask |= _FIELD_TITLE
+        if token in fields.summary:
+            mask |= _FIELD_SUMMARY
+        if token in fields.text:
+            mask |= _FIELD_TEXT
+        field_masks.append(mask)
+    return _score_indexed(entry, query_tokens, field_masks, topology_filters)
+
+
+def _score_indexed(
+    entry: ReferenceEntry,
+    query_tokens: Sequence[str],
+    field_masks: Sequence[int],
+    topology_filters: Sequence[str],
+) -> Tuple[float, List[str]]:
+    fields = entry.search_fields
+    tags = fields.tags
+    topologies = fields.topologies
 
     score = 0.0
     matched_terms: List[str] = []
@@ -343,17 +686,17 @@ def _score_entry(entry: ReferenceEntry, query_tokens: Sequence[str], topology_fi
             score += 4.0
             matched_terms.append(f"topology:{topo}")
 
-    for token in query_tokens:
+    for token, mask in zip(query_tokens, field_masks):
         token_score = 0.0
         if token in topologies:
             token_score += 4.0
         if token in tags:
             token_score += 2.5
-        if token in title_text:
+        if mask & _FIELD_TITLE:
             token_score += 3.0
-        elif token in summary_text:
+        elif mask & _FIELD_SUMMARY:
             token_score += 1.75
-        elif token in searchable:
+        elif mask & _FIELD_TEXT:
             token_score += 0.75
         if token_score > 0.0:
             score += token_score
@@ -0,0 +1,73 @@
+# I13/core/run_journal.py
+
+import json
+import os
+from typing import Dict, Optional
+
+JOURNAL_FILENAME = "journal.jsonl"
+
+
+class RunJournal:
+    """Append-only JSONL checkpoint of a long run: a config header, then one fsynced line per finished item."""
+
+    def __init__(self, directory: str):
+        self.directory = str(directory)
+        self.path = os.path.join(self.directory, JOURNAL_FILENAME)
+        self.completed: Dict[str, dict] = {}
+
+    @classmethod
+    def start(cls, directory: str, kind: str, config: dict) -> "RunJournal":
+        """Begin a fresh journal, discarding any earlier one in the directory."""
+        journal = cls(directory)
+        os.makedirs(journal.directory, exist_ok=True)
+        with open(journal.path, "w") as handle:
+            handle.write(json.dumps({"type": "run", "kind": kind, "config": config}, sort_keys=True, default=str) + "\n")
+        return journal
+
+    @classmethod
+    def resume(cls, directory: str, kind: str = None) -> "RunJournal":
+        """Reopen an existing journal with its completed entries loaded."""
+        journal = cls(directory)
+        header = journal.header()
+        if header is None:
+            raise FileNotFoundError(f"No run journal found at {journal.path}")
+        if kind is not None and header.get("kind") != kind:
+            raise ValueError(f"{journal.path} records a '{header.get('kind')}' run, not '{kind}'")
+        with open(journal.path, "rb+") as handle:
+            # Terminate a torn last line so the next record starts cleanly.
+            handle.seek(0, os.SEEK_END)
+            if handle.tell():
+                handle.seek(-1, os.SEEK_END)
+                if handle.read(1) != b"\n":
+                    handle.write(b"\n")
+        for entry in journal._entries():
+            if entry.get("type") == "point":
+                journal.completed[entry["key"]] = entry["result"]
+        return journal
+
+    def header(self) -> Optional[dict]:
+        for entry in self._entries():
+            return entry if entry.get("type") == "run" else None
+        return None
+
+    def record(self, key: str, result: dict) -> None:
+        line = json.dumps({"type": "point", "key": key, "result": result}, sort_keys=True, default=str)
+        with open(self.path, "a") as handle:
+            handle.write(line + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        self.completed[key] = result
+
+    def _entries(self):
+        try:
+            with open(self.path, "r") as handle:
+                lines = handle.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                yield entry
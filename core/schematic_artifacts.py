@@ -0,0 +1,198 @@
+# I13/core/schematic_artifacts.py
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Optional
+
+from core.verification_pipeline import attach_schematic_artifacts
+
+SCHEMATIC_RENDER_MODES = ("queue", "parallel", "inline")
+
+
+def schematic_render_mode() -> str:
+    """I13_SCHEMATIC_RENDER: queue (default, background), parallel (branch beside ngspice) or inline."""
+    mode = os.getenv("I13_SCHEMATIC_RENDER", "queue").strip().lower()
+    return mode if mode in SCHEMATIC_RENDER_MODES else "queue"
+
+
+def render_schematic_artifacts(netlist_path: str, base_dir: str, topology: str = None, sizing: dict = None, constraints: dict = None) -> dict:
+    """Render schematic.png/.svg for one saved netlist and return the `schematic_*` fields for simulation_results."""
+    png_path = os.path.join(base_dir, "schematic.png")
+    try:
+        from tools.netlist_to_schematic import generate_schematic
+
+        result = generate_schematic(
+            netlist_path,
+            png_path,
+            topology=topology,
+            sizing=sizing or {},
+            constraints=constraints or {},
+        )
+        metadata_path = os.path.join(base_dir, "schematic_metadata.json")
+        with open(metadata_path, "w") as f:
+            f.write(json.dumps(result, indent=2, sort_keys=True))
+        return {
+            "schematic_png_path": result.get("schematic_png_path"),
+            "schematic_svg_path": result.get("schematic_svg_path"),
+            "schematic_status": result.get("schematic_status", "failed"),
+            "schematic_failure_reason": result.get("schematic_failure_reason"),
+            "schematic_metadata_path": metadata_path,
+        }
+    except Exception as exc:
+        return failed_schematic_metadata(str(exc))
+
+
+def failed_schematic_metadata(reason: str) -> dict:
+    return {
+        "schematic_png_path": None,
+        "schematic_svg_path": None,
+        "schematic_status": "failed",
+        "schematic_failure_reason": reason,
+        "schematic_metadata_path": None,
+    }
+
+
+def pending_schematic_metadata() -> dict:
+    """Placeholder fields for a schematic that another branch or worker is still rendering."""
+    return {
+        "schematic_png_path": None,
+        "schematic_svg_path": None,
+        "schematic_status": "pending",
+        "schematic_failure_reason": None,
+        "schematic_metadata_path": None,
+    }
+
+
+def schematic_render_key(netlist: str, topology: str = None) -> str:
+    digest = hashlib.sha1()
+    digest.update((topology or "").encode("utf-8"))
+    digest.update(b"\n")
+    digest.update(netlist.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _outputs_exist(metadata: dict) -> bool:
+    if metadata.get("schematic_status") == "failed":
+        return True
+    return any(metadata.get(key) and os.path.exists(metadata[key]) for key in ("schematic_png_path", "schematic_svg_path"))
+
+
+class SchematicRenderQueue:
+    """Background schematic renderer shared by the process, deduplicated by netlist and topology hash."""
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max(1, int(max_workers))
+        self.renders = 0
+        self._executor = None
+        self._futures: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="i13-schematic")
+        return self._executor
+
+    def submit(self, netlist_path: str, base_dir: str, topology: str = None, sizing: dict = None, constraints: dict = None) -> str:
+        with open(netlist_path, "r") as f:
+            key = schematic_render_key(f.read(), topology)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and (not future.done() or _outputs_exist(future.result())):
+                return key
+            self._futures[key] = self._pool().submit(
+                render_schematic_artifacts,
+                netlist_path,
+                base_dir,
+                topology=topology,
+                sizing=dict(sizing or {}),
+                constraints=dict(constraints or {}),
+            )
+            self.renders += 1
+        return key
+
+    def result(self, key: str, timeout_s: Optional[float] = None) -> dict:
+        future = self._futures.get(key)
+        if future is None:
+            return failed_schematic_metadata("No schematic render was queued for this netlist")
+        try:
+            return dict(future.result(timeout=timeout_s))
+        except FutureTimeoutError:
+            return failed_schematic_metadata(f"Schematic render did not finish within {timeout_s}s")
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = sum(1 for future in self._futures.values() if not future.done())
+            return {"unique_netlists": len(self._futures), "renders": self.renders, "pending": pending}
+
+
+_DEFAULT_QUEUE = None
+_DEFAULT_QUEUE_LOCK = threading.Lock()
+
+
+def default_schematic_queue() -> SchematicRenderQueue:
+    global _DEFAULT_QUEUE
+    with _DEFAULT_QUEUE_LOCK:
+        if _DEFAULT_QUEUE is None:
+            _DEFAULT_QUEUE = SchematicRenderQueue(max_workers=int(os.getenv("I13_SCHEMATIC_WORKERS", "1")))
+        return _DEFAULT_QUEUE
+
+
+def _forget_default_queue_in_child():
+    # A forked worker inherits the queue object but not its render threads,
+    # so it would wait forever on renders nobody runs; start from scratch.
+    global _DEFAULT_QUEUE, _DEFAULT_QUEUE_LOCK
+    _DEFAULT_QUEUE = None
+    _DEFAULT_QUEUE_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_default_queue_in_child)
+
+
+def _attach_to_saved_attempt(attempt_dir: str, metadata: dict) -> None:
+    result_path = os.path.join(attempt_dir, "reports", "simulation_result.json")
+    if not os.path.exists(result_path):
+        return
+    with open(result_path, "r") as f:
+        sim = json.load(f)
+    attach_schematic_artifacts(sim, metadata)
+
+
+def _own_copies(metadata: dict, attempt_dir: str) -> dict:
+    # Deduplicated renders live in whichever attempt (possibly of an earlier run) queued them first.
+    metadata = dict(metadata)
+    for key in ("schematic_png_path", "schematic_svg_path", "schematic_metadata_path"):
+        path = metadata.get(key)
+        if not path or not os.path.exists(path):
+            continue
+        local_path = os.path.join(attempt_dir, os.path.basename(path))
+        if os.path.abspath(path) != os.path.abspath(local_path):
+            shutil.copy2(path, local_path)
+        metadata[key] = local_path
+    return metadata
+
+
+def complete_queued_schematics(memory, queue: SchematicRenderQueue = None, timeout_s: Optional[float] = None) -> list:
+    """Wait for the schematics this run queued and fold each into its attempt's results and bundle."""
+    requests = memory.read("schematic_requests") or []
+    if not requests:
+        return []
+    queue = queue or default_schematic_queue()
+    if timeout_s is None and os.getenv("I13_SCHEMATIC_WAIT_S"):
+        timeout_s = float(os.getenv("I13_SCHEMATIC_WAIT_S"))
+    completed = []
+    for request in requests:
+        metadata = _own_copies(queue.result(request["key"], timeout_s=timeout_s), request["attempt_dir"])
+        sim = memory.read("simulation_results") or {}
+        if request["attempt_dir"] == sim.get("artifact_dir"):
+            memory.write("simulation_results", attach_schematic_artifacts(dict(sim), metadata))
+        else:
+            _attach_to_saved_attempt(request["attempt_dir"], metadata)
+        completed.append({**request, "schematic_status": metadata.get("schematic_status")})
+    memory.append_history("schematics_completed", {"requests": completed, "queue": queue.stats()})
+    return completed
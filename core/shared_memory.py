@@ -1,12 +1,156 @@
 # I13/core/shared_memory.py
 
+import json
+import os
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
 from copy import deepcopy
 from agents.design_status import DesignStatus
 
+DEFAULT_HISTORY_LIMIT = 200
+
+
+class ReadOnlyMapping(Mapping):
+    """Read-only wrapper over a committed value; nested containers are wrapped on access."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return _read_only(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"ReadOnlyMapping({self._data!r})"
+
+    def to_dict(self):
+        return deepcopy(self._data)
+
+
+class ReadOnlySequence(Sequence):
+    """Read-only, fixed-length window over a list that may keep growing underneath."""
+
+    def __init__(self, data, length=None):
+        self._data = data
+        self._length = len(data) if length is None else length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_read_only(item) for item in self._data[: self._length][index]]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return _read_only(self._data[index])
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f"ReadOnlySequence(len={self._length})"
+
+    def to_list(self):
+        return deepcopy(self._data[: self._length])
+
+
+def _read_only(value):
+    if isinstance(value, dict):
+        return ReadOnlyMapping(value)
+    if isinstance(value, list):
+        return ReadOnlySequence(value)
+    return value
+
+
+class StateSnapshot(ReadOnlyMapping):
+    """Immutable view of the memory at one version, sharing the committed copies."""
+
+    def __init__(self, committed, history, version):
+        super().__init__(committed)
+        self._history = ReadOnlySequence(list(history))
+        self.version = version
+
+    def __getitem__(self, key):
+        if key == "history":
+            return self._history
+        return super().__getitem__(key)
+
+    def __iter__(self):
+        yield from self._data
+        yield "history"
+
+    def __len__(self):
+        return len(self._data) + 1
+
+
+class WorkingState(dict):
+    """Mutable agent state that deep-copies each value only on first access."""
+
+    def __init__(self, source: dict):
+        super().__init__()
+        self._source = source
+
+    def __missing__(self, key):
+        if key not in self._source:
+            raise KeyError(key)
+        value = deepcopy(self._source[key])
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._source
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class HistoryLog:
+    """Append-only JSONL log of every event of one run."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._handle = None
+
+    def append(self, entry: dict):
+        if self._handle is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._handle = open(self.path, "a", buffering=1)
+        self._handle.write(json.dumps(entry, default=str) + "\n")
+
+    def iter_events(self):
+        if self._handle is not None:
+            self._handle.flush()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def iter_history(final_state: dict):
+    """Iterate every history event of a finished run, preferring the full JSONL log."""
+    log_path = (final_state or {}).get("history_log_path")
+    if log_path and os.path.exists(log_path):
+        yield from HistoryLog(log_path).iter_events()
+        return
+    yield from (final_state or {}).get("history") or []
+
 
 class SharedMemory:
-    def __init__(self):
+    def __init__(self, history_log_path: str = None, history_limit: int = None):
         self.state = {
             "specification": None,
             "selected_topology": None,
@@ -28,12 +172,46 @@ class SharedMemory:
             "topology_confidence": None,
             "status": DesignStatus.INITIALIZED,
             "iteration": 0,
-            "history": []
+            "history": [],
+            "history_log_path": history_log_path,
+            "history_event_count": 0,
+        }
+        # Without a spill file the in-memory history is the only record, so it
+        # stays unbounded; with one, only the most recent events are kept.
+        self.history_log = HistoryLog(history_log_path) if history_log_path else None
+        if history_limit is None and self.history_log is not None:
+            history_limit = int(os.getenv("I13_HISTORY_LIMIT", str(DEFAULT_HISTORY_LIMIT)))
+        self.history_limit = max(1, int(history_limit)) if history_limit and self.history_log is not None else None
+        self.version = 0
+        # Persistent map of committed copies: every write replaces the top-level
+        # dict instead of mutating it, so older snapshots keep their version.
+        self._committed = {key: value for key, value in self.state.items() if key != "history"}
+
+    def _commit(self, key, committed):
+        self._committed = {**self._committed, key: committed}
+        self.version += 1
+
+    def _record(self, event, data):
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event": event,
+            "version": self.version,
+            "data": data
         }
+        history = self.state["history"]
+        history.append(entry)
+        self.state["history_event_count"] += 1
+        if self.history_log is not None:
+            self.history_log.append(entry)
+        if self.history_limit is not None and len(history) > self.history_limit:
+            del history[: len(history) - self.history_limit]
 
     def write(self, key, value):
         self.state[key] = value
-        self.append_history("write", {key: deepcopy(value)})
+        committed = deepcopy(value)
+        self._commit(key, committed)
+        # The history delta shares the committed copy instead of copying again.
+        self._record("write", {key: committed})
 
     def read(self, key, default=None):
         return self.state.get(key, default)
@@ -43,15 +221,18 @@ class SharedMemory:
             self.write(key, value)
 
     def append_history(self, event, data):
-        self.state["history"].append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "event": event,
-            "data": deepcopy(data)
-        })
+        self._record(event, deepcopy(data))
 
     def increment_iteration(self):
         self.state["iteration"] += 1
-        self.append_history("iteration_incremented", self.state["iteration"])
+        self._commit("iteration", self.state["iteration"])
+        self._record("iteration_incremented", self.state["iteration"])
+
+    def snapshot(self) -> StateSnapshot:
+        return StateSnapshot(self._committed, self.state["history"], self.version)
+
+    def working_state(self) -> WorkingState:
+        return WorkingState({**self.state, "history": list(self.state["history"])})
 
     def get_full_state(self):
         return deepcopy(self.state)
@@ -59,4 +240,14 @@ class SharedMemory:
     def get_recent_history(self, count=10):
         count = max(0, int(count))
         return deepcopy(self.state["history"][-count:])
-    
+
+    def iter_history(self):
+        """Iterate the complete event log, including events trimmed from memory."""
+        if self.history_log is not None:
+            yield from self.history_log.iter_events()
+        else:
+            yield from list(self.state["history"])
+
+    def close(self):
+        if self.history_log is not None:
+            self.history_log.close()
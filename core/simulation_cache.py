@@ -0,0 +1,252 @@
+# I13/core/simulation_cache.py
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from typing import List, Optional
+
+from core.ngspice_backend import NgspiceRun, SubprocessNgspice, deck_output_files
+
+
+DEFAULT_CACHE_DIR = os.path.join("artifacts", "cache", "simulations")
+DEFAULT_CACHE_MAX_MB = 512
+_META_FILE = "cache_entry.json"
+_FILES_DIR = "files"
+_VERSION_CACHE = {}
+_INCLUDE_LINE = re.compile(r"^\s*\.(include|inc|lib)\s+(\S+)(\s+\S+)?", re.IGNORECASE)
+
+
+def normalize_netlist(netlist_text: str) -> str:
+    """Drop comment/blank lines and collapse whitespace; everything else stays byte-significant."""
+    lines = []
+    for raw in (netlist_text or "").splitlines():
+        line = re.sub(r"\s+", " ", raw).strip()
+        if not line or line.startswith("*"):
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def ngspice_version(backend) -> str:
+    key = (getattr(backend, "name", ""), getattr(backend, "path", ""))
+    if key in _VERSION_CACHE:
+        return _VERSION_CACHE[key]
+    version = f"{key[0]}:{os.path.basename(key[1] or '')}"
+    if isinstance(backend, SubprocessNgspice):
+        executable = backend.path
+    else:
+        executable = getattr(getattr(backend, "fallback", None), "path", None)
+    if executable:
+        try:
+            result = subprocess.run([executable, "-v"], capture_output=True, text=True, timeout=10)
+            lines = [line.strip() for line in (result.stdout or "").splitlines() if "ngspice" in line.lower()]
+            if lines:
+                version = lines[0]
+        except Exception:
+            pass
+    _VERSION_CACHE[key] = version
+    return version
+
+
+def included_sources(netlist_text: str, cwd: str, deck_dir: str = None) -> Optional[List[str]]:
+    """Text of every file the deck pulls in through .include/.lib, or None when one cannot be read."""
+    sources, seen = [], set()
+    pending = [(netlist_text, deck_dir or cwd)]
+    while pending:
+        text, directory = pending.pop(0)
+        for line in text.splitlines():
+            match = _INCLUDE_LINE.match(line)
+            if not match:
+                continue
+            name = os.path.expanduser(match.group(2).strip("'\""))
+            # ngspice tries the working directory first, then the including file's directory.
+            candidates = [name] if os.path.isabs(name) else [os.path.join(cwd, name), os.path.join(directory, name)]
+            path = next((candidate for candidate in candidates if os.path.isfile(candidate)), None)
+            if path is None:
+                if match.group(1).lower() == "lib" and not match.group(3):
+                    # `.lib <section>` inside a library opens a section, it includes nothing.
+                    continue
+                return None
+            path = os.path.abspath(path)
+            if path in seen:
+                continue
+            seen.add(path)
+            try:
+                with open(path, "r", errors="replace") as handle:
+                    included = handle.read()
+            except OSError:
+                return None
+            sources.append(included)
+            pending.append((included, os.path.dirname(path)))
+    return sources
+
+
+def simulation_cache_key(netlist_text: str, version: str, included: List[str] = ()) -> str:
+    digest = hashlib.sha256()
+    digest.update(version.encode())
+    digest.update(b"\0")
+    digest.update(normalize_netlist(netlist_text).encode())
+    for text in included:
+        digest.update(b"\0")
+        digest.update(text.encode())
+    return digest.hexdigest()
+
+
+def _cacheable_outputs(texts: List[str]) -> Optional[List[str]]:
+    # Only plain file names in the run directory can be stored and replayed.
+    outputs = []
+    for text in texts:
+        for name in deck_output_files(text):
+            if os.path.basename(name) != name or any(char in name for char in "${}"):
+                return None
+            outputs.append(name)
+    return outputs
+
+
+class SimulationCache:
+    """LRU on-disk store of ngspice outputs keyed by normalized netlist and simulator version."""
+
+    def __init__(self, root: str = None, max_bytes: int = None):
+        self.root = root or os.getenv("I13_SIM_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("I13_SIM_CACHE_MAX_MB", str(DEFAULT_CACHE_MAX_MB))) * 1024 * 1024)
+        self.max_bytes = max(0, int(max_bytes))
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key)
+
+    def load(self, key: str, cwd: str) -> Optional[dict]:
+        entry = self._entry_dir(key)
+        meta_path = os.path.join(entry, _META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, "r") as handle:
+                meta = json.load(handle)
+            files_dir = os.path.join(entry, _FILES_DIR)
+            for name in meta.get("files") or []:
+                shutil.copy2(os.path.join(files_dir, name), os.path.join(cwd, name))
+            os.utime(meta_path)
+        except Exception:
+            return None
+        return meta
+
+    def store(self, key: str, cwd: str, files: list, meta: dict) -> None:
+        entry = self._entry_dir(key)
+        if os.path.exists(entry):
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f".{key[:8]}-", dir=os.path.dirname(entry))
+        try:
+            files_dir = os.path.join(staging, _FILES_DIR)
+            os.makedirs(files_dir)
+            for name in files:
+                shutil.copy2(os.path.join(cwd, name), os.path.join(files_dir, name))
+            with open(os.path.join(staging, _META_FILE), "w") as handle:
+                json.dump({**meta, "files": list(files)}, handle, indent=2, sort_keys=True)
+            os.rename(staging, entry)
+        except OSError:
+            # Another worker stored the same key first.
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self.evict()
+
+    def _entries(self):
+        if not os.path.isdir(self.root):
+            return []
+        entries = []
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                entry = os.path.join(shard_dir, name)
+                meta_path = os.path.join(entry, _META_FILE)
+                if name.startswith(".") or not os.path.exists(meta_path):
+                    continue
+                size = 0
+                for dirpath, _, filenames in os.walk(entry):
+                    size += sum(os.path.getsize(os.path.join(dirpath, item)) for item in filenames)
+                entries.append((os.path.getmtime(meta_path), size, entry))
+        return entries
+
+    def evict(self) -> int:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+class CachedNgspice:
+    """Simulator backend wrapper that serves byte-identical netlists from SimulationCache."""
+
+    def __init__(self, backend, cache: SimulationCache):
+        self.backend = backend
+        self.cache = cache
+        self.name = backend.name
+        self.path = backend.path
+
+    def run(self, netlist_path: str, cwd: str, log_name: str = "ngspice.log") -> NgspiceRun:
+        source_path = netlist_path if os.path.isabs(netlist_path) else os.path.join(cwd, netlist_path)
+        with open(source_path, "r") as handle:
+            netlist_text = handle.read()
+        included = included_sources(netlist_text, cwd, os.path.dirname(source_path))
+        outputs = _cacheable_outputs([netlist_text, *(included or [])]) if included is not None else None
+        if outputs is None:
+            # Unreadable includes or outputs outside the run directory cannot be replayed.
+            return self.backend.run(netlist_path, cwd=cwd, log_name=log_name)
+        key = simulation_cache_key(netlist_text, f"{ngspice_version(self.backend)}|log={log_name}", included)
+
+        meta = self.cache.load(key, cwd)
+        if meta is not None:
+            return NgspiceRun(
+                returncode=meta.get("returncode"),
+                stdout=meta.get("stdout") or "",
+                stderr=meta.get("stderr") or "",
+                log_path=os.path.join(cwd, log_name),
+                backend=meta.get("backend") or self.name,
+                cached=True,
+                cache_key=key,
+            )
+
+        result = self.backend.run(netlist_path, cwd=cwd, log_name=log_name)
+        result.cache_key = key
+        if result.returncode == 0:
+            # Only the deck's own outputs: other writers (e.g. the schematic
+            # renderer) share the attempt directory while ngspice runs.
+            produced = sorted(name for name in {log_name, *outputs} if os.path.isfile(os.path.join(cwd, name)))
+            try:
+                self.cache.store(
+                    key,
+                    cwd,
+                    produced,
+                    {
+                        "returncode": result.returncode,
+                        "stdout": result.stdout,
+                        "stderr": result.stderr,
+                        "backend": result.backend,
+                    },
+                )
+            except Exception:
+                pass
+        return result
+
+
+def simulation_cache_enabled() -> bool:
+    return os.getenv("I13_SIM_CACHE", "1").strip() == "1"
+
+
+def with_simulation_cache(backend, cache: SimulationCache = None):
+    if backend is None or not simulation_cache_enabled():
+        return backend
+    return CachedNgspice(backend, cache or SimulationCache())
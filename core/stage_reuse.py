@@ -0,0 +1,86 @@
+# I13/core/stage_reuse.py
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+
+STAGE_REUSE_EVENT = "stage_reuse"
+REUSE_STAGES = ("topology", "sizing", "constraints", "netlist", "simulation")
+_STAGE_AGENTS = {
+    "sizing": "SizingAgent",
+    "constraints": "ConstraintAgent",
+    "netlist": "NetlistAgent",
+}
+
+
+def stage_reuse_enabled() -> bool:
+    return os.getenv("I13_SWEEP_REUSE", "1").strip() == "1"
+
+
+class StageReuseCache:
+    """Per-sweep on-disk store of stage outputs, one atomically written JSON file per (stage, key)."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    @staticmethod
+    def key(stage: str, inputs: dict) -> str:
+        payload = json.dumps({"stage": stage, "inputs": inputs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, stage: str, key: str) -> str:
+        return os.path.join(self.root, stage, f"{key}.json")
+
+    def get(self, stage: str, key: str) -> Optional[dict]:
+        try:
+            with open(self._entry_path(stage, key), "r") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, stage: str, key: str, value: dict) -> None:
+        try:
+            payload = json.dumps(value, sort_keys=True)
+        except (TypeError, ValueError):
+            return
+        path = self._entry_path(stage, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=f".{key[:8]}-", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(payload)
+            os.replace(staging, path)
+        except OSError:
+            if os.path.exists(staging):
+                os.remove(staging)
+
+
+def record_stage_reuse(memory, stage: str, reused: bool, key: str = None, detail: dict = None) -> None:
+    memory.append_history(STAGE_REUSE_EVENT, {"stage": stage, "reused": reused, "key": key, **(detail or {})})
+
+
+def stage_reuse_markers(final_state: dict, history) -> dict:
+    """"reused"/"recomputed" (or "skipped") per stage for one finished run."""
+    markers = {stage: "skipped" for stage in REUSE_STAGES}
+    executed = set()
+    for event in history:
+        data = event.get("data") or {}
+        if event.get("event") == STAGE_REUSE_EVENT and data.get("stage") in markers:
+            markers[data["stage"]] = "reused" if data.get("reused") else "recomputed"
+        elif event.get("event") == "agent_executed":
+            executed.add(data.get("agent"))
+    for stage, agent in _STAGE_AGENTS.items():
+        if agent in executed:
+            markers[stage] = "recomputed"
+    sim = final_state.get("simulation_results") or {}
+    if sim and not sim.get("simulation_skipped"):
+        markers["simulation"] = "reused" if sim.get("simulation_cached") else "recomputed"
+    if markers["topology"] == "skipped" and final_state.get("selected_topology"):
+        markers["topology"] = "recomputed"
+    return markers
+
+
+def format_stage_reuse(markers: dict) -> str:
+    return ";".join(f"{stage}={markers.get(stage, 'skipped')}" for stage in REUSE_STAGES)
@@ -0,0 +1,230 @@
+# I13/core/stage_timing.py
+
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+NODE_TIMING_EVENT = "node_timing"
+
+# Subprocess wall time spent inside the node currently being measured. Threads
+# started through contextvars.copy_context() share the same accumulator.
+_SUBPROCESS = contextvars.ContextVar("i13_subprocess_time", default=None)
+# perf_counter() value that node start times are measured from; set by the
+# outermost flow so nested flows share one timeline.
+_ORIGIN = contextvars.ContextVar("i13_flow_origin", default=None)
+
+
+def stage_timing_enabled() -> bool:
+    return os.getenv("I13_STAGE_TIMING", "1").strip() == "1"
+
+
+def record_subprocess_time(seconds: float) -> None:
+    """Attribute `seconds` of external-process wall time to the node being measured."""
+    totals = _SUBPROCESS.get()
+    if totals is not None:
+        totals["wall_s"] += float(seconds)
+        totals["count"] += 1
+
+
+@contextlib.contextmanager
+def flow_clock(origin: Optional[float] = None):
+    """Yield the timeline origin for node start times, starting one if no enclosing flow has."""
+    if _ORIGIN.get() is not None:
+        yield _ORIGIN.get()
+        return
+    origin = time.perf_counter() if origin is None else origin
+    token = _ORIGIN.set(origin)
+    try:
+        yield origin
+    finally:
+        _ORIGIN.reset(token)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def _children_cpu_s() -> float:
+    times = os.times()
+    return times.children_user + times.children_system
+
+
+@dataclass
+class NodeTiming:
+    node: str
+    action: Optional[str]
+    iteration: Optional[int]
+    start_s: float
+    wall_s: float
+    cpu_s: float
+    peak_rss_mb: Optional[float]
+    peak_rss_delta_mb: Optional[float]
+    retries: int
+    subprocess_s: float
+    subprocess_calls: int
+    subprocess_cpu_s: float
+    error: Optional[str] = None
+    branch: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# CPU time is process-wide; the RSS delta is 0 when an earlier node already peaked higher.
+class NodeMeasurement:
+    """Wall/CPU/RSS/subprocess accounting for one node execution."""
+
+    def __init__(self, node: str, origin: float, iteration: Optional[int] = None, branch: Optional[int] = None):
+        self.node = node
+        self.origin = origin
+        self.iteration = iteration
+        self.branch = branch
+
+    def __enter__(self):
+        self._subprocess = {"wall_s": 0.0, "count": 0}
+        self._token = _SUBPROCESS.set(self._subprocess)
+        self._rss = _peak_rss_mb()
+        self._children_cpu = _children_cpu_s()
+        self._cpu = time.process_time()
+        self._start = time.perf_counter()
+        return self
+
+    def finish(self, action=None, retries: int = 0, error: Optional[str] = None) -> NodeTiming:
+        wall_s = time.perf_counter() - self._start
+        cpu_s = time.process_time() - self._cpu
+        _SUBPROCESS.reset(self._token)
+        rss = _peak_rss_mb()
+        return NodeTiming(
+            node=self.node,
+            action=None if action is None else str(action),
+            iteration=self.iteration,
+            start_s=self._start - self.origin,
+            wall_s=wall_s,
+            cpu_s=cpu_s,
+            peak_rss_mb=rss,
+            peak_rss_delta_mb=None if rss is None or self._rss is None else max(0.0, rss - self._rss),
+            retries=int(retries),
+            subprocess_s=self._subprocess["wall_s"],
+            subprocess_calls=self._subprocess["count"],
+            subprocess_cpu_s=max(0.0, _children_cpu_s() - self._children_cpu),
+            error=error,
+            branch=self.branch,
+        )
+
+    def __exit__(self, exc_type, exc, tb):
+        if _SUBPROCESS.get() is self._subprocess:
+            _SUBPROCESS.reset(self._token)
+        return False
+
+
+def summarize_node_timings(records: Iterable[dict]) -> dict:
+    records = list(records)
+    by_node = {}
+    for record in records:
+        totals = by_node.setdefault(
+            record["node"], {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "subprocess_s": 0.0, "retries": 0}
+        )
+        totals["calls"] += 1
+        totals["wall_s"] += record.get("wall_s") or 0.0
+        totals["cpu_s"] += record.get("cpu_s") or 0.0
+        totals["subprocess_s"] += record.get("subprocess_s") or 0.0
+        totals["retries"] += record.get("retries") or 0
+    by_iteration = {}
+    for record in records:
+        key = str(record.get("iteration"))
+        by_iteration[key] = by_iteration.get(key, 0.0) + (record.get("wall_s") or 0.0)
+    return {
+        "node_count": len(records),
+        "total_wall_s": sum(record.get("wall_s") or 0.0 for record in records),
+        "by_node": by_node,
+        "wall_s_by_iteration": by_iteration,
+    }
+
+
+def chrome_trace_events(records: Iterable[dict]) -> List[dict]:
+    """Complete ("X") trace events, one track per parallel branch, for chrome://tracing or Perfetto."""
+    events = [
+        {"name": "process_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "I13 design flow"}},
+        {"name": "thread_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "nodes"}},
+    ]
+    iterations = {}
+    branches = set()
+    for record in records:
+        start_us = record["start_s"] * 1e6
+        duration_us = record["wall_s"] * 1e6
+        events.append(
+            {
+                "name": record["node"],
+                "cat": "node",
+                "ph": "X",
+                "pid": 1,
+                "tid": _trace_track(record),
+                "ts": start_us,
+                "dur": duration_us,
+                "args": {key: value for key, value in record.items() if key not in ("node", "start_s", "wall_s")},
+            }
+        )
+        if record.get("branch") is not None:
+            branches.add(record["branch"])
+        span = iterations.setdefault(record.get("iteration"), [start_us, start_us + duration_us])
+        span[0] = min(span[0], start_us)
+        span[1] = max(span[1], start_us + duration_us)
+    for iteration, (start_us, end_us) in iterations.items():
+        events.append(
+            {
+                "name": f"iteration {iteration}",
+                "cat": "iteration",
+                "ph": "X",
+                "pid": 1,
+                "tid": 1,
+                "ts": start_us,
+                "dur": end_us - start_us,
+                "args": {"iteration": iteration},
+            }
+        )
+    if iterations:
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "iterations"}})
+    for branch in sorted(branches):
+        events.append(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": _trace_track({"branch": branch}), "args": {"name": f"branch {branch}"}}
+        )
+    return events
+
+
+def _trace_track(record: dict) -> int:
+    branch = record.get("branch")
+    return 0 if branch is None else 10 + int(branch)
+
+
+def node_timings_from_history(events: Iterable[dict]) -> List[dict]:
+    return [dict(event.get("data") or {}) for event in events if event.get("event") == NODE_TIMING_EVENT]
+
+
+def write_timing_artifacts(records: Iterable[dict], out_dir: str) -> Optional[dict]:
+    """Write timing.json and timing_trace.json (Chrome trace format) into out_dir."""
+    records = list(records)
+    if not records:
+        return None
+    os.makedirs(out_dir, exist_ok=True)
+    timing_path = os.path.join(out_dir, "timing.json")
+    trace_path = os.path.join(out_dir, "timing_trace.json")
+    with open(timing_path, "w") as handle:
+        json.dump({"summary": summarize_node_timings(records), "nodes": records}, handle, indent=2)
+    with open(trace_path, "w") as handle:
+        json.dump({"traceEvents": chrome_trace_events(records), "displayTimeUnit": "ms"}, handle)
+    return {"timing_path": timing_path, "trace_path": trace_path}
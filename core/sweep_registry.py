@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from copy import deepcopy
 
 from core.demo_catalog import (
@@ -47,6 +48,7 @@ CASE_SWEEP_SCHEMAS = {
                 "default_points": [500.0, 1000.0, 5000.0],
                 "metric_keys": ["fc_hz", "fc_hz_from_ac", "bandwidth_hz"],
                 "requirement_keys": ["fc_hz", "cutoff_hz", "bandwidth_hz"],
+                "native_batch": True,
             },
             "fixed_cap_f": {
                 "label": "Fixed capacitor (F)",
@@ -57,6 +59,7 @@ CASE_SWEEP_SCHEMAS = {
                 "default_points": [4.7e-9, 10e-9, 22e-9],
                 "metric_keys": ["fc_hz", "fc_hz_from_ac"],
                 "requirement_keys": ["fc_hz", "cutoff_hz"],
+                "native_batch": True,
             },
         },
         "required_simulation_modes": ["ac", "tran"],
@@ -86,6 +89,7 @@ CASE_SWEEP_SCHEMAS = {
                 "default_points": [1.5, 3.0, 5.0],
                 "metric_keys": ["q_factor", "center_hz", "bandwidth_hz"],
                 "requirement_keys": ["center_hz", "bandwidth_hz"],
+                "native_batch": True,
             },
         },
         "required_simulation_modes": ["ac", "tran"],
@@ -488,6 +492,18 @@ def default_sweep_parameter(case_name: str) -> str | None:
     return params[0] if params else None
 
 
+_SWEEP_OVERRIDE_NOTES = re.compile(r"(\s*Sweep override: \S+?=\S+?\.)+$")
+
+
+def sweep_override_note(sweep_param: str, value: float) -> str:
+    return f" Sweep override: {sweep_param}={value:g}."
+
+
+def strip_sweep_override_note(specification: str) -> str:
+    """The specification without the trailing sweep-override notes run_sweep appends."""
+    return _SWEEP_OVERRIDE_NOTES.sub("", specification or "")
+
+
 def apply_sweep_value(case_name: str, constraints: dict, sweep_param: str, value: float) -> dict:
     resolved = resolve_case_name(case_name)
     updated = dict(constraints or {})
@@ -508,13 +524,23 @@ def apply_sweep_value(case_name: str, constraints: dict, sweep_param: str, value
     return updated
 
 
-def extract_measured_metric(final_state: dict, case_name: str, sweep_param: str) -> tuple[str | None, float | None]:
+def _sweep_param_keys(schema: dict, sweep_param, field: str) -> list[str]:
+    # A grid sweeps several parameters at once; their keys are combined in order.
+    params = [sweep_param] if isinstance(sweep_param, str) else list(sweep_param or [])
+    keys = []
+    for param in params:
+        for key in ((schema.get("sweep_parameters") or {}).get(param) or {}).get(field) or []:
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def extract_measured_metric(final_state: dict, case_name: str, sweep_param) -> tuple[str | None, float | None]:
     sim = final_state.get("simulation_results") or {}
     verification = sim.get("verification_summary") or {}
     extracted = verification.get("extracted_metrics") or {}
     schema = get_case_sweep_schema(case_name)
-    param_meta = ((schema.get("sweep_parameters") or {}).get(sweep_param) or {})
-    for key in param_meta.get("metric_keys") or []:
+    for key in _sweep_param_keys(schema, sweep_param, "metric_keys"):
         value = extracted.get(key)
         if value is None:
             value = sim.get(key)
@@ -526,12 +552,11 @@ def extract_measured_metric(final_state: dict, case_name: str, sweep_param: str)
     return None, None
 
 
-def evaluate_sweep_outcome(final_state: dict, case_name: str, sweep_param: str, row: dict | None = None) -> dict:
+def evaluate_sweep_outcome(final_state: dict, case_name: str, sweep_param, row: dict | None = None) -> dict:
     sim = final_state.get("simulation_results") or {}
     verification = sim.get("verification_summary") or {}
     schema = get_case_sweep_schema(case_name)
-    param_meta = ((schema.get("sweep_parameters") or {}).get(sweep_param) or {})
-    requirement_keys = set(param_meta.get("requirement_keys") or [])
+    requirement_keys = set(_sweep_param_keys(schema, sweep_param, "requirement_keys"))
     requirement_rows = [item for item in (verification.get("requirement_evaluations") or []) if item.get("requirement") in requirement_keys]
 
     missing_artifacts = []
@@ -10,6 +10,7 @@ from core.metric_extractors import (
     extract_noise_metrics_from_text,
     extract_transient_metrics,
 )
+from core.waveforms import ANALYSIS_OUTPUTS
 
 
 FAILURE_CATEGORY_ORDER = [
@@ -61,8 +62,15 @@ def collect_analysis_metrics(
     analysis_data=None,
     op_point_results=None,
     log_text="",
+    waveforms=None,
 ):
     analysis_data = dict(analysis_data or {})
+    if waveforms is not None:
+        # Reuse the arrays parsed once for this attempt instead of the agent's list copies.
+        for key, filename in ANALYSIS_OUTPUTS.items():
+            series = waveforms.arrays(filename)
+            if series is not None:
+                analysis_data[key] = series
     per_analysis = {}
     planned_analyses = set(plan.get("analyses") or [])
 
@@ -127,7 +135,7 @@ def collect_analysis_metrics(
             dc_metrics.setdefault(key, sim.get(key))
     if sim.get("vref_v") is not None:
         dc_metrics.setdefault("vref_v", sim.get("vref_v"))
-    dc_executed = bool((analysis_data.get("dc_data") or {}).get("x"))
+    dc_executed = _has_points(analysis_data.get("dc_data"))
     per_analysis["dc"] = {
         "planned": "dc" in planned_analyses,
         "enabled": _analysis_enabled(plan, "dc"),
@@ -155,7 +163,7 @@ def collect_analysis_metrics(
             ac_metrics[key] = sim.get(key)
     if (sim.get("ac_characterization") or {}).get("response_shape") is not None:
         ac_metrics["response_shape"] = (sim.get("ac_characterization") or {}).get("response_shape")
-    ac_executed = bool((analysis_data.get("ac_data") or {}).get("x"))
+    ac_executed = _has_points(analysis_data.get("ac_data"))
     per_analysis["ac"] = {
         "planned": "ac" in planned_analyses,
         "enabled": _analysis_enabled(plan, "ac"),
@@ -184,7 +192,7 @@ def collect_analysis_metrics(
             tran_metrics[key] = sim.get(key)
     if sim.get("transient_characterization"):
         tran_metrics.update(sim.get("transient_characterization") or {})
-    tran_executed = bool((analysis_data.get("tran_out_data") or {}).get("x"))
+    tran_executed = _has_points(analysis_data.get("tran_out_data"))
     per_analysis["tran"] = {
         "planned": "tran" in planned_analyses,
         "enabled": _analysis_enabled(plan, "tran"),
@@ -331,6 +339,13 @@ def build_final_status_summary(topology, plan, sim, verification_summary):
     }
 
 
+SCHEMATIC_BUNDLE_KEYS = (
+    ("schematic_png_path", "plots"),
+    ("schematic_svg_path", "plots"),
+    ("schematic_metadata_path", "reports"),
+)
+
+
 def write_artifact_bundle(base_dir, sim, analysis_metrics, verification_summary, final_status_summary):
     directories = {
         "netlist": os.path.join(base_dir, "netlist"),
@@ -364,9 +379,7 @@ def write_artifact_bundle(base_dir, sim, analysis_metrics, verification_summary,
         ("tran_outn_csv", "data"),
         ("tran_diff_csv", "data"),
         ("tran_qb_csv", "data"),
-        ("schematic_png_path", "plots"),
-        ("schematic_svg_path", "plots"),
-        ("schematic_metadata_path", "reports"),
+        *SCHEMATIC_BUNDLE_KEYS,
     ):
         copied = _copy_if_present(sim.get(key), directories[bucket])
         if copied:
@@ -405,6 +418,32 @@ def write_artifact_bundle(base_dir, sim, analysis_metrics, verification_summary,
     return manifest
 
 
+def attach_schematic_artifacts(sim, schematic):
+    """Fold a schematic rendered after the bundle was written into `sim` and the bundle files."""
+    for key in ("schematic_png_path", "schematic_svg_path", "schematic_status", "schematic_failure_reason", "schematic_metadata_path"):
+        sim[key] = (schematic or {}).get(key)
+    base_dir = sim.get("artifact_dir")
+    manifest = sim.get("artifact_manifest")
+    if not base_dir or not isinstance(manifest, dict):
+        return sim
+    for key, bucket in SCHEMATIC_BUNDLE_KEYS:
+        copied = _copy_if_present(sim.get(key), os.path.join(base_dir, bucket))
+        if copied and copied not in manifest.setdefault(bucket, []):
+            manifest[bucket].append(copied)
+    reports_dir = os.path.join(base_dir, "reports")
+    os.makedirs(reports_dir, exist_ok=True)
+    with open(os.path.join(reports_dir, "artifact_manifest.json"), "w") as handle:
+        json.dump({bucket: [path for path in paths if not path.endswith("artifact_manifest.json")] for bucket, paths in manifest.items()}, handle, indent=2, sort_keys=True)
+    with open(os.path.join(reports_dir, "simulation_result.json"), "w") as handle:
+        json.dump(sim, handle, indent=2, sort_keys=True)
+    return sim
+
+
+def _has_points(data):
+    xs = (data or {}).get("x")
+    return xs is not None and len(xs) > 0
+
+
 def _analysis_enabled(plan, name):
     return name in set(plan.get("analyses") or [])
 
@@ -992,7 +1031,13 @@ def _copy_if_present(source, target_dir):
         return None
     destination = os.path.join(target_dir, os.path.basename(source))
     if os.path.abspath(source) != os.path.abspath(destination):
-        shutil.copy2(source, destination)
+        # Hard-link where possible so bundling does not read the data again.
+        try:
+            if os.path.exists(destination):
+                os.remove(destination)
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
     return destination
 
 
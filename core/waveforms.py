@@ -0,0 +1,367 @@
+# I13/core/waveforms.py
+
+import array
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from core.lazy_imports import optional_lazy_import
+
+# None without NumPy; otherwise imported on first use, not when the simulation agent loads.
+np = optional_lazy_import("numpy")
+
+
+RAWFILE_SUFFIX = ".raw"
+_WRDATA_LINE = re.compile(r"^(\s*)wrdata(\s+)(\S+?)\.csv(\s+.*)$", re.IGNORECASE)
+_CONTROL_LINE = re.compile(r"^(\s*)\.control\s*$", re.IGNORECASE)
+
+
+def rawfile_outputs_enabled() -> bool:
+    return os.getenv("I13_RAWFILE", "0").strip() == "1"
+
+
+def add_rawfile_outputs(netlist_text: str) -> str:
+    """Mirror every `wrdata <name>.csv <exprs>` with a binary `write <name>.raw <exprs>`."""
+    lines = []
+    for line in (netlist_text or "").splitlines():
+        lines.append(line)
+        control = _CONTROL_LINE.match(line)
+        if control:
+            lines.append(f"{control.group(1)}set filetype=binary")
+            continue
+        match = _WRDATA_LINE.match(line)
+        if match:
+            lines.append(f"{match.group(1)}write{match.group(2)}{match.group(3)}{RAWFILE_SUFFIX}{match.group(4)}")
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class RawPlot:
+    """One plot of an ngspice rawfile; vectors are array views into the mapped file."""
+
+    title: str
+    plotname: str
+    is_complex: bool
+    variables: List[str]
+    vectors: Dict[str, object] = field(default_factory=dict)
+
+    @property
+    def scale_name(self) -> Optional[str]:
+        return self.variables[0] if self.variables else None
+
+    @property
+    def points(self) -> int:
+        scale = self.vectors.get(self.scale_name)
+        return len(scale) if scale is not None else 0
+
+
+def _parse_header(handle):
+    header = {}
+    variables = []
+    while True:
+        raw = handle.readline()
+        if not raw:
+            return None
+        line = raw.decode("latin-1").rstrip("\r\n")
+        key, _, value = line.partition(":")
+        key = key.strip().lower()
+        if key == "variables":
+            count = int(header.get("no. variables", "0"))
+            for _ in range(count):
+                parts = handle.readline().decode("latin-1").split()
+                variables.append(parts[1] if len(parts) > 1 else parts[0])
+            continue
+        if key in {"binary", "values"}:
+            header["format"] = key
+            header["variables"] = variables
+            return header
+        header[key] = value.strip()
+
+
+def _read_binary_values(path, offset, count, mapped):
+    if np is not None:
+        if mapped:
+            return np.memmap(path, dtype="<f8", mode="r", offset=offset, shape=(count,))
+        return np.fromfile(path, dtype="<f8", count=count, offset=offset)
+    values = array.array("d")
+    with open(path, "rb") as handle:
+        handle.seek(offset)
+        values.fromfile(handle, count)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def load_rawfile(path: str, mapped: bool = True) -> List[RawPlot]:
+    """Read every plot from an ngspice rawfile, memory-mapped when NumPy is available."""
+    plots = []
+    with open(path, "rb") as handle:
+        while True:
+            header = _parse_header(handle)
+            if header is None:
+                break
+            variables = header["variables"]
+            points = int(header.get("no. points", "0"))
+            is_complex = "complex" in header.get("flags", "").lower()
+            per_value = 2 if is_complex else 1
+            width = len(variables) * per_value
+            plot = RawPlot(
+                title=header.get("title", ""),
+                plotname=header.get("plotname", ""),
+                is_complex=is_complex,
+                variables=variables,
+            )
+
+            if header["format"] == "binary":
+                offset = handle.tell()
+                flat = _read_binary_values(path, offset, points * width, mapped)
+                handle.seek(offset + points * width * 8)
+            else:
+                flat = _read_ascii_rows(handle, points, len(variables), is_complex)
+
+            for index, name in enumerate(variables):
+                plot.vectors[name] = _column(flat, index, width, per_value, points)
+            plots.append(plot)
+    return plots
+
+
+def _read_ascii_rows(handle, points, variable_count, is_complex):
+    flat = []
+    for _ in range(points):
+        row = []
+        while len(row) < variable_count:
+            raw = handle.readline()
+            if not raw:
+                break
+            tokens = raw.decode("latin-1").split()
+            if not row and len(tokens) > 1:
+                tokens = tokens[1:]
+            if not tokens:
+                continue
+            parts = tokens[-1].split(",")
+            row.append([float(part) for part in parts])
+        for values in row:
+            flat.extend(values if is_complex else values[:1])
+            if is_complex and len(values) == 1:
+                flat.append(0.0)
+    if np is not None:
+        return np.asarray(flat, dtype=float)
+    return array.array("d", flat)
+
+
+def _column(flat, index, width, per_value, points):
+    start = index * per_value
+    if np is not None:
+        table = np.asarray(flat).reshape(points, width) if points else np.empty((0, width))
+        if per_value == 2:
+            return table[:, start] + 1j * table[:, start + 1]
+        return table[:, start]
+    if per_value == 2:
+        return [complex(flat[row * width + start], flat[row * width + start + 1]) for row in range(points)]
+    return flat[start::width]
+
+
+def _real_series(values):
+    """Scale/vector as real values: real part for real-valued complex vectors, magnitude otherwise."""
+    if np is not None:
+        values = np.asarray(values)
+        if np.iscomplexobj(values):
+            return values.real if not np.any(values.imag) else np.abs(values)
+        return values
+    if values and isinstance(values[0], complex):
+        if any(value.imag for value in values):
+            return [abs(value) for value in values]
+        return [value.real for value in values]
+    return list(values)
+
+
+class WaveformSet:
+    """Rawfile vectors of one simulation attempt, keyed by their wrdata CSV stem."""
+
+    def __init__(self, plots: Dict[str, RawPlot] = None, sources: Dict[str, str] = None):
+        self.plots = dict(plots or {})
+        self.sources = dict(sources or {})
+
+    @classmethod
+    def from_directory(cls, base_dir: str, mapped: bool = True) -> "WaveformSet":
+        plots, sources = {}, {}
+        if os.path.isdir(base_dir):
+            for name in sorted(os.listdir(base_dir)):
+                if not name.endswith(RAWFILE_SUFFIX):
+                    continue
+                path = os.path.join(base_dir, name)
+                try:
+                    loaded = load_rawfile(path, mapped=mapped)
+                except (OSError, ValueError):
+                    continue
+                if loaded:
+                    stem = name[: -len(RAWFILE_SUFFIX)]
+                    plots[stem] = loaded[-1]
+                    sources[stem] = path
+        return cls(plots, sources)
+
+    def __contains__(self, stem) -> bool:
+        return stem in self.plots
+
+    def __bool__(self) -> bool:
+        return bool(self.plots)
+
+    def names(self) -> List[str]:
+        return list(self.plots)
+
+    def vector_names(self, stem: str) -> List[str]:
+        plot = self.plots.get(stem)
+        return list(plot.variables) if plot else []
+
+    def vector(self, stem: str, name: str):
+        plot = self.plots.get(stem)
+        if plot is None or name not in plot.vectors:
+            return None
+        return plot.vectors[name]
+
+    def series(self, stem: str, as_lists: bool = False) -> Optional[dict]:
+        plot = self.plots.get(stem)
+        if plot is None or len(plot.variables) < 2:
+            return None
+        xs = _real_series(plot.vectors[plot.variables[0]])
+        ys = _real_series(plot.vectors[plot.variables[-1]])
+        if as_lists:
+            xs = xs.tolist() if hasattr(xs, "tolist") else list(xs)
+            ys = ys.tolist() if hasattr(ys, "tolist") else list(ys)
+        return {"x": xs, "y": ys}
+
+    def summary(self) -> Dict[str, List[str]]:
+        return {stem: list(plot.variables) for stem, plot in self.plots.items()}
+
+
+# analysis_data key -> wrdata output consumed by collect_analysis_metrics.
+ANALYSIS_OUTPUTS = {
+    "ac_data": "ac_out.csv",
+    "ac_phase_data": "ac_phase.csv",
+    "dc_data": "dc_out.csv",
+    "tran_in_data": "tran_in.csv",
+    "tran_out_data": "tran_out.csv",
+    "tran_outn_data": "tran_outn.csv",
+    "tran_diff_data": "tran_diff.csv",
+}
+_NUMERIC_TOKEN = re.compile(r"[-+]?(?:\d*\.\d+|\d+)(?:[eE][-+]?\d+)?")
+_PREVIEW_LINES = 20
+
+
+def _numeric_row(line):
+    try:
+        return [float(token) for token in line.split()]
+    except ValueError:
+        return [float(token) for token in _NUMERIC_TOKEN.findall(line)]
+
+
+class _Table:
+    """Rows of one wrdata CSV, parsed once; columns are built on first access."""
+
+    def __init__(self, rows, head):
+        self.rows = rows
+        self.head = head
+        self._columns = {}
+
+    def column(self, index):
+        if index not in self._columns:
+            self._columns[index] = [row[index] for row in self.rows]
+        return self._columns[index]
+
+
+class WaveformStore:
+    """Reads each output file of one simulation attempt at most once."""
+
+    def __init__(self, base_dir: str, waveforms: WaveformSet = None):
+        self.base_dir = base_dir
+        self.waveforms = WaveformSet.from_directory(base_dir) if waveforms is None else waveforms
+        self.files_read: List[str] = []
+        self._tables: Dict[str, _Table] = {}
+        self._texts: Dict[str, str] = {}
+        self._series: Dict[str, dict] = {}
+        self._arrays: Dict[str, dict] = {}
+
+    def path(self, filename: str) -> str:
+        return filename if os.path.isabs(filename) or os.path.dirname(filename) else os.path.join(self.base_dir, filename)
+
+    def exists(self, filename: str) -> bool:
+        return self._stem(filename) in self.waveforms or os.path.exists(self.path(filename))
+
+    def _stem(self, filename: str) -> str:
+        return os.path.splitext(os.path.basename(filename))[0]
+
+    def _table(self, filename: str) -> _Table:
+        path = self.path(filename)
+        if path not in self._tables:
+            rows, head = [], []
+            try:
+                with open(path, "r") as handle:
+                    self.files_read.append(path)
+                    for raw_line in handle:
+                        line = raw_line.strip()
+                        if len(head) < _PREVIEW_LINES:
+                            head.append(raw_line.rstrip())
+                        if not line:
+                            continue
+                        nums = _numeric_row(line)
+                        if len(nums) >= 2:
+                            rows.append(nums)
+            except OSError:
+                pass
+            self._tables[path] = _Table(rows, head)
+        return self._tables[path]
+
+    def series(self, filename: str) -> dict:
+        """{"x": scale, "y": last vector} as lists, from the rawfile when one was written."""
+        path = self.path(filename)
+        if path not in self._series:
+            series = self.waveforms.series(self._stem(filename), as_lists=True)
+            if series is None:
+                table = self._table(filename)
+                series = {"x": [row[0] for row in table.rows], "y": [row[-1] for row in table.rows]}
+            self._series[path] = series
+        return self._series[path]
+
+    def arrays(self, filename: str) -> Optional[dict]:
+        """The series() data as NumPy arrays (lists without NumPy); None if the output is missing."""
+        if not self.exists(filename):
+            return None
+        path = self.path(filename)
+        if path not in self._arrays:
+            series = self.waveforms.series(self._stem(filename)) if np is not None else None
+            if series is None:
+                series = self.series(filename)
+                if np is not None:
+                    series = {"x": np.asarray(series["x"], dtype=float), "y": np.asarray(series["y"], dtype=float)}
+            self._arrays[path] = series
+        return self._arrays[path]
+
+    def column(self, filename: str, index: int):
+        return self._table(filename).column(index)
+
+    def vector(self, filename: str, name: str):
+        """A named rawfile vector (all vectors are kept, not just the first/last columns)."""
+        return self.waveforms.vector(self._stem(filename), name)
+
+    def preview(self, filename: str, max_lines: int = 5) -> List[str]:
+        """First lines of a CSV as captured while parsing it, or formatted rows of the rawfile data."""
+        if self._stem(filename) not in self.waveforms and max_lines <= _PREVIEW_LINES:
+            return self._table(filename).head[:max_lines]
+        series = self.series(filename)
+        return [f"{x:.6e}\t{y:.6e}" for x, y in zip(series["x"][:max_lines], series["y"][:max_lines])]
+
+    def text(self, filename: str) -> str:
+        path = self.path(filename)
+        if path not in self._texts:
+            try:
+                with open(path, "r") as handle:
+                    self.files_read.append(path)
+                    self._texts[path] = handle.read()
+            except (OSError, UnicodeDecodeError):
+                self._texts[path] = ""
+        return self._texts[path]
+
+    def text_preview(self, filename: str, max_lines: int = 5) -> List[str]:
+        return [line.rstrip() for line in self.text(filename).splitlines()[:max_lines]]
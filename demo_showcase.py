@@ -2,13 +2,21 @@
 import argparse
 import csv
 import json
+import math
 import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
 
+from core.adaptive_sweep import DEFAULT_COARSE_POINTS, DEFAULT_TOLERANCE, adaptive_point_budget, adaptive_sweep
+from core.batched_sweep import batched_sweep_enabled, batched_sweep_supported, run_batched_sweep
 from core.demo_catalog import get_demo_case, list_demo_cases, slugify_label, stable_demo_cases
 from core.demo_safe import summarize_sizing
+from core.design_space import SAMPLING_METHODS, ParameterRange, sample_design_space, write_columnar_table
+from core.parallel_executor import resolve_jobs, run_ordered
+from core.run_journal import RunJournal
+from core.stage_reuse import format_stage_reuse, stage_reuse_enabled, stage_reuse_markers
+from core.shared_memory import iter_history
 from core.showcase_artifacts import organize_showcase_latest, row_from_final_state, sweep_group_from_output
 from core.sweep_registry import (
     apply_sweep_value,
@@ -16,6 +24,7 @@ from core.sweep_registry import (
     evaluate_sweep_outcome,
     extract_measured_metric,
     get_case_sweep_schema,
+    sweep_override_note,
     sweepable_parameters,
 )
 from main import run_case
@@ -36,6 +45,14 @@ def parse_sweep(value: str) -> tuple[str, list[float]]:
     return key.strip(), values
 
 
+def parse_adaptive(value: str) -> tuple[str, list[float]]:
+    key, _, raw_bounds = value.partition("=")
+    bounds = [float(item) for item in raw_bounds.split(",") if item.strip()]
+    if not key.strip() or len(bounds) not in (0, 2):
+        raise argparse.ArgumentTypeError("Adaptive sweep must look like name or name=low,high")
+    return key.strip(), bounds
+
+
 def resolve_case(case_name: str) -> str:
     return CASE_ALIASES.get((case_name or "").strip().lower(), case_name)
 
@@ -61,9 +78,82 @@ def _default_sponsor_sweeps() -> list[tuple[str, str, list[float]]]:
     return sweeps
 
 
-def run_sweep(case_name: str, sweep_key: str, values: list[float], output_dir: str = None, update_latest: bool = True):
-    resolved_case = resolve_case(case_name)
+def _grid_point_override(resolved_case: str, assignments: dict) -> dict:
     base_case = get_demo_case(resolved_case)
+    constraints = dict(base_case.get("constraints") or {})
+    specification = base_case.get("specification")
+    artifact_label = base_case.get("artifact_label")
+    for sweep_key, value in assignments.items():
+        constraints = apply_sweep_value(resolved_case, constraints, sweep_key, float(value))
+        specification = f"{specification}{sweep_override_note(sweep_key, value)}"
+        artifact_label = f"{artifact_label}_{sweep_key}_{slugify_label(str(value))}"
+    return {
+        "specification": specification,
+        "constraints": constraints,
+        "artifact_label": artifact_label,
+    }
+
+
+def _sweep_point_override(resolved_case: str, sweep_key: str, value: float) -> dict:
+    return _grid_point_override(resolved_case, {sweep_key: value})
+
+
+def _point_row(final_state: dict, resolved_case: str, sweep_params) -> dict:
+    sim = final_state.get("simulation_results") or {}
+    metric_name, measured = extract_measured_metric(final_state, resolved_case, sweep_params)
+    row = {
+        "case": resolved_case,
+        "measured_metric": metric_name or "",
+        "measured_result": measured if measured is not None else "",
+        "component_values": "; ".join(summarize_sizing(final_state.get("sizing") or {})),
+        "artifact_dir": sim.get("artifact_dir") or "",
+        "generated_netlist": sim.get("saved_netlist_path") or "",
+        "schematic_png": sim.get("schematic_png_path") or "",
+        "ac_plot": sim.get("ac_plot") or "",
+        "dc_plot": sim.get("dc_plot") or "",
+        "tran_plot": sim.get("tran_plot") or "",
+        "final_report": str(Path(sim.get("artifact_dir") or ".") / "final_report.txt") if sim.get("artifact_dir") else "",
+        "backend_used": ((sim.get("netlist_backend_metadata") or {}).get("backend_used") or ""),
+        "fallback_reason": ((sim.get("netlist_backend_metadata") or {}).get("fallback_reason") or ""),
+        "stage_reuse": format_stage_reuse(stage_reuse_markers(final_state, iter_history(final_state))),
+    }
+    sweep_eval = evaluate_sweep_outcome(final_state, resolved_case, sweep_params, row=row)
+    row["pass_fail"] = sweep_eval["status"]
+    row["missing_artifacts"] = ";".join(sweep_eval.get("missing_artifacts") or [])
+    row["verification_status"] = sweep_eval.get("verification_status") or ""
+    row["overall_verdict"] = sweep_eval.get("overall_verdict") or ""
+    return row
+
+
+def _run_sweep_point(point: tuple[str, str, float, dict]) -> dict:
+    resolved_case, sweep_key, value, runtime_options = point
+    override = _sweep_point_override(resolved_case, sweep_key, value)
+    print(f"\n[showcase] Running {resolved_case} with {sweep_key}={value:g}")
+    final_state = run_case(resolved_case, case_override=override, runtime_options=runtime_options)
+    row = _point_row(final_state, resolved_case, sweep_key)
+    return {"case": resolved_case, "sweep_parameter": sweep_key, "requested_spec": value, **row}
+
+
+def _run_grid_point(point: tuple[str, int, dict, dict]) -> dict:
+    resolved_case, sample, assignments, runtime_options = point
+    override = _grid_point_override(resolved_case, assignments)
+    print(f"\n[showcase] Running {resolved_case} sample {sample}: {_format_assignments(assignments)}")
+    final_state = run_case(resolved_case, case_override=override, runtime_options=runtime_options)
+    row = _point_row(final_state, resolved_case, list(assignments))
+    return {"case": resolved_case, "sample": sample, **assignments, **row}
+
+
+def _grid_point_key(assignments: dict) -> str:
+    return ";".join(_sweep_point_key(name, value) for name, value in assignments.items())
+
+
+def _format_assignments(assignments: dict) -> str:
+    return ", ".join(f"{key}={float(value):g}" for key, value in assignments.items())
+
+
+def _resolve_sweep(case_name: str, sweep_key: str) -> str:
+    resolved_case = resolve_case(case_name)
+    get_demo_case(resolved_case)
     schema = get_case_sweep_schema(resolved_case)
     if not schema:
         raise ValueError(
@@ -76,65 +166,116 @@ def run_sweep(case_name: str, sweep_key: str, values: list[float], output_dir: s
             f"Sweep parameter '{sweep_key}' is not supported for case '{resolved_case}'. "
             f"Supported parameters: {', '.join(sorted(allowed)) or 'none'}."
         )
+    return resolved_case
+
 
+def _sweep_root(output_dir: str, resolved_case: str, sweep_key: str, suffix: str = "") -> Path:
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    root = Path(output_dir or Path("artifacts") / "showcase_sweeps" / f"{stamp}_{resolved_case}_{sweep_key}")
+    root = Path(output_dir or Path("artifacts") / "showcase_sweeps" / f"{stamp}_{resolved_case}_{sweep_key}{suffix}")
     root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def _sweep_runtime_options(root: Path, reuse_stages: bool = None) -> dict:
+    if reuse_stages is None:
+        reuse_stages = stage_reuse_enabled()
+    return {"stage_cache_dir": str(root / "stage_cache")} if reuse_stages else {}
+
+
+def _run_sweep_points(
+    resolved_case: str,
+    sweep_key: str,
+    values: list[float],
+    runtime_options: dict,
+    batch_dir: Path,
+    jobs: int = None,
+    batched: bool = None,
+    prime_stage_cache: bool = True,
+    journal: RunJournal = None,
+) -> tuple[list[dict], dict]:
+    all_points = [(resolved_case, sweep_key, float(value), runtime_options) for value in values]
+    completed = journal.completed if journal else {}
+    points = [point for point in all_points if _sweep_point_key(sweep_key, point[2]) not in completed]
+    if len(points) < len(all_points):
+        print(f"\n[showcase] Resuming: {len(all_points) - len(points)} of {len(all_points)} points already in the journal")
+    batched_sweep = None
+    if not points:
+        return [completed[_sweep_point_key(sweep_key, point[2])] for point in all_points], batched_sweep
+    if batched is None:
+        batched = batched_sweep_enabled()
+    if batched:
+        if batched_sweep_supported(resolved_case, sweep_key):
+            overrides = [_sweep_point_override(*point[:3]) for point in points]
+            batched_sweep = run_batched_sweep(resolved_case, overrides, str(batch_dir)).to_dict()
+            print(
+                f"\n[showcase] Batched sweep: {batched_sweep['status']} "
+                f"({batched_sweep['seeded']}/{len(points)} points from one ngspice run"
+                + (f"; {batched_sweep['reason']})" if batched_sweep.get("reason") else ")")
+            )
+        else:
+            print(f"\n[showcase] {resolved_case}.{sweep_key} is not natively batchable; simulating each point")
+    jobs = resolve_jobs(jobs, env_var="I13_SWEEP_JOBS")
+    if jobs > 1:
+        print(f"\n[showcase] Running {len(points)} sweep points across {min(jobs, len(points))} worker processes")
+
+    def _report_row(index, row):
+        if journal:
+            journal.record(_sweep_point_key(sweep_key, row["requested_spec"]), row)
+        if jobs > 1:
+            print(
+                f"[showcase] Finished {resolved_case} {sweep_key}={float(row['requested_spec']):g} "
+                f"({row['pass_fail']})"
+            )
 
-    rows = []
-    for value in values:
-        constraints = apply_sweep_value(
-            resolved_case,
-            dict(base_case.get("constraints") or {}),
-            sweep_key,
-            float(value),
-        )
-        specification = f"{base_case.get('specification')} Sweep override: {sweep_key}={value:g}."
-        artifact_label = f"{base_case.get('artifact_label')}_{sweep_key}_{slugify_label(str(value))}"
-        override = {
-            "specification": specification,
-            "constraints": constraints,
-            "artifact_label": artifact_label,
-        }
-        print(f"\n[showcase] Running {resolved_case} with {sweep_key}={value:g}")
-        final_state = run_case(resolved_case, case_override=override)
-        sim = final_state.get("simulation_results") or {}
-        metric_name, measured = extract_measured_metric(final_state, resolved_case, sweep_key)
-        row = {
-            "case": resolved_case,
-            "sweep_parameter": sweep_key,
-            "requested_spec": value,
-            "measured_metric": metric_name or "",
-            "measured_result": measured if measured is not None else "",
-            "component_values": "; ".join(summarize_sizing(final_state.get("sizing") or {})),
-            "artifact_dir": sim.get("artifact_dir") or "",
-            "generated_netlist": sim.get("saved_netlist_path") or "",
-            "schematic_png": sim.get("schematic_png_path") or "",
-            "ac_plot": sim.get("ac_plot") or "",
-            "dc_plot": sim.get("dc_plot") or "",
-            "tran_plot": sim.get("tran_plot") or "",
-            "final_report": str(Path(sim.get("artifact_dir") or ".") / "final_report.txt") if sim.get("artifact_dir") else "",
-            "backend_used": ((sim.get("netlist_backend_metadata") or {}).get("backend_used") or ""),
-            "fallback_reason": ((sim.get("netlist_backend_metadata") or {}).get("fallback_reason") or ""),
-        }
-        sweep_eval = evaluate_sweep_outcome(final_state, resolved_case, sweep_key, row=row)
-        row["pass_fail"] = sweep_eval["status"]
-        row["missing_artifacts"] = ";".join(sweep_eval.get("missing_artifacts") or [])
-        row["verification_status"] = sweep_eval.get("verification_status") or ""
-        row["overall_verdict"] = sweep_eval.get("overall_verdict") or ""
-        rows.append(row)
-
-    table_path = root / "comparison_table.csv"
-    summary_path = root / "comparison_summary.md"
-    plot_path = root / "comparison_plot.png"
-    index_path = root / "run_index.json"
-    write_csv(table_path, rows)
-    write_summary(summary_path, rows, resolved_case, sweep_key)
-    write_plot(plot_path, rows, sweep_key)
-    index_path.write_text(json.dumps({"rows": rows}, indent=2, sort_keys=True) + "\n")
+    if prime_stage_cache and runtime_options and jobs > 1 and len(points) > 1:
+        # Let the first point fill the stage cache before fanning out, so
+        # parallel workers replay topology selection instead of racing to it.
+        rows = [_run_sweep_point(points[0])]
+        _report_row(0, rows[0])
+        rows += run_ordered(_run_sweep_point, points[1:], jobs=jobs, on_result=_report_row)
+    else:
+        rows = run_ordered(_run_sweep_point, points, jobs=jobs, on_result=_report_row)
+    if completed:
+        fresh = {_sweep_point_key(sweep_key, row["requested_spec"]): row for row in rows}
+        rows = [completed.get(key) or fresh[key] for key in (_sweep_point_key(sweep_key, point[2]) for point in all_points)]
+    return rows, batched_sweep
+
+
+def _open_journal(root: Path, kind: str, config: dict, resume: bool) -> RunJournal:
+    # A resumed run keeps the configuration recorded when it started.
+    return RunJournal.resume(root, kind) if resume else RunJournal.start(root, kind, config)
+
+
+def _sweep_point_key(sweep_key: str, value: float) -> str:
+    return f"{sweep_key}={float(value)!r}"
+
+
+def _write_sweep_outputs(
+    root: Path,
+    rows: list[dict],
+    resolved_case: str,
+    sweep_key: str,
+    index_extra: dict = None,
+    boundaries: list[dict] = None,
+) -> dict:
+    paths = {
+        "table": root / "comparison_table.csv",
+        "summary": root / "comparison_summary.md",
+        "plot": root / "comparison_plot.png",
+        "index": root / "run_index.json",
+    }
+    write_csv(paths["table"], rows)
+    write_summary(paths["summary"], rows, resolved_case, sweep_key, boundaries=boundaries)
+    write_plot(paths["plot"], rows, sweep_key)
+    index_payload = {"rows": rows, **{key: value for key, value in (index_extra or {}).items() if value is not None}}
+    paths["index"].write_text(json.dumps(index_payload, indent=2, sort_keys=True) + "\n")
+    return paths
+
+
+def _publish_sweep(root: Path, rows: list[dict], resolved_case: str, sweep_key: str, paths: dict, command: str, update_latest: bool):
     if update_latest:
         organize_showcase_latest(
-            command=f"venv/bin/python3 demo_showcase.py --case {case_name} --sweep {sweep_key}={','.join(f'{item:g}' for item in values)}",
+            command=command,
             sweep_groups=[sweep_group_from_output(f"{resolved_case}_{sweep_key}", str(root), rows)],
             architecture_summary=(
                 "This standalone sweep exercised the hybrid analog design flow: topology and sizing agents interpret the spec, "
@@ -145,15 +286,250 @@ def run_sweep(case_name: str, sweep_key: str, values: list[float], output_dir: s
         )
 
     print("\n[showcase] Sweep complete.")
-    print(f"comparison_summary: {summary_path}")
-    print(f"comparison_table:   {table_path}")
-    print(f"comparison_plot:    {plot_path}")
+    print(f"comparison_summary: {paths['summary']}")
+    print(f"comparison_table:   {paths['table']}")
+    print(f"comparison_plot:    {paths['plot']}")
     for row in rows:
         print(f"- {row['requested_spec']}: netlist={row['generated_netlist']} report={row['final_report']}")
+
+
+def run_sweep(
+    case_name: str,
+    sweep_key: str,
+    values: list[float],
+    output_dir: str = None,
+    update_latest: bool = True,
+    jobs: int = None,
+    batched: bool = None,
+    reuse_stages: bool = None,
+    resume: bool = False,
+):
+    resolved_case = _resolve_sweep(case_name, sweep_key)
+    root = _sweep_root(output_dir, resolved_case, sweep_key)
+    journal = _open_journal(
+        root,
+        "sweep",
+        {
+            "case_name": case_name,
+            "sweep_key": sweep_key,
+            "values": [float(value) for value in values],
+            "update_latest": update_latest,
+            "batched": batched,
+            "reuse_stages": reuse_stages,
+        },
+        resume,
+    )
+    rows, batched_sweep = _run_sweep_points(
+        resolved_case,
+        sweep_key,
+        values,
+        _sweep_runtime_options(root, reuse_stages),
+        root / "batched",
+        jobs=jobs,
+        batched=batched,
+        journal=journal,
+    )
+    paths = _write_sweep_outputs(root, rows, resolved_case, sweep_key, {"batched_sweep": batched_sweep})
+    command = f"venv/bin/python3 demo_showcase.py --case {case_name} --sweep {sweep_key}={','.join(f'{item:g}' for item in values)}"
+    _publish_sweep(root, rows, resolved_case, sweep_key, paths, command, update_latest)
+    return rows, root
+
+
+def run_adaptive_sweep(
+    case_name: str,
+    sweep_key: str,
+    low: float = None,
+    high: float = None,
+    output_dir: str = None,
+    update_latest: bool = True,
+    jobs: int = None,
+    batched: bool = None,
+    reuse_stages: bool = None,
+    coarse_points: int = DEFAULT_COARSE_POINTS,
+    max_points: int = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    resume: bool = False,
+):
+    """Sweep one parameter between its schema min/max, refining only where the outcome changes."""
+    resolved_case = _resolve_sweep(case_name, sweep_key)
+    param_meta = (get_case_sweep_schema(resolved_case).get("sweep_parameters") or {}).get(sweep_key) or {}
+    low = float(param_meta["min"] if low is None else low)
+    high = float(param_meta["max"] if high is None else high)
+    max_points = max_points or adaptive_point_budget()
+    root = _sweep_root(output_dir, resolved_case, sweep_key, suffix="_adaptive")
+    journal = _open_journal(
+        root,
+        "adaptive",
+        {
+            "case_name": case_name,
+            "sweep_key": sweep_key,
+            "low": low,
+            "high": high,
+            "update_latest": update_latest,
+            "batched": batched,
+            "reuse_stages": reuse_stages,
+            "coarse_points": coarse_points,
+            "max_points": max_points,
+            "tolerance": tolerance,
+        },
+        resume,
+    )
+    runtime_options = _sweep_runtime_options(root, reuse_stages)
+    batched_rounds = []
+
+    def _evaluate(values):
+        round_index = len(batched_rounds)
+        print(f"\n[showcase] Adaptive round {round_index}: {len(values)} point(s) of {resolved_case}.{sweep_key}")
+        rows, batched_sweep = _run_sweep_points(
+            resolved_case,
+            sweep_key,
+            values,
+            runtime_options,
+            root / "batched" / f"round_{round_index:02d}",
+            jobs=jobs,
+            batched=batched,
+            prime_stage_cache=round_index == 0,
+            journal=journal,
+        )
+        batched_rounds.append(batched_sweep)
+        return rows
+
+    result = adaptive_sweep(
+        _evaluate,
+        low,
+        high,
+        coarse_points=coarse_points,
+        max_points=max_points,
+        tolerance=tolerance,
+    )
+    summary = result.summary()
+    paths = _write_sweep_outputs(
+        root,
+        result.rows,
+        resolved_case,
+        sweep_key,
+        {
+            "adaptive_sweep": {**summary, "low": low, "high": high, "tolerance": tolerance},
+            "batched_sweep": batched_rounds if any(batched_rounds) else None,
+        },
+        boundaries=summary["boundaries"],
+    )
+    command = f"venv/bin/python3 demo_showcase.py --case {case_name} --adaptive {sweep_key}={low:g},{high:g}"
+    _publish_sweep(root, result.rows, resolved_case, sweep_key, paths, command, update_latest)
+    print(f"[showcase] Adaptive sweep: {summary['points']} points in {summary['rounds']} rounds ({summary['stop_reason']})")
+    for boundary in summary["boundaries"]:
+        print(f"- boundary near {boundary['estimate']:g}: {boundary['low_status']} -> {boundary['high_status']}")
+    return result.rows, root
+
+
+def run_grid_sweep(
+    case_name: str,
+    ranges: list[tuple[str, list[float]]],
+    method: str = "factorial",
+    samples: int = None,
+    levels: int = 3,
+    seed: int = 0,
+    output_dir: str = None,
+    jobs: int = None,
+    reuse_stages: bool = None,
+    resume: bool = False,
+):
+    """Sample two or more sweep parameters together and run every sample as one design point."""
+    if len(ranges) < 2:
+        raise ValueError("A grid sweep needs at least two parameters; use --sweep or --adaptive for one")
+    params = [name for name, _ in ranges]
+    if len(set(params)) != len(params):
+        raise ValueError(f"Grid parameters must be distinct: {', '.join(params)}")
+    resolved_case = resolve_case(case_name)
+    for name in params:
+        _resolve_sweep(resolved_case, name)
+    parameter_ranges = [ParameterRange.from_schema(resolved_case, name, *bounds) for name, bounds in ranges]
+    design_points = sample_design_space(parameter_ranges, method, count=samples, levels=levels, seed=seed)
+
+    root = _sweep_root(output_dir, resolved_case, "_x_".join(params), suffix=f"_{method}")
+    journal = _open_journal(
+        root,
+        "grid",
+        {
+            "case_name": case_name,
+            "ranges": [[name, list(bounds)] for name, bounds in ranges],
+            "method": method,
+            "samples": samples,
+            "levels": levels,
+            "seed": seed,
+            "reuse_stages": reuse_stages,
+        },
+        resume,
+    )
+    runtime_options = _sweep_runtime_options(root, reuse_stages)
+    points = [
+        (resolved_case, index, assignments, runtime_options)
+        for index, assignments in enumerate(design_points)
+        if _grid_point_key(assignments) not in journal.completed
+    ]
+    jobs = resolve_jobs(jobs if jobs is not None else os.getenv("I13_SWEEP_JOBS", "0"))
+    if len(points) < len(design_points):
+        print(f"\n[showcase] Resuming: {len(design_points) - len(points)} of {len(design_points)} samples already in the journal")
+    print(
+        f"\n[showcase] {method} grid over {', '.join(params)}: {len(points)} samples "
+        f"across {max(1, min(jobs, len(points)))} worker process(es)"
+    )
+
+    def _report_row(index, row):
+        journal.record(_grid_point_key({name: row[name] for name in params}), row)
+        if jobs > 1:
+            print(f"[showcase] Finished sample {row['sample']} ({row['pass_fail']})")
+
+    if runtime_options and jobs > 1 and len(points) > 1:
+        _report_row(0, _run_grid_point(points[0]))
+        run_ordered(_run_grid_point, points[1:], jobs=jobs, on_result=_report_row)
+    else:
+        run_ordered(_run_grid_point, points, jobs=jobs, on_result=_report_row)
+    rows = [journal.completed[_grid_point_key(assignments)] for assignments in design_points]
+
+    sampling = {
+        "method": method,
+        "samples": len(design_points),
+        "levels": levels if method == "factorial" else None,
+        "seed": seed if method == "lhs" else None,
+        "ranges": [{"name": item.name, "low": item.low, "high": item.high, "log_scale": item.log_scale} for item in parameter_ranges],
+    }
+    table = write_columnar_table(
+        root / "grid_results.csv",
+        rows,
+        ["case", "sample", *params, *GRID_RESULT_COLUMNS],
+        numeric_columns=[*params, "measured_result"],
+    )
+    paths = {
+        "summary": root / "grid_summary.md",
+        "plot": root / "grid_plot.png",
+        "index": root / "run_index.json",
+    }
+    write_grid_summary(paths["summary"], rows, resolved_case, sampling)
+    write_grid_plot(paths["plot"], rows, parameter_ranges)
+    paths["index"].write_text(json.dumps({"rows": rows, "grid_sweep": sampling}, indent=2, sort_keys=True) + "\n")
+
+    passed = sum(1 for row in rows if row["pass_fail"] == "PASSED")
+    print(f"\n[showcase] Grid sweep complete: {passed}/{len(rows)} samples passed.")
+    print(f"grid_summary: {paths['summary']}")
+    print(f"grid_results: {table['csv']}" + (f" (+ {table['parquet']})" if table["parquet"] else ""))
+    print(f"grid_plot:    {paths['plot']}")
     return rows, root
 
 
-def run_all_safe(output_dir: str = None, include_sweeps: bool = True):
+def resume_showcase(run_dir: str, jobs: int = None):
+    """Finish an interrupted sweep, adaptive or grid run from the journal in its output folder."""
+    header = RunJournal(run_dir).header()
+    if header is None:
+        raise SystemExit(f"No run journal in {run_dir}; only sweep, adaptive and grid runs can be resumed")
+    runners = {"sweep": run_sweep, "adaptive": run_adaptive_sweep, "grid": run_grid_sweep}
+    if header.get("kind") not in runners:
+        raise SystemExit(f"Unknown run kind '{header.get('kind')}' in {run_dir}")
+    print(f"[showcase] Resuming {header['kind']} run in {run_dir}")
+    return runners[header["kind"]](**header["config"], output_dir=run_dir, jobs=jobs, resume=True)
+
+
+def run_all_safe(output_dir: str = None, include_sweeps: bool = True, jobs: int = None):
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     root = Path(output_dir or Path("artifacts") / "showcase_runs" / "_latest_working" / f"{stamp}_all_safe")
     root.mkdir(parents=True, exist_ok=True)
@@ -181,6 +557,7 @@ def run_all_safe(output_dir: str = None, include_sweeps: bool = True):
                 values,
                 output_dir=str(sweep_dir),
                 update_latest=False,
+                jobs=jobs,
             )
             sweep_groups.append(
                 sweep_group_from_output(
@@ -231,6 +608,8 @@ def write_csv(path: Path, rows: list[dict]):
         "verification_status",
         "overall_verdict",
         "missing_artifacts",
+        "stage_reuse",
+        "adaptive_round",
     ]
     with path.open("w", newline="") as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
@@ -238,7 +617,7 @@ def write_csv(path: Path, rows: list[dict]):
         writer.writerows(rows)
 
 
-def write_summary(path: Path, rows: list[dict], case_name: str, sweep_key: str):
+def write_summary(path: Path, rows: list[dict], case_name: str, sweep_key: str, boundaries: list[dict] = None):
     lines = [
         f"# Showcase Sweep: {case_name}",
         "",
@@ -255,6 +634,15 @@ def write_summary(path: Path, rows: list[dict], case_name: str, sweep_key: str):
             f"| {float(row['requested_spec']):.6g} | {row['measured_metric']}={measured_text} | "
             f"{row['pass_fail']} | {row['backend_used'] or 'n/a'} | `{row['artifact_dir']}` |"
         )
+    if boundaries is not None:
+        lines.extend(["", "## Spec Boundaries", ""])
+        for boundary in boundaries:
+            lines.append(
+                f"- `{sweep_key}` between {boundary['low']:.6g} ({boundary['low_status']}) and "
+                f"{boundary['high']:.6g} ({boundary['high_status']}), estimate {boundary['estimate']:.6g}"
+            )
+        if not boundaries:
+            lines.append("- No pass/fail change inside the swept range.")
     lines.extend(["", "## Component Values", ""])
     for row in rows:
         lines.append(f"- `{sweep_key}={float(row['requested_spec']):.6g}`: {row['component_values'] or 'n/a'}")
@@ -315,14 +703,153 @@ def write_plot(path: Path, rows: list[dict], sweep_key: str):
     plt.close(fig)
 
 
+GRID_RESULT_COLUMNS = ["measured_metric", "measured_result", "pass_fail", "verification_status", "stage_reuse"]
+
+
+def write_grid_summary(path: Path, rows: list[dict], case_name: str, sampling: dict):
+    params = [item["name"] for item in sampling["ranges"]]
+    lines = [
+        f"# Showcase Grid: {case_name}",
+        "",
+        f"- Sampling: `{sampling['method']}`",
+        f"- Samples: {len(rows)}",
+        f"- Passed: {sum(1 for row in rows if row['pass_fail'] == 'PASSED')}",
+    ]
+    for item in sampling["ranges"]:
+        scale = "log" if item["log_scale"] else "linear"
+        lines.append(f"- `{item['name']}`: {item['low']:.6g} .. {item['high']:.6g} ({scale})")
+    lines.extend(
+        [
+            "",
+            "| sample | " + " | ".join(params) + " | measured result | pass/fail |",
+            "|---:|" + "---:|" * len(params) + "---:|---|",
+        ]
+    )
+    for row in rows:
+        measured = row["measured_result"]
+        measured_text = f"{measured:.6g}" if isinstance(measured, float) else str(measured or "n/a")
+        values = " | ".join(f"{float(row[name]):.6g}" for name in params)
+        lines.append(f"| {row['sample']} | {values} | {row['measured_metric']}={measured_text} | {row['pass_fail']} |")
+    path.write_text("\n".join(lines) + "\n")
+
+
+def write_grid_plot(path: Path, rows: list[dict], ranges: list):
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except Exception:
+        path.write_text("matplotlib unavailable; grid plot not generated\n")
+        return
+    measured = [row for row in rows if row["measured_result"] != ""]
+    pairs = [(x, y) for index, x in enumerate(ranges) for y in ranges[index + 1 :]]
+    fig, axes = plt.subplots(1, len(pairs), figsize=(6 * len(pairs), 4.8), squeeze=False)
+    for ax, (x_range, y_range) in zip(axes[0], pairs):
+        # Wide ranges are sampled log-uniformly; plot (and interpolate) them in decades too.
+        xs = [_grid_coordinate(row, x_range) for row in measured]
+        ys = [_grid_coordinate(row, y_range) for row in measured]
+        zs = [float(row["measured_result"]) for row in measured]
+        mesh = None
+        if len(ranges) == 2 and len(set(xs)) * len(set(ys)) == len(zs) and len(zs) > 1:
+            # A complete factorial grid: draw cells rather than interpolating.
+            x_levels, y_levels = sorted(set(xs)), sorted(set(ys))
+            grid = [[float("nan")] * len(x_levels) for _ in y_levels]
+            for x, y, z in zip(xs, ys, zs):
+                grid[y_levels.index(y)][x_levels.index(x)] = z
+            mesh = ax.pcolormesh(x_levels, y_levels, grid, shading="nearest", cmap="viridis")
+        elif len(zs) >= 3:
+            try:
+                mesh = ax.tricontourf(xs, ys, zs, levels=12, cmap="viridis")
+            except (ValueError, RuntimeError):
+                # Collinear or too few distinct samples to triangulate.
+                mesh = None
+        if mesh is not None:
+            fig.colorbar(mesh, ax=ax, label=(measured[0].get("measured_metric") or "measured result"))
+        for passed, marker, color, label in ((True, "o", "white", "pass"), (False, "X", "red", "fail / partial")):
+            chosen = [row for row in rows if (row["pass_fail"] == "PASSED") == passed]
+            if chosen:
+                ax.scatter(
+                    [_grid_coordinate(row, x_range) for row in chosen],
+                    [_grid_coordinate(row, y_range) for row in chosen],
+                    marker=marker,
+                    c=color,
+                    edgecolors="black",
+                    linewidths=0.8,
+                    label=label,
+                )
+        ax.set_xlabel(f"log10({x_range.name})" if x_range.log_scale else x_range.name)
+        ax.set_ylabel(f"log10({y_range.name})" if y_range.log_scale else y_range.name)
+        ax.legend(loc="best", fontsize=8)
+    fig.suptitle("Measured result across the design space" if measured else "No measured results; pass/fail only")
+    fig.tight_layout()
+    fig.savefig(path, dpi=160)
+    plt.close(fig)
+
+
+def _grid_coordinate(row: dict, parameter) -> float:
+    value = float(row[parameter.name])
+    return math.log10(value) if parameter.log_scale else value
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run a live parameter sweep showcase demo")
     parser.add_argument("--all-safe", action="store_true", help="Generate the canonical sponsor-safe latest artifact bundle")
     parser.add_argument("--case", help="Demo case, e.g. rc_lowpass, common_source, mos_buffer")
     parser.add_argument("--sweep", type=parse_sweep, help="Parameter sweep, e.g. target_fc_hz=500,1000,5000")
+    parser.add_argument(
+        "--adaptive",
+        type=parse_adaptive,
+        help="Adaptive sweep between the schema min/max (or name=low,high), refined around pass/fail changes",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=None,
+        help="With --adaptive, maximum number of points (default: I13_ADAPTIVE_BUDGET or 25)",
+    )
+    parser.add_argument(
+        "--grid",
+        type=parse_adaptive,
+        action="append",
+        help="Grid-sweep parameter (repeat for each axis), name or name=low,high within the schema bounds",
+    )
+    parser.add_argument(
+        "--sampling",
+        choices=SAMPLING_METHODS,
+        default="factorial",
+        help="With --grid, how to sample the design space (default: factorial)",
+    )
+    parser.add_argument("--samples", type=int, default=None, help="With --grid and lhs/sobol sampling, number of samples (default: 16)")
+    parser.add_argument("--levels", type=int, default=3, help="With --grid and factorial sampling, values per parameter (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="With --grid and lhs sampling, random seed (default: 0)")
     parser.add_argument("--output-dir", help="Directory for comparison_summary/table/plot")
+    parser.add_argument(
+        "--resume",
+        metavar="DIR",
+        help="Finish an interrupted sweep/adaptive/grid run from the journal in its output folder",
+    )
     parser.add_argument("--list-cases", action="store_true", help="Print available cases before running")
     parser.add_argument("--no-sweeps", action="store_true", help="With --all-safe, skip parameter sweeps")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for sweep points (default: I13_SWEEP_JOBS or 1; 0 uses every CPU core)",
+    )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        default=None,
+        help="Simulate natively batchable sweeps in one ngspice run (default: I13_SWEEP_BATCHED)",
+    )
+    parser.add_argument(
+        "--no-stage-reuse",
+        dest="reuse_stages",
+        action="store_false",
+        default=None,
+        help="Re-run topology selection for every sweep point (default: reuse unless I13_SWEEP_REUSE=0)",
+    )
     args = parser.parse_args()
     if args.list_cases:
         for item in list_demo_cases():
@@ -331,15 +858,44 @@ def main():
                 f"{item['key']}: {item['display_name']} "
                 f"(readiness={item.get('readiness')}, sweeps={','.join(params) if params else 'none'})"
             )
-        if not args.all_safe and not (args.case and args.sweep):
+        if not args.all_safe and not args.resume and not (args.case and (args.sweep or args.adaptive or args.grid)):
             return
+    if args.resume:
+        resume_showcase(args.resume, jobs=args.jobs)
+        return
     if args.all_safe:
-        run_all_safe(output_dir=args.output_dir, include_sweeps=not args.no_sweeps)
+        run_all_safe(output_dir=args.output_dir, include_sweeps=not args.no_sweeps, jobs=args.jobs)
+        return
+    if args.case and args.grid:
+        run_grid_sweep(
+            args.case,
+            args.grid,
+            method=args.sampling,
+            samples=args.samples,
+            levels=args.levels,
+            seed=args.seed,
+            output_dir=args.output_dir,
+            jobs=args.jobs,
+            reuse_stages=args.reuse_stages,
+        )
+        return
+    if args.case and args.adaptive:
+        sweep_key, bounds = args.adaptive
+        run_adaptive_sweep(
+            args.case,
+            sweep_key,
+            *bounds,
+            output_dir=args.output_dir,
+            jobs=args.jobs,
+            batched=args.batched,
+            reuse_stages=args.reuse_stages,
+            max_points=args.budget,
+        )
         return
     if not args.case or not args.sweep:
-        parser.error("--case and --sweep are required unless --all-safe is used")
+        parser.error("--case and --sweep (or --adaptive / --grid) are required unless --all-safe is used")
     sweep_key, values = args.sweep
-    run_sweep(args.case, sweep_key, values, output_dir=args.output_dir)
+    run_sweep(args.case, sweep_key, values, output_dir=args.output_dir, jobs=args.jobs, batched=args.batched, reuse_stages=args.reuse_stages)
 
 
 if __name__ == "__main__":
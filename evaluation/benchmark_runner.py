@@ -1,3 +1,4 @@
+import argparse
 import json
 import math
 import os
@@ -9,9 +10,15 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
+from core.async_llm import run_with_shared_llm
 from core.demo_catalog import get_demo_case, get_demo_profile, list_demo_cases, resolve_case_name, slugify_label
+from core.parallel_executor import resolve_jobs, run_ordered
+from core.run_journal import RunJournal
+from core.shared_memory import iter_history
 from main import build_llm, run_case
 
+_WORKER_LLM = {}
+
 
 def pass_at_k(total_samples: int, successful_samples: int, k: int) -> float:
     n = max(0, int(total_samples))
@@ -93,14 +100,50 @@ def _sample_override(case: dict, sample_idx: int, jitter: bool):
     return override
 
 
+def _worker_llm():
+    # One client per process: the serial path builds it once, pool workers each build their own.
+    if "llm" not in _WORKER_LLM:
+        _WORKER_LLM["llm"] = build_llm().llm
+    return _WORKER_LLM["llm"]
+
+
+def _cpu_seconds():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _run_benchmark_sample(task):
+    return _benchmark_sample(task, _worker_llm(), _cpu_seconds)
+
+
+def _run_threaded_benchmark_sample(task, llm):
+    # Process CPU counters are shared by the concurrent samples; count this thread's own time.
+    return _benchmark_sample(task, llm, time.thread_time)
+
+
+def _benchmark_sample(task, llm, cpu_clock):
+    case_name, sample_idx, jitter = task
+    case = get_demo_case(case_name)
+    override = _sample_override(case, sample_idx, jitter=jitter)
+    start = time.time()
+    cpu_start = cpu_clock()
+    final_state = run_case(case_name, case_override=override, llm_override=llm)
+    duration_s = time.time() - start
+    record = _sample_record(case_name, final_state, duration_s)
+    record["sample_index"] = sample_idx
+    record["cpu_time_s"] = cpu_clock() - cpu_start
+    return record
+
+
 def _sample_record(case_name: str, final_state: dict, duration_s: float):
     sim = final_state.get("simulation_results") or {}
     verification = sim.get("verification_summary") or {}
-    history = final_state.get("history") or []
-    llm_calls = [item for item in history if item.get("event") == "llm_call"]
+    llm_calls = [item for item in iter_history(final_state) if item.get("event") == "llm_call"]
     llm_calls_ok = 0
     llm_calls_by_agent = {}
     llm_calls_by_task = {}
+    llm_cache_hits = 0
+    llm_cache_misses = 0
     for call in llm_calls:
         payload = call.get("data") or {}
         agent = payload.get("agent") or "unknown_agent"
@@ -109,6 +152,8 @@ def _sample_record(case_name: str, final_state: dict, duration_s: float):
         llm_calls_by_task[task] = llm_calls_by_task.get(task, 0) + 1
         if payload.get("ok") is True:
             llm_calls_ok += 1
+        llm_cache_hits += int(payload.get("cache_hits") or 0)
+        llm_cache_misses += int(payload.get("cache_misses") or 0)
 
     known_checks = verification.get("known_checks") or 0
     passes = verification.get("passes") or 0
@@ -152,11 +197,15 @@ def _sample_record(case_name: str, final_state: dict, duration_s: float):
             "oscillation_hz": sim.get("oscillation_hz"),
         },
         "plot_validation_summary": sim.get("plot_validation_summary"),
+        "simulation_cached": sim.get("simulation_cached"),
+        "simulation_time_s": sim.get("simulation_time_s"),
         "llm_call_count": len(llm_calls),
         "llm_call_success_count": llm_calls_ok,
         "llm_call_success_rate": (llm_calls_ok / len(llm_calls)) if llm_calls else None,
         "llm_calls_by_agent": llm_calls_by_agent,
         "llm_calls_by_task": llm_calls_by_task,
+        "llm_cache_hits": llm_cache_hits,
+        "llm_cache_misses": llm_cache_misses,
         "composite": {
             "stage_count_match": netlist_stage_report.get("stage_count_match"),
             "topology_order_match": netlist_stage_report.get("topology_order_match"),
@@ -200,6 +249,7 @@ def _aggregate_case(case_name: str, samples: list, ks: list):
         if item.get("composite", {}).get("topology_order_match") is not None
     ]
     first_pass_successes = sum(1 for item in samples if item.get("converged_first_pass"))
+    simulated = [item for item in samples if item.get("simulation_cached") is not None]
 
     case_summary = {
         "case": case_name,
@@ -215,6 +265,10 @@ def _aggregate_case(case_name: str, samples: list, ks: list):
         "avg_llm_success_rate": _mean(llm_success_rates),
         "composite_stage_count_match_rate": _mean(stage_count_match_rates),
         "composite_stage_order_match_rate": _mean(stage_order_match_rates),
+        "simulation_cache_hit_rate": _mean(1.0 if item.get("simulation_cached") else 0.0 for item in simulated),
+        "avg_uncached_simulation_s": _mean(
+            item.get("simulation_time_s") for item in simulated if not item.get("simulation_cached")
+        ),
         "pass_at_k": {f"k={k}": pass_at_k(total, successes, k) for k in ks},
     }
 
@@ -250,48 +304,92 @@ def _aggregate_overall(case_summaries: list, ks: list):
     return overall
 
 
-def run_benchmark():
-    cases = _selected_cases()
-    if not cases:
-        raise SystemExit("No benchmark cases selected. Set BENCH_CASES or BENCH_PROFILE.")
-
-    samples_per_case = max(1, int(os.getenv("BENCH_SAMPLES", "5")))
-    ks = _parse_ks(os.getenv("BENCH_KS", "1,3,5"))
-    jitter = os.getenv("BENCH_PROMPT_JITTER", "0").strip() == "1"
+def _sample_key(case_name: str, sample_idx: int) -> str:
+    return f"{case_name}#{sample_idx}"
 
-    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    case_slug = slugify_label("-".join(cases[:3]))
-    out_dir = os.path.join("artifacts", "benchmarks", f"{stamp}_n{samples_per_case}_{case_slug}")
-    os.makedirs(out_dir, exist_ok=True)
 
-    llm = build_llm()
-    benchmark_samples = {}
-    case_summaries = []
+def run_benchmark(resume_dir: str = None):
+    """Run every selected case BENCH_SAMPLES times, journaling each sample, and write benchmark_summary.json/.md."""
+    if resume_dir:
+        journal = RunJournal.resume(resume_dir, "benchmark")
+        config = journal.header()["config"]
+        cases, samples_per_case, ks, jitter, stamp = (
+            config["cases"],
+            config["samples_per_case"],
+            config["ks"],
+            config["prompt_jitter"],
+            config["timestamp"],
+        )
+        out_dir = resume_dir
+    else:
+        cases = _selected_cases()
+        if not cases:
+            raise SystemExit("No benchmark cases selected. Set BENCH_CASES or BENCH_PROFILE.")
+
+        samples_per_case = max(1, int(os.getenv("BENCH_SAMPLES", "5")))
+        ks = _parse_ks(os.getenv("BENCH_KS", "1,3,5"))
+        jitter = os.getenv("BENCH_PROMPT_JITTER", "0").strip() == "1"
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        case_slug = slugify_label("-".join(cases[:3]))
+        out_dir = os.path.join("artifacts", "benchmarks", f"{stamp}_n{samples_per_case}_{case_slug}")
+        journal = RunJournal.start(
+            out_dir,
+            "benchmark",
+            {"cases": cases, "samples_per_case": samples_per_case, "ks": ks, "prompt_jitter": jitter, "timestamp": stamp},
+        )
 
+    workers = resolve_jobs(os.getenv("BENCH_WORKERS", "1"))
+    shared_llm = os.getenv("BENCH_ASYNC_LLM", "0").strip() == "1"
+    all_tasks = [(case_name, sample_idx, jitter) for case_name in cases for sample_idx in range(samples_per_case)]
+    tasks = [task for task in all_tasks if _sample_key(task[0], task[1]) not in journal.completed]
+    resumed_samples = len(all_tasks) - len(tasks)
     for case_name in cases:
-        case = get_demo_case(case_name)
-        records = []
         print(f"[Benchmark] {case_name}: {samples_per_case} samples")
-        for sample_idx in range(samples_per_case):
-            override = _sample_override(case, sample_idx, jitter=jitter)
-            start = time.time()
-            final_state = run_case(case_name, case_override=override, llm_override=llm)
-            duration_s = time.time() - start
-            record = _sample_record(case_name, final_state, duration_s)
-            record["sample_index"] = sample_idx
-            records.append(record)
-            status = record.get("status")
-            ok = "PASS" if record.get("success") else "FAIL"
-            print(
-                f"  - sample {sample_idx + 1}/{samples_per_case}: "
-                f"{ok} status={status} topology={record.get('topology')} "
-                f"runtime={duration_s:.2f}s"
-            )
+    if resumed_samples:
+        print(f"[Benchmark] Resuming {out_dir}: {resumed_samples} of {len(all_tasks)} samples already in the journal")
+    if shared_llm:
+        print(f"[Benchmark] Running up to {workers} samples at once on threads sharing one bounded LLM client")
+    elif workers > 1:
+        print(f"[Benchmark] Scheduling {len(tasks)} samples across {max(1, min(workers, len(tasks)))} worker processes")
+
+    def _report_sample(index, record):
+        journal.record(_sample_key(record["case"], record["sample_index"]), record)
+        ok = "PASS" if record.get("success") else "FAIL"
+        print(
+            f"  - {record['case']} sample {record['sample_index'] + 1}/{samples_per_case}: "
+            f"{ok} status={record.get('status')} topology={record.get('topology')} "
+            f"runtime={record['duration_s']:.2f}s cpu={record['cpu_time_s']:.2f}s"
+        )
 
-        benchmark_samples[case_name] = records
-        case_summaries.append(_aggregate_case(case_name, records, ks=ks))
+    wall_start = time.time()
+    if shared_llm:
+        run_with_shared_llm(
+            _run_threaded_benchmark_sample,
+            tasks,
+            build_llm().llm,
+            max_parallel_runs=workers,
+            on_result=_report_sample,
+        )
+    else:
+        run_ordered(_run_benchmark_sample, tasks, jobs=workers, on_result=_report_sample)
+    wall_clock_s = time.time() - wall_start
+    records = [journal.completed[_sample_key(case_name, sample_idx)] for case_name, sample_idx, _ in all_tasks]
+
+    benchmark_samples = {}
+    case_summaries = []
+    for case_name in cases:
+        case_records = sorted(
+            (item for item in records if item["case"] == case_name),
+            key=lambda item: item["sample_index"],
+        )
+        benchmark_samples[case_name] = case_records
+        case_summaries.append(_aggregate_case(case_name, case_records, ks=ks))
 
     overall = _aggregate_overall(case_summaries, ks=ks)
+    overall["wall_clock_s"] = wall_clock_s
+    overall["summed_sample_runtime_s"] = sum(float(item.get("duration_s") or 0.0) for item in records)
+    overall["summed_cpu_time_s"] = sum(float(item.get("cpu_time_s") or 0.0) for item in records)
 
     report = {
         "config": {
@@ -299,7 +397,10 @@ def run_benchmark():
             "samples_per_case": samples_per_case,
             "ks": ks,
             "prompt_jitter": jitter,
+            "workers": workers,
+            "shared_llm": shared_llm,
             "timestamp": stamp,
+            "resumed_samples": resumed_samples,
         },
         "overall": overall,
         "case_summaries": case_summaries,
@@ -313,6 +414,12 @@ def run_benchmark():
         handle.write("# Benchmark Summary\n\n")
         handle.write(f"- Cases: {', '.join(cases)}\n")
         handle.write(f"- Samples per case: {samples_per_case}\n")
+        handle.write(f"- Workers: {workers}{' (threads sharing one LLM client)' if shared_llm else ''}\n")
+        if resumed_samples:
+            handle.write(f"- Resumed from journal: {resumed_samples} samples (wall-clock covers the rest)\n")
+        handle.write(f"- Wall-clock time: {overall['wall_clock_s']:.2f}s\n")
+        handle.write(f"- Summed sample runtime: {overall['summed_sample_runtime_s']:.2f}s\n")
+        handle.write(f"- Summed CPU time: {overall['summed_cpu_time_s']:.2f}s\n")
         handle.write(f"- Overall sample success rate: {overall['sample_success_rate']:.3f}\n")
         if overall.get("first_pass_success_rate") is not None:
             handle.write(f"- Overall first-pass success rate: {overall['first_pass_success_rate']:.3f}\n")
@@ -351,13 +458,20 @@ def run_benchmark():
                 handle.write(
                     f"- Composite stage-order match-rate: {item['composite_stage_order_match_rate']:.3f}\n"
                 )
+            if item.get("simulation_cache_hit_rate") is not None:
+                handle.write(f"- Simulation cache hit-rate: {item['simulation_cache_hit_rate']:.3f}\n")
+            if item.get("avg_uncached_simulation_s") is not None:
+                handle.write(f"- Avg uncached simulation time: {item['avg_uncached_simulation_s']:.2f}s\n")
             handle.write(f"- Avg runtime: {item.get('avg_runtime_s', 0.0):.2f}s\n\n")
 
     print(f"Wrote benchmark artifacts to {out_dir}")
 
 
 def main():
-    run_benchmark()
+    parser = argparse.ArgumentParser(description="Benchmark the design flow over demo cases (configured via BENCH_* env vars)")
+    parser.add_argument("--resume", metavar="DIR", help="Finish an interrupted benchmark from the journal in its output folder")
+    args = parser.parse_args()
+    run_benchmark(resume_dir=args.resume)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from core.demo_catalog import get_demo_case, list_demo_cases
+from core.reference_knowledge import DEFAULT_REFERENCE_ROOTS, ReferenceCatalog
+
+
+def benchmark_queries():
+    """One filtered and one free-text query per demo case, mirroring what TopologyAgent/SizingAgent ask."""
+    queries = []
+    for item in list_demo_cases():
+        case = get_demo_case(item["key"])
+        specification = case.get("specification") or item.get("display_name") or item["key"]
+        topology = case.get("forced_topology") or item.get("forced_topology")
+        queries.append({"case": item["key"], "query": specification, "topologies": []})
+        if topology:
+            queries.append({"case": item["key"], "query": specification, "topologies": [topology]})
+    return queries
+
+
+def _time_ranker(rank, queries, repeats, limit):
+    results = []
+    start = time.perf_counter()
+    for _ in range(repeats):
+        results = [rank(item["query"], item["topologies"], limit) for item in queries]
+    elapsed = time.perf_counter() - start
+    return results, elapsed / max(1, repeats * len(queries))
+
+
+def compare_rankings(catalog: ReferenceCatalog, queries, k: int = 5, repeats: int = 20):
+    def linear(query, topologies, limit):
+        return [hit["id"] for hit in catalog._search_linear(query, topologies=topologies, limit=limit)]
+
+    def legacy_indexed(query, topologies, limit):
+        return [entry.ref_id for _, _, entry in catalog._rank(query, topologies, None, None, None, limit)]
+
+    def bm25f(query, topologies, limit):
+        return [entry.ref_id for _, _, entry in catalog._rank_bm25f(query, topologies, None, None, None, limit)]
+
+    linear_hits, linear_s = _time_ranker(linear, queries, repeats, k)
+    indexed_hits, indexed_s = _time_ranker(legacy_indexed, queries, repeats, k)
+    bm25f_hits, bm25f_s = _time_ranker(bm25f, queries, repeats, k)
+
+    per_query = []
+    for item, legacy, ranked in zip(queries, linear_hits, bm25f_hits):
+        overlap = len(set(legacy) & set(ranked)) / max(1, min(k, max(len(legacy), len(ranked))))
+        per_query.append(
+            {
+                **item,
+                "legacy_top_k": legacy,
+                "bm25f_top_k": ranked,
+                "top1_agree": bool(legacy[:1] == ranked[:1]),
+                "overlap_at_k": overlap,
+            }
+        )
+
+    return {
+        "entry_count": len(catalog.entries),
+        "query_count": len(queries),
+        "k": k,
+        "repeats": repeats,
+        "latency_ms": {
+            "legacy_linear": linear_s * 1e3,
+            "legacy_indexed": indexed_s * 1e3,
+            "bm25f": bm25f_s * 1e3,
+        },
+        "legacy_indexed_matches_linear": indexed_hits == linear_hits,
+        "top1_agreement": sum(item["top1_agree"] for item in per_query) / max(1, len(per_query)),
+        "mean_overlap_at_k": sum(item["overlap_at_k"] for item in per_query) / max(1, len(per_query)),
+        "queries": per_query,
+    }
+
+
+def main():
+    k = max(1, int(os.getenv("REF_BENCH_K", "5")))
+    repeats = max(1, int(os.getenv("REF_BENCH_REPEATS", "20")))
+    catalog = ReferenceCatalog.from_paths(list(DEFAULT_REFERENCE_ROOTS))
+    report = compare_rankings(catalog, benchmark_queries(), k=k, repeats=repeats)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    out_dir = os.path.join("artifacts", "benchmarks", "reference_ranking", stamp)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "reference_ranking_summary.json"), "w") as handle:
+        json.dump(report, handle, indent=2)
+
+    latency = report["latency_ms"]
+    with open(os.path.join(out_dir, "reference_ranking_summary.md"), "w") as handle:
+        handle.write("# Reference Ranking Benchmark\n\n")
+        handle.write(f"- Catalog entries: {report['entry_count']}\n")
+        handle.write(f"- Queries: {report['query_count']} (k={k}, repeats={repeats})\n")
+        handle.write(f"- Legacy linear scan: {latency['legacy_linear']:.4f} ms/query\n")
+        handle.write(f"- Legacy indexed: {latency['legacy_indexed']:.4f} ms/query\n")
+        handle.write(f"- BM25F: {latency['bm25f']:.4f} ms/query\n")
+        handle.write(f"- Indexed legacy identical to linear scan: {report['legacy_indexed_matches_linear']}\n")
+        handle.write(f"- Top-1 agreement (BM25F vs legacy): {report['top1_agreement']:.3f}\n")
+        handle.write(f"- Mean overlap@{k} (BM25F vs legacy): {report['mean_overlap_at_k']:.3f}\n")
+
+    print(
+        f"[RefBench] linear={latency['legacy_linear']:.4f}ms indexed={latency['legacy_indexed']:.4f}ms "
+        f"bm25f={latency['bm25f']:.4f}ms top1={report['top1_agreement']:.3f} "
+        f"overlap@{k}={report['mean_overlap_at_k']:.3f}"
+    )
+    print(f"Wrote reference ranking benchmark to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
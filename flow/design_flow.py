@@ -1,7 +1,10 @@
 # I13/flow/design_flow.py
 
 from agents.design_status import DesignStatus
-from flow.pocketflow import Flow, Node
+from agents.schematic_agent import SchematicAgent
+from core.schematic_artifacts import default_schematic_queue, schematic_render_mode
+from core.verification_pipeline import attach_schematic_artifacts
+from flow.pocketflow import Flow, Node, ParallelNode
 
 
 class FinalizeNode(Node):
@@ -22,6 +25,34 @@ class FailNode(Node):
         return "failed"
 
 
+class SimulationSetupNode(Node):
+    """Prepares the attempt directory and generated.sp that both simulation branches work from."""
+
+    def __init__(self, simulation_agent):
+        super().__init__()
+        self.simulation_agent = simulation_agent
+
+    def prep(self, shared):
+        return shared
+
+    def exec(self, prep_res):
+        return self.simulation_agent.prepare_attempt(prep_res)
+
+    def post(self, shared, prep_res, exec_res):
+        return "default"
+
+
+class SchematicJoinNode(Node):
+    """Folds the schematic branch's output into simulation_results once both branches are done."""
+
+    def post(self, shared, prep_res, exec_res):
+        sim = shared.read("simulation_results") or {}
+        schematic = shared.read("schematic_artifacts") or {}
+        if sim.get("schematic_status") == "pending" and schematic.get("attempt_dir") == sim.get("artifact_dir"):
+            shared.write("simulation_results", attach_schematic_artifacts(dict(sim), schematic))
+        return shared.read("status")
+
+
 class RetryGateNode(Node):
     def prep(self, shared):
         return {"iteration": shared.read("iteration", 0)}
@@ -49,7 +80,9 @@ def build_design_flow(
     simulation_agent,
     refinement_agent,
     max_iterations=3,
+    schematic_render=None,
 ):
+    schematic_render = schematic_render or schematic_render_mode()
     finalize = FinalizeNode()
     fail = FailNode()
     retry_gate = RetryGateNode()
@@ -69,12 +102,31 @@ def build_design_flow(
     netlist_agent - DesignStatus.NETLIST_GENERATED >> op_point_agent
     netlist_agent - DesignStatus.NETLIST_FAILED >> fail
 
-    op_point_agent - DesignStatus.OP_SIZING_COMPLETE >> simulation_agent
     op_point_agent - DesignStatus.OP_SIZING_REFINED >> constraint_agent
     op_point_agent - DesignStatus.OP_SIZING_FAILED >> fail
 
-    simulation_agent - DesignStatus.SIMULATION_COMPLETE >> refinement_agent
-    simulation_agent - DesignStatus.SIMULATION_FAILED >> fail
+    # The flow decides where schematics are rendered; see schematic_render_mode().
+    simulation_agent.schematic_queue = default_schematic_queue() if schematic_render == "queue" else None
+    simulation_agent.render_schematic = schematic_render != "parallel"
+
+    if schematic_render == "parallel":
+        simulation_setup = SimulationSetupNode(simulation_agent)
+        simulation_stage = ParallelNode(
+            [simulation_agent, SchematicAgent(reference_catalog=simulation_agent.reference_catalog)],
+            primary=0,
+        )
+        schematic_join = SchematicJoinNode()
+
+        op_point_agent - DesignStatus.OP_SIZING_COMPLETE >> simulation_setup
+        simulation_setup >> simulation_stage
+        simulation_stage - DesignStatus.SIMULATION_COMPLETE >> schematic_join
+        simulation_stage - DesignStatus.SIMULATION_FAILED >> schematic_join
+        schematic_join - DesignStatus.SIMULATION_COMPLETE >> refinement_agent
+        schematic_join - DesignStatus.SIMULATION_FAILED >> fail
+    else:
+        op_point_agent - DesignStatus.OP_SIZING_COMPLETE >> simulation_agent
+        simulation_agent - DesignStatus.SIMULATION_COMPLETE >> refinement_agent
+        simulation_agent - DesignStatus.SIMULATION_FAILED >> fail
 
     refinement_agent - DesignStatus.REFINED >> retry_gate
     refinement_agent - DesignStatus.REFINEMENT_NO_CHANGE >> finalize
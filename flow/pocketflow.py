@@ -1,9 +1,13 @@
 # I13/core/pocketflow.py
 
 import asyncio
+import contextvars
 import warnings
 import copy
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from core.stage_timing import NODE_TIMING_EVENT, NodeMeasurement, flow_clock, stage_timing_enabled
 
 
 class BaseNode:
@@ -94,12 +98,31 @@ class Flow(BaseNode):
 
     def _orch(self, shared, params=None):
         curr, p, last_action = copy.copy(self.start_node), (params or {**self.params}), None
-        while curr:
-            curr.set_params(p)
-            last_action = curr._run(shared)
-            curr = copy.copy(self.get_next_node(curr, last_action))
+        timed = stage_timing_enabled()
+        with flow_clock() as origin:
+            while curr:
+                curr.set_params(p)
+                last_action = self._run_timed(curr, shared, origin) if timed else curr._run(shared)
+                curr = copy.copy(self.get_next_node(curr, last_action))
         return last_action
 
+    def _run_timed(self, node, shared, origin):
+        read = getattr(shared, "read", None)
+        iteration = read("iteration") if callable(read) else None
+        with NodeMeasurement(type(node).__name__, origin, iteration) as measurement:
+            try:
+                action = node._run(shared)
+            except Exception as exc:
+                self._record_timing(shared, measurement.finish(retries=getattr(node, "cur_retry", 0), error=repr(exc)))
+                raise
+            self._record_timing(shared, measurement.finish(action, retries=getattr(node, "cur_retry", 0)))
+        return action
+
+    def _record_timing(self, shared, timing):
+        append_history = getattr(shared, "append_history", None)
+        if callable(append_history):
+            append_history(NODE_TIMING_EVENT, timing.to_dict())
+
     def _run(self, shared):
         p = self.prep(shared)
         o = self._orch(shared)
@@ -107,3 +130,156 @@ class Flow(BaseNode):
 
     def post(self, shared, prep_res, exec_res):
         return exec_res
+
+
+class BranchState:
+    """Write-buffering view of the shared state for one parallel branch, replayed by ParallelNode."""
+
+    def __init__(self, parent):
+        self._parent = parent
+        self.writes = {}
+        self.ops = []
+
+    def read(self, key, default=None):
+        if key in self.writes:
+            return self.writes[key]
+        if hasattr(self._parent, "read"):
+            return self._parent.read(key, default)
+        return self._parent.get(key, default)
+
+    def write(self, key, value):
+        self.writes[key] = value
+        self.ops.append(("write", key, value))
+
+    def update(self, data):
+        for key, value in data.items():
+            self.write(key, value)
+
+    def append_history(self, event, data):
+        self.ops.append(("event", event, copy.deepcopy(data)))
+
+    def increment_iteration(self):
+        raise RuntimeError("Parallel branches cannot advance the iteration counter")
+
+    # dict-style access for flows whose shared state is a plain dict
+    get = read
+    __setitem__ = write
+
+    def __getitem__(self, key):
+        marker = object()
+        value = self.read(key, marker)
+        if value is marker:
+            raise KeyError(key)
+        return value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._parent, name)
+
+
+def _run_branch(node, shared, params, index, origin):
+    node.set_params(params)
+    if not stage_timing_enabled():
+        return node._run(shared)
+    with flow_clock(origin) as origin:
+        with NodeMeasurement(type(node).__name__, origin, shared.read("iteration"), branch=index) as measurement:
+            try:
+                action = node._run(shared)
+            except Exception as exc:
+                shared.append_history(NODE_TIMING_EVENT, measurement.finish(error=repr(exc)).to_dict())
+                raise
+            shared.append_history(NODE_TIMING_EVENT, measurement.finish(action).to_dict())
+    return action
+
+
+def _run_branch_in_process(node, state, params, index, origin):
+    shared = BranchState(state)
+    action = _run_branch(node, shared, params, index, origin)
+    # Only the logged writes/events travel back to the parent process.
+    shared._parent = {}
+    return action, shared
+
+
+class ParallelNode(BaseNode):
+    """Fan-out/join node: runs branches concurrently on threads or processes, then merges in branch order."""
+
+    def __init__(self, branches, primary=0, backend="thread", max_workers=None):
+        super().__init__()
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown parallel backend '{backend}'")
+        self.branches = list(branches)
+        self.primary = primary
+        self.backend = backend
+        self.max_workers = max_workers or len(self.branches)
+
+    def _run(self, shared):
+        p = self.prep(shared)
+        with flow_clock() as origin:
+            if self.backend == "process":
+                outcomes = self._fan_out_processes(shared, origin)
+            else:
+                outcomes = self._fan_out_threads(shared, origin)
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if errors:
+            raise errors[0]
+        actions = [action for action, _ in outcomes]
+        self._merge(shared, [view for _, view in outcomes])
+        return self.post(shared, p, actions)
+
+    def _fan_out_threads(self, shared, origin):
+        views = [BranchState(shared) for _ in self.branches]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="i13-branch") as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    _run_branch,
+                    copy.copy(node),
+                    view,
+                    self.params,
+                    index,
+                    origin,
+                )
+                for index, (node, view) in enumerate(zip(self.branches, views))
+            ]
+        return [_outcome(future, view) for future, view in zip(futures, views)]
+
+    def _fan_out_processes(self, shared, origin):
+        if hasattr(shared, "snapshot"):
+            state = shared.snapshot().to_dict()
+        else:
+            state = dict(shared)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(_run_branch_in_process, node, state, self.params, index, origin)
+                for index, node in enumerate(self.branches)
+            ]
+        outcomes = []
+        for future in futures:
+            exc = future.exception()
+            outcomes.append(exc if exc is not None else future.result())
+        return outcomes
+
+    def _merge(self, shared, views):
+        owners = {}
+        for index, view in enumerate(views):
+            for key in view.writes:
+                if key in owners:
+                    warnings.warn(f"Parallel branches {owners[key]} and {index} both wrote '{key}'; keeping branch {index}")
+                owners[key] = index
+            for kind, name, value in view.ops:
+                if kind == "event":
+                    if hasattr(shared, "append_history"):
+                        shared.append_history(name, value)
+                elif hasattr(shared, "write"):
+                    shared.write(name, value)
+                else:
+                    shared[name] = value
+
+    def post(self, shared, prep_res, exec_res):
+        return exec_res[self.primary]
+
+
+def _outcome(future, view):
+    exc = future.exception()
+    return exc if exc is not None else (future.result(), view)
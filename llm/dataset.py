@@ -1,7 +1,8 @@
 #I13/llm/dataset.py
 
-import torch
-from torch.utils.data import Dataset
+from core.lazy_imports import lazy_import
+
+torch = lazy_import("torch")
 
 def load_spice_dataset(folder, max_files=200):
     """
@@ -29,7 +30,8 @@ def load_spice_dataset(folder, max_files=200):
 
     return text
 
-class CircuitDataset(Dataset):
+# Map-style (__len__/__getitem__), so DataLoader takes it without torch's Dataset base.
+class CircuitDataset:
     """
     Dataset for training a language model.
 
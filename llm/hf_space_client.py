@@ -0,0 +1,102 @@
+# I13/llm/hf_space_client.py
+
+import os
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+
+
+DEFAULT_HF_TIMEOUT_S = 120.0
+# Tried in this order until one works; None means the Space's default endpoint.
+API_NAME_VARIANTS = ("/predict", None)
+
+
+def resolve_hf_timeout(value=None) -> float:
+    raw = value if value is not None else os.getenv("HF_NETLIST_TIMEOUT_S", str(DEFAULT_HF_TIMEOUT_S))
+    try:
+        return max(0.0, float(str(raw).strip()))
+    except ValueError:
+        return DEFAULT_HF_TIMEOUT_S
+
+
+def _gradio_client_factory(space_id: str, token: str = ""):
+    from gradio_client import Client
+
+    kwargs = {}
+    if token:
+        kwargs["hf_token"] = token
+    return Client(space_id, **kwargs)
+
+
+class HFSpaceClientPool:
+    """One lazily built gradio Client per (space_id, token), preferring the api_name that last worked."""
+
+    def __init__(self, client_factory: Callable[[str, str], Any] = None, timeout_s: float = None):
+        self.client_factory = client_factory or _gradio_client_factory
+        self.timeout_s = resolve_hf_timeout(timeout_s)
+        self._clients = {}
+        self._api_names = {}
+        self._lock = threading.Lock()
+        self.clients_created = 0
+
+    def client(self, space_id: str, token: str = ""):
+        key = (space_id, token or "")
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self.client_factory(space_id, token or "")
+                self.clients_created += 1
+            return self._clients[key]
+
+    def discard(self, space_id: str, token: str = "") -> None:
+        with self._lock:
+            self._clients.pop((space_id, token or ""), None)
+
+    def working_api_name(self, space_id: str):
+        return self._api_names.get(space_id, API_NAME_VARIANTS[0])
+
+    def _variants(self, space_id: str):
+        if space_id not in self._api_names:
+            return list(API_NAME_VARIANTS)
+        preferred = self._api_names[space_id]
+        return [preferred] + [name for name in API_NAME_VARIANTS if name != preferred]
+
+    def predict(self, space_id: str, prompt: str, token: str = "", timeout_s: Optional[float] = None) -> Any:
+        timeout_s = self.timeout_s if timeout_s is None else timeout_s
+        client = self.client(space_id, token)
+        errors = []
+        for api_name in self._variants(space_id):
+            kwargs = {"api_name": api_name} if api_name else {}
+            try:
+                job = client.submit(prompt, **kwargs)
+            except Exception as exc:
+                errors.append(f"{api_name or 'default'}: {exc}")
+                continue
+            try:
+                result = job.result(timeout=timeout_s or None)
+            except (FutureTimeoutError, TimeoutError):
+                # A slow Space will not get faster on another endpoint; give up on this call.
+                try:
+                    job.cancel()
+                except Exception:
+                    pass
+                raise TimeoutError(f"HF Space {space_id} did not answer within {timeout_s:g}s")
+            except Exception as exc:
+                errors.append(f"{api_name or 'default'}: {exc}")
+                continue
+            self._api_names[space_id] = api_name
+            return result
+        # Every variant failed; drop the client so the next call re-fetches the Space config.
+        self.discard(space_id, token)
+        raise RuntimeError("; ".join(errors) or "HF Space prediction failed")
+
+
+_DEFAULT_POOL = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def default_hf_client_pool() -> HFSpaceClientPool:
+    global _DEFAULT_POOL
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = HFSpaceClientPool()
+        return _DEFAULT_POOL
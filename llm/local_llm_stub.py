@@ -1,5 +1,7 @@
 # I13/llm/local_llm_stub.py
 
+import asyncio
+
 from core.llm_interface import LLMInterface
 
 
@@ -7,8 +9,17 @@ class LocalLLMStub(LLMInterface):
     """
     Temporary mock LLM.
     Reliable fallback for sponsor demos when API/network is unavailable.
+    latency_s simulates a network round-trip in agenerate() for async tests.
     """
 
+    def __init__(self, latency_s: float = 0.0):
+        self.latency_s = float(latency_s)
+
+    async def agenerate(self, prompt: str):
+        if self.latency_s > 0:
+            await asyncio.sleep(self.latency_s)
+        return self.generate(prompt)
+
     def generate(self, prompt: str):
         prompt_lower = prompt.lower()
 
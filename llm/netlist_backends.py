@@ -1,9 +1,16 @@
+import contextvars
 import importlib.util
 import os
 import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
+from llm.hf_space_client import HFSpaceClientPool, default_hf_client_pool
+from llm.response_cache import begin_cache_activity, default_llm_cache
+
 
 @dataclass
 class NetlistBackendResult:
@@ -13,6 +20,8 @@ class NetlistBackendResult:
     cleaned_netlist: str = ""
     fallback_reason: str = ""
     warnings: list[str] = field(default_factory=list)
+    backend_latencies_s: dict[str, float] = field(default_factory=dict)
+    route: str = "sequential"
 
 
 class NetlistGenerationBackend:
@@ -28,9 +37,15 @@ class NetlistGenerationBackend:
 class HuggingFaceSpaceNetlistBackend(NetlistGenerationBackend):
     name = "huggingface_gradio"
 
-    def __init__(self, space_id: Optional[str] = None, token: Optional[str] = None):
+    def __init__(
+        self,
+        space_id: Optional[str] = None,
+        token: Optional[str] = None,
+        client_pool: Optional[HFSpaceClientPool] = None,
+    ):
         self.space_id = space_id or os.getenv("HF_SPACE_ID", "potatoman869/spice_netlist-generator")
         self.token = token if token is not None else os.getenv("HF_TOKEN", "").strip()
+        self.client_pool = client_pool
 
     def available(self) -> tuple[bool, str]:
         if os.getenv("USE_HF_NETLIST", "0").strip() != "1":
@@ -40,23 +55,14 @@ class HuggingFaceSpaceNetlistBackend(NetlistGenerationBackend):
         return True, f"HF Space configured: {self.space_id}"
 
     def generate(self, prompt: str) -> Any:
-        from gradio_client import Client
-
-        kwargs = {}
-        if self.token:
-            kwargs["hf_token"] = self.token
-        client = Client(self.space_id, **kwargs)
+        cache = default_llm_cache()
+        if cache is None:
+            return self._predict(prompt)
+        return cache.call(self.name, self.space_id, None, prompt, self._predict)
 
-        errors = []
-        for call in (
-            lambda: client.predict(prompt, api_name="/predict"),
-            lambda: client.predict(prompt),
-        ):
-            try:
-                return call()
-            except Exception as exc:
-                errors.append(str(exc))
-        raise RuntimeError("; ".join(errors) or "HF Space prediction failed")
+    def _predict(self, prompt: str) -> Any:
+        pool = self.client_pool or default_hf_client_pool()
+        return pool.predict(self.space_id, prompt, token=self.token)
 
 
 class OpenAINetlistBackend(NetlistGenerationBackend):
@@ -85,7 +91,17 @@ class OpenAINetlistBackend(NetlistGenerationBackend):
                 model=os.getenv("OPENAI_MODEL", "gpt-5.4-mini"),
                 temperature=float(os.getenv("OPENAI_TEMPERATURE", "0.2")),
             )
-        return llm.generate(prompt)
+        # OpenAILLM caches its own responses; only wrap caller-provided clients that do not.
+        cache = None if hasattr(llm, "response_cache") else default_llm_cache()
+        if cache is None:
+            return llm.generate(prompt)
+        return cache.call(
+            self.name,
+            getattr(llm, "model", type(llm).__name__),
+            getattr(llm, "temperature", None),
+            prompt,
+            llm.generate,
+        )
 
 
 class DeterministicNetlistBackend(NetlistGenerationBackend):
@@ -129,6 +145,52 @@ def cleanup_spice_netlist(raw_text: str, required_analyses=None) -> str:
     return text.strip() + "\n" if text.strip() else ""
 
 
+DEFAULT_NETLIST_RACE_DEADLINE_S = 90.0
+
+
+def resolve_netlist_route_mode(mode: Optional[str] = None) -> str:
+    raw = (mode or os.getenv("I13_NETLIST_ROUTE", "sequential")).strip().lower()
+    return raw if raw in {"sequential", "race"} else "sequential"
+
+
+def resolve_netlist_race_deadline(value=None) -> float:
+    raw = value if value is not None else os.getenv("I13_NETLIST_DEADLINE_S", str(DEFAULT_NETLIST_RACE_DEADLINE_S))
+    try:
+        return max(0.0, float(str(raw).strip()))
+    except ValueError:
+        return DEFAULT_NETLIST_RACE_DEADLINE_S
+
+
+def _timed_generate(backend: NetlistGenerationBackend, prompt: str):
+    start = time.perf_counter()
+    try:
+        return stringify_backend_response(backend.generate(prompt)), None, time.perf_counter() - start
+    except Exception as exc:
+        return "", exc, time.perf_counter() - start
+
+
+def _start_generate(backend: NetlistGenerationBackend, prompt: str) -> Future:
+    # Daemon thread: a started remote call cannot be interrupted, and a hung one
+    # (HF_NETLIST_TIMEOUT_S can exceed the race deadline) must not keep the process alive.
+    future = Future()
+    context = contextvars.copy_context()
+
+    def run():
+        if future.set_running_or_notify_cancel():
+            future.set_result(context.run(_timed_generate, backend, prompt))
+
+    threading.Thread(target=run, name=f"i13-netlist-{backend.name}", daemon=True).start()
+    return future
+
+
+def _accept_candidate(raw_response: str, analyses, validate) -> tuple[str, Optional[str]]:
+    cleaned = cleanup_spice_netlist(raw_response, required_analyses=analyses)
+    validation_error = validate(cleaned) if validate else None
+    if cleaned and not validation_error:
+        return cleaned, None
+    return "", "cleaned netlist invalid" + (f" ({validation_error})" if validation_error else "")
+
+
 def generate_netlist_with_backends(
     *,
     prompt: str,
@@ -136,7 +198,10 @@ def generate_netlist_with_backends(
     deterministic_builder: Callable[[], Optional[str]],
     llm: Any = None,
     validate: Optional[Callable[[str], Optional[str]]] = None,
+    mode: Optional[str] = None,
+    deadline_s: Optional[float] = None,
 ) -> NetlistBackendResult:
+    """Route netlist generation through HF Space -> OpenAI -> deterministic builder, in turn or as a race."""
     warnings = []
     fallback_reasons = []
     backends: list[NetlistGenerationBackend] = [
@@ -145,6 +210,7 @@ def generate_netlist_with_backends(
         DeterministicNetlistBackend(deterministic_builder),
     ]
 
+    available_backends = []
     for backend in backends:
         available, reason = backend.available()
         if not available:
@@ -154,34 +220,132 @@ def generate_netlist_with_backends(
                 warnings.append(warning)
             fallback_reasons.append(f"{backend.name}: {reason}")
             continue
+        available_backends.append(backend)
+
+    route = resolve_netlist_route_mode(mode)
+    remote = [backend for backend in available_backends if not isinstance(backend, DeterministicNetlistBackend)]
+    if route == "race" and not remote:
+        # Nothing to race against; record the route that actually ran.
+        route = "sequential"
+    if route == "race":
+        return _race_backends(
+            prompt=prompt,
+            analyses=analyses,
+            remote=remote,
+            local=[backend for backend in available_backends if backend not in remote],
+            validate=validate,
+            deadline_s=resolve_netlist_race_deadline(deadline_s),
+            warnings=warnings,
+            fallback_reasons=fallback_reasons,
+        )
+
+    latencies = {}
+    for backend in available_backends:
+        raw_response, error, latency = _timed_generate(backend, prompt)
+        latencies[backend.name] = latency
+        if error is not None:
+            fallback_reasons.append(f"{backend.name}: {error}")
+            if backend.name != "local_deterministic":
+                print(f"[NetlistBackend] {backend.name} failed: {error}. Falling back automatically.")
+            continue
+        cleaned, rejection = _accept_candidate(raw_response, analyses, validate)
+        if cleaned:
+            return NetlistBackendResult(
+                backend_used=backend.name,
+                prompt_sent=prompt,
+                raw_response=raw_response,
+                cleaned_netlist=cleaned,
+                fallback_reason="; ".join(fallback_reasons),
+                warnings=warnings,
+                backend_latencies_s=latencies,
+                route=route,
+            )
+        fallback_reasons.append(f"{backend.name}: {rejection}")
+
+    return NetlistBackendResult(
+        backend_used="none",
+        prompt_sent=prompt,
+        fallback_reason="; ".join(fallback_reasons) or "all backends failed",
+        warnings=warnings,
+        backend_latencies_s=latencies,
+        route=route,
+    )
+
+
+def _race_backends(*, prompt, analyses, remote, local, validate, deadline_s, warnings, fallback_reasons):
+    latencies = {}
+    started = time.perf_counter()
+    # Cache hit/miss counters live in a context variable; make worker threads report into the caller's.
+    begin_cache_activity()
+    futures = {_start_generate(backend, prompt): backend for backend in remote}
+    local_futures = [(backend, _start_generate(backend, prompt)) for backend in local]
+    pending = set(futures)
+    while pending:
+        remaining = deadline_s - (time.perf_counter() - started)
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        # Backends finishing in the same instant are judged in preference order.
+        for future in sorted(done, key=lambda item: remote.index(futures[item])):
+            backend = futures[future]
+            raw_response, error, latency = future.result()
+            latencies[backend.name] = latency
+            if error is not None:
+                fallback_reasons.append(f"{backend.name}: {error}")
+                print(f"[NetlistBackend] {backend.name} failed: {error}. Falling back automatically.")
+                continue
+            cleaned, rejection = _accept_candidate(raw_response, analyses, validate)
+            if not cleaned:
+                fallback_reasons.append(f"{backend.name}: {rejection}")
+                continue
+            for loser in pending:
+                loser.cancel()
+                fallback_reasons.append(f"{futures[loser].name}: cancelled after {backend.name} won the race")
+            return NetlistBackendResult(
+                backend_used=backend.name,
+                prompt_sent=prompt,
+                raw_response=raw_response,
+                cleaned_netlist=cleaned,
+                fallback_reason="; ".join(fallback_reasons),
+                warnings=warnings,
+                backend_latencies_s=latencies,
+                route="race",
+            )
 
-        try:
-            raw_response = stringify_backend_response(backend.generate(prompt))
-            cleaned = cleanup_spice_netlist(raw_response, required_analyses=analyses)
-            validation_error = validate(cleaned) if validate else None
-            if cleaned and not validation_error:
-                return NetlistBackendResult(
-                    backend_used=backend.name,
-                    prompt_sent=prompt,
-                    raw_response=raw_response,
-                    cleaned_netlist=cleaned,
-                    fallback_reason="; ".join(fallback_reasons),
-                    warnings=warnings,
-                )
-            fallback_reasons.append(
-                f"{backend.name}: cleaned netlist invalid"
-                + (f" ({validation_error})" if validation_error else "")
+    for future in pending:
+        future.cancel()
+        backend = futures[future]
+        latencies[backend.name] = time.perf_counter() - started
+        fallback_reasons.append(f"{backend.name}: no answer within {deadline_s:g}s deadline")
+        print(f"[NetlistBackend] {backend.name} missed the {deadline_s:g}s deadline. Falling back automatically.")
+
+    for backend, future in local_futures:
+        raw_response, error, latency = future.result()
+        latencies[backend.name] = latency
+        if error is not None:
+            fallback_reasons.append(f"{backend.name}: {error}")
+            continue
+        cleaned, rejection = _accept_candidate(raw_response, analyses, validate)
+        if cleaned:
+            return NetlistBackendResult(
+                backend_used=backend.name,
+                prompt_sent=prompt,
+                raw_response=raw_response,
+                cleaned_netlist=cleaned,
+                fallback_reason="; ".join(fallback_reasons),
+                warnings=warnings,
+                backend_latencies_s=latencies,
+                route="race",
             )
-        except Exception as exc:
-            fallback_reasons.append(f"{backend.name}: {exc}")
-            if backend.name != "local_deterministic":
-                print(f"[NetlistBackend] {backend.name} failed: {exc}. Falling back automatically.")
+        fallback_reasons.append(f"{backend.name}: {rejection}")
 
     return NetlistBackendResult(
         backend_used="none",
         prompt_sent=prompt,
         fallback_reason="; ".join(fallback_reasons) or "all backends failed",
         warnings=warnings,
+        backend_latencies_s=latencies,
+        route="race",
     )
 
 
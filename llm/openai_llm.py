@@ -1,11 +1,12 @@
 # I13/llm/openai_llm.py
 
+import asyncio
 import os
 import json
 import re
-from openai import OpenAI
 
 from core.llm_interface import LLMInterface
+from llm.response_cache import default_llm_cache
 
 
 class OpenAILLM(LLMInterface):
@@ -13,11 +14,21 @@ class OpenAILLM(LLMInterface):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("Set OPENAI_API_KEY in your environment.")
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=self.api_key)
         self.model = model
         self.temperature = temperature
+        self._async_client = None
+        self._async_loop = None
+        self.response_cache = default_llm_cache()
 
     def generate(self, prompt: str):
+        if self.response_cache is None:
+            return self._generate_uncached(prompt)
+        return self.response_cache.call("openai", self.model, self.temperature, prompt, self._generate_uncached)
+
+    def _generate_uncached(self, prompt: str):
         response = self.client.responses.create(
             model=self.model,
             input=prompt,
@@ -26,6 +37,36 @@ class OpenAILLM(LLMInterface):
         text = response.output_text.strip()
         return self._parse_json_or_text(text)
 
+    async def agenerate(self, prompt: str):
+        cache = self.response_cache
+        if cache is None:
+            return await self._agenerate_uncached(prompt)
+        key, hit, cached = cache.lookup("openai", self.model, self.temperature, prompt)
+        if hit:
+            return cached
+        result = await self._agenerate_uncached(prompt)
+        cache.put(key, result, {"namespace": "openai", "model": self.model})
+        return result
+
+    async def _agenerate_uncached(self, prompt: str):
+        response = await self._get_async_client().responses.create(
+            model=self.model,
+            input=prompt,
+            temperature=self.temperature,
+        )
+        text = response.output_text.strip()
+        return self._parse_json_or_text(text)
+
+    def _get_async_client(self):
+        # The async HTTP client is bound to the loop that created it.
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            from openai import AsyncOpenAI
+
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+            self._async_loop = loop
+        return self._async_client
+
     def _parse_json_or_text(self, text: str):
         try:
             return json.loads(text)
@@ -0,0 +1,197 @@
+# I13/llm/response_cache.py
+
+import contextvars
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+
+DEFAULT_LLM_CACHE_DIR = os.path.join("artifacts", "cache", "llm")
+DEFAULT_LLM_CACHE_TTL_S = 7 * 24 * 3600
+DEFAULT_LLM_CACHE_MAX_MB = 64
+_MISSING = object()
+# Benchmark samples differ only by their sample_id constraint; it must not split the cache.
+_SAMPLE_ID = re.compile(r"""['"]?sample_id['"]?\s*[:=]\s*-?\d+\s*,?\s*""")
+_ACTIVITY = contextvars.ContextVar("i13_llm_cache_activity", default=None)
+
+
+def llm_cache_enabled() -> bool:
+    return os.getenv("I13_LLM_CACHE", "1").strip() == "1"
+
+
+def normalize_prompt(prompt: str) -> str:
+    text = _SAMPLE_ID.sub("", str(prompt or ""))
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def llm_cache_key(namespace: str, model: Any, temperature: Any, prompt: str) -> str:
+    payload = json.dumps(
+        {
+            "namespace": namespace,
+            "model": str(model or ""),
+            "temperature": None if temperature is None else float(temperature),
+            "prompt": normalize_prompt(prompt),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _note_activity(kind: str) -> None:
+    activity = _ACTIVITY.get()
+    if activity is None:
+        activity = {"cache_hits": 0, "cache_misses": 0}
+        _ACTIVITY.set(activity)
+    activity[kind] += 1
+
+
+def begin_cache_activity(fresh: bool = False) -> None:
+    """Ensure a counter exists so copied contexts update it in place; fresh=True starts a new one."""
+    if fresh or _ACTIVITY.get() is None:
+        _ACTIVITY.set({"cache_hits": 0, "cache_misses": 0})
+
+
+def merge_cache_activity(activity: Optional[dict]) -> None:
+    """Fold activity collected in another context (e.g. an event-loop task) into the current one."""
+    for kind in ("cache_hits", "cache_misses"):
+        for _ in range(int((activity or {}).get(kind) or 0)):
+            _note_activity(kind)
+
+
+def consume_cache_activity() -> dict:
+    """Cache hits/misses recorded in this thread/task since the last call, for llm_call history events."""
+    activity = _ACTIVITY.get() or {}
+    _ACTIVITY.set(None)
+    return {
+        "cache_hits": int(activity.get("cache_hits", 0)),
+        "cache_misses": int(activity.get("cache_misses", 0)),
+    }
+
+
+class LLMResponseCache:
+    """On-disk LLM response store with a TTL and an LRU size budget."""
+
+    def __init__(self, root: str = None, ttl_s: float = None, max_bytes: int = None):
+        self.root = root or os.getenv("I13_LLM_CACHE_DIR", DEFAULT_LLM_CACHE_DIR)
+        if ttl_s is None:
+            ttl_s = float(os.getenv("I13_LLM_CACHE_TTL_S", str(DEFAULT_LLM_CACHE_TTL_S)))
+        self.ttl_s = max(0.0, float(ttl_s))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("I13_LLM_CACHE_MAX_MB", str(DEFAULT_LLM_CACHE_MAX_MB))) * 1024 * 1024)
+        self.max_bytes = max(0, int(max_bytes))
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Any:
+        path = self._entry_path(key)
+        try:
+            with open(path, "r") as handle:
+                entry = json.load(handle)
+        except (OSError, ValueError):
+            return _MISSING
+        if self.ttl_s and time.time() - float(entry.get("created", 0.0)) > self.ttl_s:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return _MISSING
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("response")
+
+    def put(self, key: str, response: Any, meta: dict = None) -> None:
+        try:
+            payload = json.dumps({**(meta or {}), "created": time.time(), "response": response}, sort_keys=True)
+        except (TypeError, ValueError):
+            return
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=f".{key[:8]}-", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(payload)
+            os.replace(staging, path)
+        except OSError:
+            if os.path.exists(staging):
+                os.remove(staging)
+            return
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if name.startswith(".") or not name.endswith(".json"):
+                    continue
+                path = os.path.join(shard_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    def lookup(self, namespace: str, model: Any, temperature: Any, prompt: str):
+        """Return (key, hit, response); a cached response may itself be None, hence the explicit flag."""
+        key = llm_cache_key(namespace, model, temperature, prompt)
+        response = self.get(key)
+        if response is _MISSING:
+            self.misses += 1
+            _note_activity("cache_misses")
+            return key, False, None
+        self.hits += 1
+        _note_activity("cache_hits")
+        return key, True, response
+
+    def call(self, namespace: str, model: Any, temperature: Any, prompt: str, generate: Callable[[str], Any]) -> Any:
+        key, hit, response = self.lookup(namespace, model, temperature, prompt)
+        if hit:
+            return response
+        response = generate(prompt)
+        self.put(key, response, {"namespace": namespace, "model": str(model or "")})
+        return response
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+_DEFAULT_CACHES = {}
+
+
+def default_llm_cache() -> Optional[LLMResponseCache]:
+    """Process-wide cache for the configured directory, or None when I13_LLM_CACHE=0."""
+    if not llm_cache_enabled():
+        return None
+    root = os.getenv("I13_LLM_CACHE_DIR", DEFAULT_LLM_CACHE_DIR)
+    if root not in _DEFAULT_CACHES:
+        _DEFAULT_CACHES[root] = LLMResponseCache(root=root)
+    return _DEFAULT_CACHES[root]
@@ -2,8 +2,15 @@ import argparse
 import os
 import json
 import shutil
+import threading
+import uuid
 from datetime import datetime
 
+from core.lazy_imports import install_import_profiler_from_env
+
+# Must run before the imports below so I13_IMPORT_PROFILE=1 sees them.
+install_import_profiler_from_env()
+
 from agents.design_status import DesignStatus
 from core.demo_catalog import get_demo_case, get_demo_profile, list_demo_cases, list_demo_profiles
 from core.demo_safe import (
@@ -25,20 +32,11 @@ from core.final_showcase import (
     stable_summary_index,
 )
 from core.preflight_checks import format_preflight_report, run_preflight_checks
-from core.reference_knowledge import load_reference_catalog, resolve_reference_paths
 from core.runtime_backend import resolve_llm_backend
 from core.reference_usage import summarize_reference_usage
 from core.showcase_artifacts import organize_showcase_latest, row_from_final_state
-from core.shared_memory import SharedMemory
-
-from agents.topology_agent import TopologyAgent
-from agents.sizing_agent import SizingAgent
-from agents.constraints_agent import ConstraintAgent
-from agents.netlist_agent import NetlistAgent
-from agents.op_point_agent import OpPointAgent
-from agents.simulation_agent import SimulationAgent
-from agents.refinement_agent import RefinementAgent
-from agents.orchestration_agent import OrchestrationAgent
+from core.shared_memory import SharedMemory, iter_history
+from core.stage_timing import node_timings_from_history, write_timing_artifacts
 
 
 def build_llm():
@@ -256,7 +254,7 @@ def _format_artifact_block(sim: dict):
 
 def _summarize_llm_usage(final_state: dict) -> list[str]:
     uses = []
-    for item in final_state.get("history") or []:
+    for item in iter_history(final_state):
         if item.get("event") != "llm_call":
             continue
         data = item.get("data") or {}
@@ -562,9 +560,11 @@ def _artifact_summary(case_name: str, final_state: dict) -> dict:
         },
         "llm_calls": [
             item.get("data")
-            for item in (final_state.get("history") or [])
+            for item in iter_history(final_state)
             if item.get("event") == "llm_call"
         ],
+        "history_log_path": final_state.get("history_log_path"),
+        "history_event_count": final_state.get("history_event_count"),
     }
 
 
@@ -577,6 +577,11 @@ def _write_artifact_report(case_name: str, final_state: dict) -> None:
     os.makedirs(artifact_dir, exist_ok=True)
     reports_dir = os.path.join(artifact_dir, "reports")
     os.makedirs(reports_dir, exist_ok=True)
+    history_log_path = final_state.get("history_log_path")
+    if history_log_path and os.path.exists(history_log_path):
+        run_log_path = os.path.join(reports_dir, "history.jsonl")
+        shutil.move(history_log_path, run_log_path)
+        final_state["history_log_path"] = run_log_path
     report_text = format_final_report(case_name, final_state) + "\n"
     with open(os.path.join(artifact_dir, "final_report.txt"), "w") as f:
         f.write(report_text)
@@ -586,6 +591,7 @@ def _write_artifact_report(case_name: str, final_state: dict) -> None:
         json.dump(_artifact_summary(case_name, final_state), f, indent=2)
     with open(os.path.join(reports_dir, "metrics_summary.json"), "w") as f:
         json.dump(_artifact_summary(case_name, final_state), f, indent=2)
+    write_timing_artifacts(node_timings_from_history(iter_history(final_state)), artifact_dir)
 
 
 def _list_cases() -> None:
@@ -627,6 +633,14 @@ def run_preflight(profile_name: str = "ti_safe") -> dict:
 
 
 def _run_profile_preflight_sanity(profile_name: str) -> dict:
+    # Agents, the reference catalog and their plotting/numeric dependencies load only when a
+    # design actually runs, so list-cases/list-profiles/preflight start quickly.
+    from agents.constraints_agent import ConstraintAgent
+    from agents.netlist_agent import NetlistAgent
+    from agents.sizing_agent import SizingAgent
+    from agents.topology_agent import TopologyAgent
+    from core.reference_knowledge import load_reference_catalog, resolve_reference_paths
+
     if not profile_name:
         return {"cases": [], "failures": []}
 
@@ -1163,7 +1177,52 @@ def main(argv=None):
     print(format_final_report(case_name, final_state))
 
 
+_ACTIVE_HISTORY_LOGS = set()
+_ACTIVE_HISTORY_LOCK = threading.Lock()
+
+
+def _history_log_path(case_name: str):
+    """Per-run JSONL event log; I13_HISTORY_LOG=0 keeps the whole history in memory instead."""
+    if os.getenv("I13_HISTORY_LOG", "1").strip() != "1":
+        return None
+    history_dir = os.getenv("I13_HISTORY_DIR", os.path.join("artifacts", "history"))
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = os.path.join(history_dir, f"{case_name}__{stamp}__{uuid.uuid4().hex[:8]}.jsonl")
+    with _ACTIVE_HISTORY_LOCK:
+        _prune_history_logs(history_dir, int(os.getenv("I13_HISTORY_KEEP", "50")))
+        _ACTIVE_HISTORY_LOGS.add(os.path.abspath(path))
+    return path
+
+
+def _prune_history_logs(history_dir: str, keep: int) -> None:
+    # Logs of runs that produced an artifact directory are moved into it, so
+    # only runs without one accumulate here; keep the newest few.
+    try:
+        names = [name for name in os.listdir(history_dir) if name.endswith(".jsonl")]
+    except OSError:
+        return
+    paths = sorted((os.path.join(history_dir, name) for name in names), key=os.path.getmtime)
+    for path in paths[: max(0, len(paths) - max(0, keep - 1))]:
+        if os.path.abspath(path) in _ACTIVE_HISTORY_LOGS:
+            # Still being written by a concurrent run in this process.
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
 def run_case(case_name: str, case_override: dict = None, llm_override=None, runtime_options: dict = None):
+    from agents.constraints_agent import ConstraintAgent
+    from agents.netlist_agent import NetlistAgent
+    from agents.op_point_agent import OpPointAgent
+    from agents.orchestration_agent import OrchestrationAgent
+    from agents.refinement_agent import RefinementAgent
+    from agents.simulation_agent import SimulationAgent
+    from agents.sizing_agent import SizingAgent
+    from agents.topology_agent import TopologyAgent
+    from core.reference_knowledge import load_reference_catalog, resolve_reference_paths
+
     case = get_demo_case(case_name)
     runtime_options = dict(runtime_options or {})
     if case_override:
@@ -1183,7 +1242,8 @@ def run_case(case_name: str, case_override: dict = None, llm_override=None, runt
         elif base_simulation_plan:
             case["simulation_plan"] = base_simulation_plan
 
-    memory = SharedMemory()
+    history_log_path = _history_log_path(case_name)
+    memory = SharedMemory(history_log_path=history_log_path)
     memory.write("specification", case["specification"])
     memory.write("constraints", case["constraints"])
     memory.write(
@@ -1223,7 +1283,13 @@ def run_case(case_name: str, case_override: dict = None, llm_override=None, runt
         }
     memory.write("llm_resolution", llm_resolution)
 
-    topology_agent = TopologyAgent(llm=llm, reference_catalog=reference_catalog)
+    stage_cache = None
+    if runtime_options.get("stage_cache_dir"):
+        from core.stage_reuse import StageReuseCache
+
+        stage_cache = StageReuseCache(runtime_options["stage_cache_dir"])
+
+    topology_agent = TopologyAgent(llm=llm, reference_catalog=reference_catalog, stage_cache=stage_cache)
     sizing_agent = SizingAgent(llm=llm, reference_catalog=reference_catalog)
     constraint_agent = ConstraintAgent(reference_catalog=reference_catalog)
     netlist_agent = NetlistAgent(llm=llm, reference_catalog=reference_catalog)
@@ -1244,7 +1310,12 @@ def run_case(case_name: str, case_override: dict = None, llm_override=None, runt
     )
 
     print(f"Running case: {case_name} -> {case.get('display_name')}")
-    final_state = orchestrator.run()
+    try:
+        final_state = orchestrator.run()
+    finally:
+        memory.close()
+        with _ACTIVE_HISTORY_LOCK:
+            _ACTIVE_HISTORY_LOGS.discard(os.path.abspath(history_log_path))
     _write_artifact_report(case_name, final_state)
     return final_state
 
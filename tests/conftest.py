@@ -0,0 +1,21 @@
+# I13/tests/conftest.py
+
+import os
+import tempfile
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_history_dir():
+    # Keep per-run history logs from test runs out of artifacts/history.
+    with tempfile.TemporaryDirectory(prefix="i13-history-") as history_dir:
+        previous = os.environ.get("I13_HISTORY_DIR")
+        os.environ["I13_HISTORY_DIR"] = history_dir
+        try:
+            yield history_dir
+        finally:
+            if previous is None:
+                os.environ.pop("I13_HISTORY_DIR", None)
+            else:
+                os.environ["I13_HISTORY_DIR"] = previous
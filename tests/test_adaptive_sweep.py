@@ -0,0 +1,72 @@
+import unittest
+
+from core.adaptive_sweep import adaptive_sweep
+
+
+def _evaluator(threshold, calls):
+    def evaluate(values):
+        calls.append(list(values))
+        return [
+            {"requested_spec": value, "pass_fail": "PASSED" if value < threshold else "FAILED", "measured_result": 1.0}
+            for value in values
+        ]
+
+    return evaluate
+
+
+class AdaptiveSweepTests(unittest.TestCase):
+    def test_bisects_towards_the_pass_fail_boundary(self):
+        calls = []
+        result = adaptive_sweep(_evaluator(3000.0, calls), 10.0, 1.0e7, coarse_points=5, max_points=40, tolerance=0.005)
+
+        self.assertTrue(result.log_scale)
+        self.assertEqual(result.stop_reason, "converged")
+        self.assertEqual(len(calls[0]), 5)
+        self.assertTrue(all(len(batch) == 1 for batch in calls[1:]))
+        self.assertEqual(len(result.boundaries), 1)
+        boundary = result.boundaries[0]
+        self.assertLess(boundary.low, 3000.0)
+        self.assertGreaterEqual(boundary.high, 3000.0)
+        self.assertLess(boundary.high / boundary.low, 10 ** (6 * 0.005) + 1e-9)
+        self.assertLess(len(result.rows), 15)
+        values = [row["requested_spec"] for row in result.rows]
+        self.assertEqual(values, sorted(values))
+        self.assertEqual(result.rows[0]["adaptive_round"], 0)
+
+    def test_point_budget_stops_refinement(self):
+        calls = []
+        result = adaptive_sweep(_evaluator(3000.0, calls), 10.0, 1.0e7, coarse_points=5, max_points=8, tolerance=1e-6)
+        self.assertEqual(result.stop_reason, "point_budget")
+        self.assertEqual(len(result.rows), 8)
+
+    def test_metric_tracking_the_sweep_does_not_spend_the_flip_budget(self):
+        def evaluate(values):
+            return [
+                {"requested_spec": value, "pass_fail": "PASSED" if value < 3700.0 else "FAILED", "measured_result": value}
+                for value in values
+            ]
+
+        result = adaptive_sweep(evaluate, 100.0, 1.0e5, coarse_points=5, max_points=25, tolerance=0.01)
+        self.assertEqual(result.stop_reason, "converged")
+        boundary = result.boundaries[0]
+        self.assertTrue(boundary.low < 3700.0 <= boundary.high)
+        self.assertLess(boundary.high / boundary.low, 10 ** (3 * 0.01) + 1e-9)
+        self.assertLess(len(result.rows), 15)
+
+    def test_sharp_metric_changes_are_refined_without_status_flips(self):
+        def evaluate(values):
+            return [
+                {"requested_spec": value, "pass_fail": "PASSED", "measured_result": 10.0 if value > 6.0 else 1.0}
+                for value in values
+            ]
+
+        result = adaptive_sweep(evaluate, 0.0, 10.0, coarse_points=3, max_points=20, tolerance=0.05)
+        self.assertFalse(result.log_scale)
+        self.assertEqual(result.boundaries, [])
+        values = [row["requested_spec"] for row in result.rows]
+        self.assertIn(6.25, values)
+        self.assertFalse([value for value in values if 0.0 < value < 5.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from core.async_llm import BoundedAsyncLLM, SharedEventLoop
+from core.llm_interface import LLMInterface
+from llm.local_llm_stub import LocalLLMStub
+
+
+TOPOLOGY_PROMPT = "Choose the single best topology key for a low-pass filter."
+
+
+class _SyncOnlyLLM(LLMInterface):
+    def __init__(self):
+        self.threads = set()
+
+    def generate(self, prompt: str):
+        self.threads.add(threading.current_thread().name)
+        return {"echo": prompt}
+
+
+class AsyncLLMTests(unittest.TestCase):
+    def setUp(self):
+        self.loop = SharedEventLoop()
+        self.addCleanup(self.loop.close)
+
+    def test_default_agenerate_runs_sync_backend_off_the_loop(self):
+        llm = _SyncOnlyLLM()
+        self.assertEqual(asyncio.run(llm.agenerate("hi")), {"echo": "hi"})
+        self.assertNotIn("MainThread", llm.threads)
+
+    def test_stub_agenerate_matches_generate(self):
+        stub = LocalLLMStub(latency_s=0.01)
+        self.assertEqual(asyncio.run(stub.agenerate(TOPOLOGY_PROMPT)), stub.generate(TOPOLOGY_PROMPT))
+        self.assertEqual(stub.generate(TOPOLOGY_PROMPT)["topology"], "rc_lowpass")
+
+    def test_concurrent_sync_callers_share_one_bounded_loop(self):
+        client = BoundedAsyncLLM(LocalLLMStub(latency_s=0.1), max_concurrency=4, loop=self.loop)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(client.generate, [TOPOLOGY_PROMPT] * 8))
+        elapsed = time.perf_counter() - start
+
+        self.assertTrue(all(result["topology"] == "rc_lowpass" for result in results))
+        self.assertEqual(client.calls, 8)
+        self.assertEqual(client.peak_in_flight, 4)
+        # Two waves of four overlapping 0.1 s calls, not eight sequential ones.
+        self.assertLess(elapsed, 0.6)
+
+    def test_attributes_are_forwarded_to_the_wrapped_backend(self):
+        client = BoundedAsyncLLM(LocalLLMStub(latency_s=0.25), max_concurrency=1, loop=self.loop)
+        self.assertEqual(client.latency_s, 0.25)
+        self.assertEqual(client.stats()["max_concurrency"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
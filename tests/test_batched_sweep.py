@@ -0,0 +1,111 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from core.batched_sweep import build_batched_deck, design_point_netlist, run_batched_sweep
+from core.ngspice_backend import SubprocessNgspice
+from core.simulation_cache import CachedNgspice, SimulationCache
+
+
+FAKE_NGSPICE = """#!/bin/sh
+if [ "$1" = "-v" ]; then echo "ngspice-fake 1.0"; exit 0; fi
+echo "run" >> "$(dirname "$0")/calls.txt"
+echo "batched run" > "$3"
+awk '/^echo /{sub(/^echo /, ""); print} /^wrdata .*_p001/{print "Error: timestep too small"}' "$4" >> "$3"
+grep -o 'wrdata [^ ]*' "$4" | while read _ name; do echo "1 1 0.5" > "$name"; done
+"""
+
+RC_NETLIST = """* RC low-pass filter demo netlist
+Vin in 0 DC 0 AC 1.0 PULSE(0 1.0 0 1u 1u 20m 40m)
+R1 in out {r}
+C1 out 0 {c}
+
+.control
+set wr_singlescale
+ac dec 100 1 1e6
+wrdata ac_out.csv frequency vm(out)
+quit
+.endc
+.end
+"""
+
+
+class BatchedDeckTests(unittest.TestCase):
+    def test_points_become_alter_blocks_with_suffixed_outputs(self):
+        deck, outputs, varied = build_batched_deck(
+            [RC_NETLIST.format(r=1000, c=1e-9), RC_NETLIST.format(r=2000, c=1e-9), RC_NETLIST.format(r=3000, c=2e-9)]
+        )
+
+        self.assertEqual(varied, ("R1", "C1"))
+        self.assertEqual(outputs, [{"ac_out_p000.csv": "ac_out.csv"}, {"ac_out_p001.csv": "ac_out.csv"}, {"ac_out_p002.csv": "ac_out.csv"}])
+        lines = deck.splitlines()
+        self.assertIn("R1 in out 1000", lines)
+        self.assertEqual(lines.count("ac dec 100 1 1e6"), 3)
+        self.assertEqual(lines.count("quit"), 1)
+        point_2 = lines.index("wrdata ac_out_p002.csv frequency vm(out)")
+        self.assertEqual(lines[point_2 - 4 : point_2 - 2], ["alter R1 = 3000", "alter C1 = 2e-09"])
+
+    def test_structural_differences_are_rejected(self):
+        with self.assertRaises(ValueError):
+            build_batched_deck([RC_NETLIST.format(r=1000, c=1e-9), RC_NETLIST.format(r=1000, c=1e-9).replace("1e6", "1e7")])
+        with self.assertRaises(ValueError):
+            build_batched_deck([RC_NETLIST.format(r=1000, c=1e-9), RC_NETLIST.format(r=1000, c=1e-9).replace("in out", "in mid")])
+
+
+class BatchedSweepRunTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = self._tmp.name
+        self.exe = os.path.join(self.root, "ngspice")
+        with open(self.exe, "w") as handle:
+            handle.write(FAKE_NGSPICE)
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IEXEC)
+
+    def _calls(self):
+        with open(os.path.join(self.root, "calls.txt")) as handle:
+            return len(handle.read().splitlines())
+
+    @mock.patch.dict(os.environ, {"I13_SIM_CACHE": "1", "I13_RAWFILE": "0"})
+    def test_one_run_seeds_every_point_into_the_simulation_cache(self):
+        cache = SimulationCache(root=os.path.join(self.root, "cache"), max_bytes=10 * 1024 * 1024)
+        overrides = [{"constraints": {"fixed_cap_f": value}} for value in (4.7e-9, 10e-9, 22e-9)]
+
+        summary = run_batched_sweep("rc", overrides, os.path.join(self.root, "batched"), backend=SubprocessNgspice(self.exe), cache=cache)
+
+        self.assertEqual((summary.status, summary.seeded, summary.returncode), ("seeded", 3, 0))
+        self.assertEqual(self._calls(), 1)
+        backend = CachedNgspice(SubprocessNgspice(self.exe), cache)
+        for index, override in enumerate(overrides):
+            point_dir = os.path.join(self.root, f"point-{index}")
+            os.makedirs(point_dir)
+            with open(os.path.join(point_dir, "generated.sp"), "w") as handle:
+                handle.write(design_point_netlist("rc", override))
+            self.assertTrue(backend.run("generated.sp", cwd=point_dir).cached)
+            self.assertTrue(os.path.exists(os.path.join(point_dir, "ac_out.csv")))
+        self.assertEqual(self._calls(), 1)
+
+    @mock.patch.dict(os.environ, {"I13_SIM_CACHE": "1", "I13_RAWFILE": "0"})
+    def test_each_point_gets_only_its_own_log_block(self):
+        cache = SimulationCache(root=os.path.join(self.root, "cache"), max_bytes=10 * 1024 * 1024)
+        overrides = [{"constraints": {"fixed_cap_f": value}} for value in (4.7e-9, 10e-9, 22e-9)]
+        run_batched_sweep("rc", overrides, os.path.join(self.root, "batched"), backend=SubprocessNgspice(self.exe), cache=cache)
+
+        logs = []
+        for index in range(3):
+            with open(os.path.join(self.root, "batched", f"point_{index:03d}", "ngspice.log")) as handle:
+                logs.append(handle.read())
+        self.assertEqual(["timestep too small" in log for log in logs], [False, True, False])
+        self.assertTrue(all(log.startswith("batched run") and "I13_BATCH_POINT" not in log for log in logs))
+
+    @mock.patch.dict(os.environ, {"I13_SIM_CACHE": "0"})
+    def test_disabled_cache_falls_back_to_per_point_runs(self):
+        summary = run_batched_sweep("rc", [{}], os.path.join(self.root, "batched"), backend=SubprocessNgspice(self.exe))
+        self.assertEqual(summary.status, "skipped")
+        self.assertFalse(os.path.exists(os.path.join(self.root, "calls.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()
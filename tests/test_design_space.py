@@ -0,0 +1,89 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from core.design_space import (
+    ParameterRange,
+    latin_hypercube_samples,
+    sample_design_space,
+    sobol_samples,
+    write_columnar_table,
+)
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pq = None
+
+
+class SamplingTests(unittest.TestCase):
+    def test_sobol_matches_the_reference_sequence(self):
+        self.assertEqual(
+            sobol_samples(2, 8),
+            [[0.0, 0.0], [0.5, 0.5], [0.75, 0.25], [0.25, 0.75], [0.375, 0.375], [0.875, 0.875], [0.625, 0.125], [0.125, 0.625]],
+        )
+        with self.assertRaises(ValueError):
+            sobol_samples(11, 4)
+
+    def test_latin_hypercube_fills_every_stratum_once(self):
+        points = latin_hypercube_samples(3, 10, seed=7)
+        self.assertEqual(len(points), 10)
+        for dim in range(3):
+            self.assertEqual(sorted(int(point[dim] * 10) for point in points), list(range(10)))
+        self.assertEqual(points, latin_hypercube_samples(3, 10, seed=7))
+
+
+class DesignSpaceTests(unittest.TestCase):
+    def test_schema_bounds_and_log_scaling(self):
+        gain = ParameterRange.from_schema("common_source", "target_gain_db")
+        bandwidth = ParameterRange.from_schema("common_source", "target_bw_hz")
+        self.assertEqual((gain.low, gain.high, gain.log_scale), (1.0, 80.0, False))
+        self.assertTrue(bandwidth.log_scale)
+        self.assertEqual(bandwidth.scale(0.5), 1e6)
+        with self.assertRaises(ValueError):
+            ParameterRange.from_schema("common_source", "not_a_parameter")
+
+    def test_samples_stay_inside_the_requested_ranges(self):
+        ranges = [
+            ParameterRange.from_schema("common_source", "target_gain_db", 10.0, 30.0),
+            ParameterRange.from_schema("common_source", "target_bw_hz"),
+        ]
+        factorial = sample_design_space(ranges, "factorial", levels=4)
+        self.assertEqual(len(factorial), 16)
+        self.assertEqual(sorted({point["target_gain_db"] for point in factorial}), [10.0, 16.6667, 23.3333, 30.0])
+        for method in ("lhs", "sobol"):
+            points = sample_design_space(ranges, method, count=12, seed=3)
+            self.assertEqual(len(points), 12)
+            for point in points:
+                self.assertTrue(10.0 <= point["target_gain_db"] <= 30.0)
+                self.assertTrue(1e3 <= point["target_bw_hz"] <= 1e9)
+        with self.assertRaises(ValueError):
+            sample_design_space(ranges, "random")
+
+    def test_columnar_table_keeps_only_the_requested_columns(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "grid_results.csv")
+            written = write_columnar_table(path, [{"sample": 0, "gain": 1.5, "artifact_dir": "x"}], ["sample", "gain"])
+            with open(path, newline="") as handle:
+                self.assertEqual(list(csv.DictReader(handle)), [{"sample": "0", "gain": "1.5"}])
+            self.assertEqual(written["csv"], path)
+
+    @unittest.skipIf(pq is None, "pyarrow not installed")
+    def test_parquet_columns_keep_their_types(self):
+        rows = [
+            {"sample": 0, "target_gain_db": 10.0, "measured_metric": "gain_db", "measured_result": 12.5},
+            {"sample": 1, "target_gain_db": 20.0, "measured_metric": "", "measured_result": ""},
+        ]
+        columns = ["sample", "target_gain_db", "measured_metric", "measured_result"]
+        with tempfile.TemporaryDirectory() as tmp:
+            written = write_columnar_table(
+                os.path.join(tmp, "grid_results.csv"), rows, columns, numeric_columns=["target_gain_db", "measured_result"]
+            )
+            table = pq.read_table(written["parquet"])
+        self.assertEqual([str(field.type) for field in table.schema], ["int64", "double", "string", "double"])
+        self.assertEqual(table.column("measured_result").to_pylist(), [12.5, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from llm.hf_space_client import HFSpaceClientPool
+from llm.netlist_backends import HuggingFaceSpaceNetlistBackend
+
+
+RC_NETLIST = "* rc\nVin in 0 AC 1\nR1 in out 15915\nC1 out 0 10n\n.end\n"
+
+
+class FakeSpace:
+    """Stand-in for gradio_client.Client: submit() returns a job whose result() blocks up to latency_s."""
+
+    def __init__(self, space_id, token="", api_names=(None,), latency_s=0.0):
+        self.space_id = space_id
+        self.token = token
+        self.api_names = set(api_names)
+        self.latency_s = latency_s
+        self.submits = []
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+    def submit(self, prompt, api_name=None):
+        self.submits.append(api_name)
+        if api_name not in self.api_names:
+            raise ValueError(f"Cannot find a function with api_name: {api_name}")
+
+        def run():
+            time.sleep(self.latency_s)
+            return RC_NETLIST
+
+        return self._executor.submit(run)
+
+
+class HFSpaceClientPoolTests(unittest.TestCase):
+    def _pool(self, **space_kwargs):
+        spaces = []
+
+        def factory(space_id, token):
+            spaces.append(FakeSpace(space_id, token, **space_kwargs))
+            return spaces[-1]
+
+        return HFSpaceClientPool(client_factory=factory, timeout_s=5), spaces
+
+    def test_client_is_built_once_and_working_api_name_is_remembered(self):
+        pool, spaces = self._pool(api_names=(None,))
+        backend = HuggingFaceSpaceNetlistBackend(space_id="fake/space", token="", client_pool=pool)
+
+        with mock.patch.dict("os.environ", {"I13_LLM_CACHE": "0"}):
+            self.assertEqual(backend.generate("rc"), RC_NETLIST)
+            self.assertEqual(backend.generate("rc"), RC_NETLIST)
+
+        self.assertEqual(pool.clients_created, 1)
+        self.assertIsNone(pool.working_api_name("fake/space"))
+        # The first call probes /predict, the second goes straight to the default endpoint.
+        self.assertEqual(spaces[0].submits, ["/predict", None, None])
+
+    def test_concurrent_first_calls_share_one_client(self):
+        pool, _ = self._pool(api_names=("/predict",), latency_s=0.05)
+        barrier = threading.Barrier(4)
+
+        def call(_):
+            barrier.wait()
+            return pool.predict("fake/space", "rc")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(call, range(4)))
+        self.assertEqual(results, [RC_NETLIST] * 4)
+        self.assertEqual(pool.clients_created, 1)
+
+    def test_slow_space_times_out_without_trying_other_variants(self):
+        pool, spaces = self._pool(api_names=("/predict", None), latency_s=0.5)
+        with self.assertRaises(TimeoutError):
+            pool.predict("fake/space", "rc", timeout_s=0.05)
+        self.assertEqual(spaces[0].submits, ["/predict"])
+
+    def test_failed_space_is_reconnected_on_next_call(self):
+        pool, spaces = self._pool(api_names=())
+        with self.assertRaises(RuntimeError):
+            pool.predict("fake/space", "rc")
+        with self.assertRaises(RuntimeError):
+            pool.predict("fake/space", "rc")
+        self.assertEqual(pool.clients_created, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
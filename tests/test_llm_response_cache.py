@@ -0,0 +1,102 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from core.async_llm import BoundedAsyncLLM, SharedEventLoop
+from core.llm_interface import LLMInterface
+from llm.netlist_backends import OpenAINetlistBackend
+from llm.response_cache import LLMResponseCache, consume_cache_activity, llm_cache_key, normalize_prompt
+
+
+class _CountingLLM(LLMInterface):
+    model = "counting"
+    temperature = 0.2
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate(self, prompt: str):
+        self.calls += 1
+        return {"netlist": f"* call {self.calls}\nR1 in out 1k\n.end"}
+
+
+class LLMResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = self._tmp.name
+        consume_cache_activity()
+
+    def test_key_ignores_whitespace_and_sample_id_but_not_model_or_temperature(self):
+        first = "Design a mirror.\n  Constraints: {'target_iout_a': 0.0001, 'sample_id': 3}"
+        second = "Design a mirror. Constraints: {'target_iout_a': 0.0001, 'sample_id': 7}"
+        self.assertEqual(normalize_prompt(first), normalize_prompt(second))
+        self.assertEqual(llm_cache_key("openai", "m", 0.2, first), llm_cache_key("openai", "m", 0.2, second))
+        self.assertNotEqual(llm_cache_key("openai", "m", 0.2, first), llm_cache_key("openai", "m", 0.7, first))
+        self.assertNotEqual(llm_cache_key("openai", "m", 0.2, first), llm_cache_key("openai", "n", 0.2, first))
+
+    def test_hits_skip_the_backend_and_are_reported_per_call(self):
+        cache = LLMResponseCache(root=self.root, ttl_s=60, max_bytes=1 << 20)
+        llm = _CountingLLM()
+
+        first = cache.call("openai", "m", 0.2, "prompt", llm.generate)
+        self.assertEqual(consume_cache_activity(), {"cache_hits": 0, "cache_misses": 1})
+        second = cache.call("openai", "m", 0.2, "  prompt ", llm.generate)
+        self.assertEqual(consume_cache_activity(), {"cache_hits": 1, "cache_misses": 0})
+
+        self.assertEqual(first, second)
+        self.assertEqual(llm.calls, 1)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1})
+
+    def test_expired_entries_are_regenerated(self):
+        cache = LLMResponseCache(root=self.root, ttl_s=60, max_bytes=1 << 20)
+        llm = _CountingLLM()
+        cache.call("openai", "m", 0.2, "prompt", llm.generate)
+        with mock.patch("llm.response_cache.time.time", return_value=time.time() + 120):
+            cache.call("openai", "m", 0.2, "prompt", llm.generate)
+        self.assertEqual(llm.calls, 2)
+
+    def test_size_budget_evicts_least_recently_used(self):
+        cache = LLMResponseCache(root=self.root, ttl_s=0, max_bytes=1 << 20)
+        keys = []
+        for idx in range(3):
+            key = llm_cache_key("openai", "m", 0.2, f"prompt {idx}")
+            cache.put(key, {"text": "x" * 200})
+            os.utime(cache._entry_path(key), (1000 + idx, 1000 + idx))
+            keys.append(key)
+        cache.max_bytes = sum(os.path.getsize(cache._entry_path(key)) for key in keys[1:])
+        self.assertEqual(cache.evict(), 1)
+        self.assertFalse(os.path.exists(cache._entry_path(keys[0])))
+        self.assertTrue(os.path.exists(cache._entry_path(keys[2])))
+
+    def test_netlist_backend_caching_honours_the_opt_out(self):
+        llm = _CountingLLM()
+        backend = OpenAINetlistBackend(llm=llm)
+        with mock.patch.dict(os.environ, {"I13_LLM_CACHE_DIR": self.root, "I13_LLM_CACHE": "1"}):
+            self.assertEqual(backend.generate("p"), backend.generate("p"))
+        with mock.patch.dict(os.environ, {"I13_LLM_CACHE_DIR": self.root, "I13_LLM_CACHE": "0"}):
+            backend.generate("p")
+        self.assertEqual(llm.calls, 2)
+
+    def test_bounded_client_reports_activity_to_the_calling_thread(self):
+        loop = SharedEventLoop()
+        self.addCleanup(loop.close)
+        cache = LLMResponseCache(root=self.root, ttl_s=0, max_bytes=1 << 20)
+        inner = _CountingLLM()
+
+        class _CachedLLM(LLMInterface):
+            response_cache = cache
+
+            def generate(self, prompt):
+                return cache.call("openai", "m", 0.2, prompt, inner.generate)
+
+        client = BoundedAsyncLLM(_CachedLLM(), max_concurrency=2, loop=loop)
+        client.generate("p")
+        client.generate("p")
+        self.assertEqual(consume_cache_activity(), {"cache_hits": 1, "cache_misses": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
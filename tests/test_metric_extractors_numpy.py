@@ -0,0 +1,126 @@
+import math
+import os
+import random
+import unittest
+from unittest import mock
+
+from core import metric_extractors
+from core.metric_extractors import (
+    extract_ac_metrics,
+    extract_current_mirror_dc_metrics,
+    extract_dc_metrics,
+    extract_line_regulation_metrics,
+    extract_phase_margin,
+    extract_transient_metrics,
+)
+
+try:
+    import numpy as np
+    from core import metric_extractors_numpy
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+    metric_extractors_numpy = None
+
+
+def _ac_series(points=200, gain=120.0, pole_hz=2e3, second_pole_hz=4e6):
+    xs = [10.0 ** (1.0 + 7.0 * idx / (points - 1)) for idx in range(points)]
+    mags, phases = [], []
+    for freq in xs:
+        response = gain / (complex(1.0, freq / pole_hz) * complex(1.0, freq / second_pole_hz))
+        mags.append(abs(response))
+        # Report wrapped phase the way ngspice prints it so unwrapping is exercised.
+        phases.append(math.degrees(math.atan2(response.imag, response.real)))
+    return {"x": xs, "y": mags}, {"x": xs, "y": phases}
+
+
+def _step_series(points, rising=True, seed=7):
+    rng = random.Random(seed)
+    tx, vin, vout, voutn = [], [], [], []
+    for idx in range(points):
+        t = idx * 1e-9
+        step = 1.0 if idx >= points // 5 else 0.0
+        elapsed = max(0.0, (idx - points // 5) / points)
+        ringing = math.exp(-elapsed * 40.0) * math.cos(elapsed * 300.0) if step else 0.0
+        response = step * (1.0 - ringing) + rng.uniform(-1e-4, 1e-4)
+        tx.append(t)
+        vin.append(0.2 * step)
+        vout.append(response if rising else 1.0 - response)
+        voutn.append(0.9 - 0.1 * response)
+    return {"x": tx, "y": vout}, {"x": tx, "y": vin}, {"x": tx, "y": voutn}
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class VectorizedMetricParityTests(unittest.TestCase):
+    def assertMetricsMatch(self, python_metrics, numpy_metrics):
+        self.assertEqual(set(python_metrics), set(numpy_metrics))
+        for key, expected in python_metrics.items():
+            actual = numpy_metrics[key]
+            self.assertIs(type(actual), type(expected), key)
+            if isinstance(expected, float):
+                self.assertTrue(math.isclose(actual, expected, rel_tol=1e-9, abs_tol=1e-12), (key, expected, actual))
+            else:
+                self.assertEqual(actual, expected, key)
+
+    def test_ac_and_phase_margin_match_python(self):
+        for gain in (0.5, 30.0, 120.0):
+            ac_data, phase_data = _ac_series(gain=gain)
+            self.assertMetricsMatch(
+                extract_ac_metrics.python(ac_data, input_ac_mag=1.0, phase_data=phase_data),
+                metric_extractors_numpy.extract_ac_metrics(ac_data, input_ac_mag=1.0, phase_data=phase_data),
+            )
+            python_pm = extract_phase_margin.python(ac_data, phase_data)
+            numpy_pm = metric_extractors_numpy.extract_phase_margin(ac_data, phase_data)
+            if python_pm is None:
+                self.assertIsNone(numpy_pm)
+            else:
+                self.assertAlmostEqual(python_pm, numpy_pm, places=9)
+
+    def test_dc_current_mirror_and_line_regulation_match_python(self):
+        ramp = {"x": [0.01 * idx for idx in range(400)], "y": [min(1e-4, 4e-4 * 0.01 * idx) for idx in range(400)]}
+        wobble = {"x": ramp["x"], "y": [math.sin(value) for value in ramp["x"]]}
+        for data in (ramp, wobble, {"x": [1.0], "y": [2.0]}, {"x": [], "y": []}):
+            self.assertMetricsMatch(extract_dc_metrics.python(data), metric_extractors_numpy.extract_dc_metrics(data))
+            self.assertMetricsMatch(
+                extract_current_mirror_dc_metrics.python(data, target_current_a=100e-6),
+                metric_extractors_numpy.extract_current_mirror_dc_metrics(data, target_current_a=100e-6),
+            )
+            self.assertMetricsMatch(
+                extract_line_regulation_metrics.python(data),
+                metric_extractors_numpy.extract_line_regulation_metrics(data),
+            )
+
+    def test_transient_metrics_match_python(self):
+        for rising in (True, False):
+            tran_out, tran_in, tran_outn = _step_series(5000, rising=rising)
+            self.assertMetricsMatch(
+                extract_transient_metrics.python(tran_out, tran_in_data=tran_in, tran_outn_data=tran_outn),
+                metric_extractors_numpy.extract_transient_metrics(
+                    tran_out, tran_in_data=tran_in, tran_outn_data=tran_outn
+                ),
+            )
+
+    def test_unsettled_transient_reports_no_settling_time(self):
+        tran_out = {"x": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0], "y": [0.0, 0.0, 1.0, 1.0, 1.0, 5.0]}
+        self.assertNotIn("settling_time_s", extract_transient_metrics.python(tran_out))
+        self.assertNotIn("settling_time_s", metric_extractors_numpy.extract_transient_metrics(tran_out))
+
+    def test_numpy_arrays_are_accepted_and_long_runs_stay_linear(self):
+        tran_out, tran_in, _ = _step_series(100_000)
+        arrays = {"x": np.asarray(tran_out["x"]), "y": np.asarray(tran_out["y"])}
+        python_metrics = extract_transient_metrics.python(tran_out, tran_in_data=tran_in)
+        self.assertIn("settling_time_s", python_metrics)
+        self.assertMetricsMatch(python_metrics, metric_extractors_numpy.extract_transient_metrics(arrays, tran_in_data=tran_in))
+
+    def test_public_functions_follow_the_backend_setting(self):
+        ac_data, phase_data = _ac_series()
+        with mock.patch.dict(os.environ, {"I13_METRIC_BACKEND": "python"}):
+            self.assertIsNone(metric_extractors._vector_backend())
+            python_metrics = extract_ac_metrics(ac_data, phase_data=phase_data)
+        with mock.patch.dict(os.environ, {"I13_METRIC_BACKEND": "numpy"}):
+            self.assertIs(metric_extractors._vector_backend(), metric_extractors_numpy)
+            numpy_metrics = extract_ac_metrics(ac_data, phase_data=phase_data)
+        self.assertMetricsMatch(python_metrics, numpy_metrics)
+
+
+if __name__ == "__main__":
+    unittest.main()
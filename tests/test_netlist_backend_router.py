@@ -0,0 +1,101 @@
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from llm.netlist_backends import HuggingFaceSpaceNetlistBackend, OpenAINetlistBackend, generate_netlist_with_backends
+
+
+RC_NETLIST = "* rc\nVin in 0 AC 1\nR1 in out 15915\nC1 out 0 10n\n.control\nac dec 10 1 1e6\n.endc\n.end\n"
+
+
+def _remote(delay_s, response=RC_NETLIST, error=None):
+    def generate(self, prompt):
+        time.sleep(delay_s)
+        if error:
+            raise RuntimeError(error)
+        return response
+
+    return generate
+
+
+class NetlistBackendRouterTests(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.dict(os.environ, {"I13_LLM_CACHE": "0"}),
+            mock.patch.object(HuggingFaceSpaceNetlistBackend, "available", lambda self: (True, "fake")),
+            mock.patch.object(OpenAINetlistBackend, "available", lambda self: (True, "fake")),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _route(self, hf, openai, mode, deadline_s=5.0, validate=None):
+        with mock.patch.object(HuggingFaceSpaceNetlistBackend, "generate", hf), mock.patch.object(
+            OpenAINetlistBackend, "generate", openai
+        ):
+            return generate_netlist_with_backends(
+                prompt="rc low-pass",
+                analyses=["ac"],
+                deterministic_builder=lambda: "* deterministic\nR1 in out 1k\n.end\n",
+                validate=validate,
+                mode=mode,
+                deadline_s=deadline_s,
+            )
+
+    def test_race_takes_first_valid_remote_answer_without_waiting_for_slow_failure(self):
+        start = time.perf_counter()
+        result = self._route(_remote(0.5, error="space asleep"), _remote(0.05), mode="race")
+        self.assertLess(time.perf_counter() - start, 0.4)
+        self.assertEqual(result.backend_used, "openai")
+        self.assertEqual(result.route, "race")
+        self.assertIn("openai", result.backend_latencies_s)
+        self.assertIn("huggingface_gradio: cancelled after openai won the race", result.fallback_reason)
+
+    def test_race_skips_candidates_that_fail_validation(self):
+        def validate(candidate):
+            return None if "15915" in candidate else "wrong resistor"
+
+        result = self._route(_remote(0.15), _remote(0.01, response="* bad\nR1 in out 1\n.end\n"), mode="race", validate=validate)
+        self.assertEqual(result.backend_used, "huggingface_gradio")
+        self.assertIn("openai: cleaned netlist invalid (wrong resistor)", result.fallback_reason)
+
+    def test_race_falls_back_to_eager_deterministic_netlist_at_deadline(self):
+        start = time.perf_counter()
+        result = self._route(_remote(0.5), _remote(0.5), mode="race", deadline_s=0.05)
+        self.assertLess(time.perf_counter() - start, 0.3)
+        self.assertEqual(result.backend_used, "local_deterministic")
+        self.assertIn("no answer within 0.05s deadline", result.fallback_reason)
+        self.assertIn("local_deterministic", result.backend_latencies_s)
+
+    def test_race_runs_remote_calls_on_daemon_threads(self):
+        daemon_flags = []
+
+        def hung(self, prompt):
+            daemon_flags.append(threading.current_thread().daemon)
+            time.sleep(1.0)
+            return RC_NETLIST
+
+        result = self._route(hung, hung, mode="race", deadline_s=0.05)
+        self.assertEqual(result.backend_used, "local_deterministic")
+        # A remote call still hanging after the deadline must not keep the interpreter alive.
+        self.assertEqual(daemon_flags, [True, True])
+
+    def test_sequential_route_keeps_backend_priority_and_records_latency(self):
+        result = self._route(_remote(0.0, error="space asleep"), _remote(0.0), mode="sequential")
+        self.assertEqual(result.backend_used, "openai")
+        self.assertEqual(result.route, "sequential")
+        self.assertEqual(sorted(result.backend_latencies_s), ["huggingface_gradio", "openai"])
+
+    def test_race_without_remote_backends_reports_the_sequential_route(self):
+        with mock.patch.object(HuggingFaceSpaceNetlistBackend, "available", lambda self: (False, "offline")), mock.patch.object(
+            OpenAINetlistBackend, "available", lambda self: (False, "no key")
+        ):
+            result = self._route(_remote(0.0), _remote(0.0), mode="race")
+        self.assertEqual(result.backend_used, "local_deterministic")
+        self.assertEqual(result.route, "sequential")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import stat
+import tempfile
+import unittest
+from unittest import mock
+
+from core import ngspice_backend
+from core.ngspice_backend import (
+    FallbackNgspice,
+    NgspiceEngineExited,
+    SharedNgspice,
+    SubprocessNgspice,
+    resolve_ngspice_backend,
+    sanitize_for_shared_engine,
+)
+
+
+FAKE_NGSPICE = """#!/bin/sh
+# Minimal stand-in for `ngspice -b -o <log> <netlist>`.
+echo "fake run of $4" > "$3"
+echo "v(out) = 1.000000e+00" >> "$3"
+"""
+
+
+
+class FakeLibngspice:
+    """Stand-in for the libngspice C API; `exit_on_source` fires the controlled-exit callback."""
+
+    def __init__(self, exit_on_source=False):
+        self.commands = []
+        self.exit_on_source = exit_on_source
+        self.callbacks = None
+        self.ngSpice_Init = mock.Mock(side_effect=self._init)
+        self.ngSpice_Command = mock.Mock(side_effect=self._command)
+        self.ngSpice_AllPlots = mock.Mock(return_value=[b"ac1", b"const", None])
+        self.ngSpice_AllVecs = mock.Mock(return_value=[b"v(out)", None])
+        self.ngGet_Vec_Info = mock.Mock(
+            return_value=mock.Mock(contents=mock.Mock(v_realdata=[0.5, 0.25], v_compdata=None, v_length=2))
+        )
+
+    def _init(self, send_char, send_stat, controlled_exit, *rest):
+        self.callbacks = (send_char, controlled_exit)
+
+    def _command(self, command):
+        command = command.decode()
+        self.commands.append(command)
+        if command.startswith("source "):
+            self.callbacks[0](b"stdout Circuit: fake", 0, None)
+            if self.exit_on_source:
+                self.callbacks[1](1, False, True, 0, None)
+        return 0
+
+
+class SharedNgspiceTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.lib_path = os.path.join(self.tmp.name, "libngspice.so")
+        with open(os.path.join(self.tmp.name, "generated.sp"), "w") as handle:
+            handle.write("* rc\nR1 in out 1k\n.control\nset filetype = binary wr_singlescale\nac dec 10 1 1k\nquit\n.endc\n.end\n")
+        patcher = mock.patch.multiple(ngspice_backend, _SHARED_ENGINES={}, _EXITED_LIBRARIES=set())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _engine(self, lib):
+        with mock.patch.object(ngspice_backend.ctypes, "CDLL", return_value=lib):
+            return ngspice_backend._shared_engine(self.lib_path)
+
+    def test_run_collects_vectors_and_resets_deck_variables(self):
+        lib = FakeLibngspice()
+        engine = self._engine(lib)
+        run = engine.run("generated.sp", cwd=self.tmp.name)
+
+        self.assertEqual(run.returncode, 0)
+        self.assertEqual(run.vectors, {"ac1": {"v(out)": [0.5, 0.25]}})
+        self.assertEqual(lib.commands[1:], ["unset filetype", "unset wr_singlescale", "destroy all", "remcirc"])
+        with open(run.log_path) as handle:
+            self.assertIn("Circuit: fake", handle.read())
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["generated.sp", "ngspice.log"])
+
+    def test_controlled_exit_drops_the_engine_and_reruns_on_the_subprocess_path(self):
+        lib = FakeLibngspice(exit_on_source=True)
+        engine = self._engine(lib)
+        fallback = mock.Mock(path="ngspice")
+        fallback.run.return_value = "subprocess result"
+        backend = FallbackNgspice(engine, fallback)
+
+        self.assertEqual(backend.run("generated.sp", cwd=self.tmp.name), "subprocess result")
+        self.assertTrue(engine.exited)
+        self.assertNotIn("destroy all", lib.commands)
+        self.assertIsNone(self._engine(FakeLibngspice()))
+        with self.assertRaises(NgspiceEngineExited):
+            engine.run("generated.sp", cwd=self.tmp.name)
+
+        backend.run("generated.sp", cwd=self.tmp.name)
+        self.assertEqual(fallback.run.call_count, 2)
+        self.assertEqual(len([command for command in lib.commands if command.startswith("source ")]), 1)
+
+    def test_failed_shared_run_is_rerun_on_the_subprocess_path(self):
+        engine = mock.Mock(spec=SharedNgspice, exited=False)
+        engine.name = "shared"
+        engine.run.return_value = mock.Mock(returncode=1)
+        fallback = mock.Mock(path="ngspice")
+        backend = FallbackNgspice(engine, fallback)
+
+        self.assertIs(backend.run("generated.sp", cwd=self.tmp.name), fallback.run.return_value)
+
+
+class NgspiceBackendTests(unittest.TestCase):
+    def test_sanitize_makes_outputs_absolute_and_drops_quit(self):
+        netlist = "\n".join(
+            [
+                "V1 in 0 DC 1",
+                ".control",
+                "set wr_singlescale",
+                "wrdata ac_out.csv frequency vm(out)",
+                "write /tmp/raw.bin all",
+                "quit",
+                ".endc",
+                ".end",
+            ]
+        )
+        sanitized = sanitize_for_shared_engine(netlist, "/work/run")
+        self.assertIn("wrdata /work/run/ac_out.csv frequency vm(out)", sanitized)
+        self.assertIn("write /tmp/raw.bin all", sanitized)
+        self.assertNotIn("quit", sanitized)
+        self.assertIn("set wr_singlescale", sanitized)
+
+    def test_subprocess_backend_writes_log_in_run_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exe = os.path.join(tmpdir, "ngspice")
+            with open(exe, "w") as handle:
+                handle.write(FAKE_NGSPICE)
+            os.chmod(exe, os.stat(exe).st_mode | stat.S_IEXEC)
+            with open(os.path.join(tmpdir, "generated.sp"), "w") as handle:
+                handle.write("* empty\n.end\n")
+
+            with mock.patch.dict(os.environ, {"I13_NGSPICE_BACKEND": "subprocess"}):
+                backend = resolve_ngspice_backend(exe)
+            self.assertIsInstance(backend, SubprocessNgspice)
+
+            run = backend.run("generated.sp", cwd=tmpdir, log_name="ngspice.log")
+            self.assertEqual(run.returncode, 0)
+            self.assertEqual(run.backend, "subprocess")
+            with open(run.log_path) as handle:
+                self.assertIn("v(out) = 1.000000e+00", handle.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import time
+import unittest
+
+from core.parallel_executor import resolve_jobs, run_ordered
+
+
+def _slow_square(value):
+    time.sleep(0.05 * (3 - value))
+    return value * value
+
+
+class ParallelExecutorTests(unittest.TestCase):
+    def test_serial_and_pool_results_keep_request_order(self):
+        items = [0, 1, 2]
+        serial = run_ordered(_slow_square, items, jobs=1)
+        finished = []
+        pooled = run_ordered(_slow_square, items, jobs=3, on_result=lambda index, _: finished.append(index))
+        self.assertEqual(serial, [0, 1, 4])
+        self.assertEqual(pooled, serial)
+        self.assertEqual(sorted(finished), [0, 1, 2])
+
+    def test_resolve_jobs_reads_environment_and_clamps(self):
+        self.assertEqual(resolve_jobs(3), 3)
+        self.assertEqual(resolve_jobs("bogus"), 1)
+        self.assertGreaterEqual(resolve_jobs(0), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
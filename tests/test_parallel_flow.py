@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+import warnings
+
+from core.shared_memory import SharedMemory
+from core.verification_pipeline import attach_schematic_artifacts
+from flow.pocketflow import Flow, Node, ParallelNode
+
+
+class _WriterNode(Node):
+    def __init__(self, key, value, delay_s=0.0, action="done"):
+        super().__init__()
+        self.key, self.value, self.delay_s, self.action = key, value, delay_s, action
+
+    def exec(self, prep_res):
+        time.sleep(self.delay_s)
+        return self.value
+
+    def post(self, shared, prep_res, exec_res):
+        shared.write(self.key, exec_res)
+        shared.append_history("wrote", {"key": self.key})
+        return self.action
+
+
+class _ReaderNode(Node):
+    def post(self, shared, prep_res, exec_res):
+        shared.write("seen_by_reader", shared.read("slow"))
+        return "read"
+
+
+class _FailingNode(Node):
+    def exec(self, prep_res):
+        raise RuntimeError("branch failed")
+
+
+class _EndNode(Node):
+    def post(self, shared, prep_res, exec_res):
+        shared.write("ended", True)
+
+
+class ParallelNodeTests(unittest.TestCase):
+    def test_branches_overlap_and_merge_in_branch_order(self):
+        memory = SharedMemory()
+        fan_out = ParallelNode([_WriterNode("slow", 1, delay_s=0.2, action="primary"), _WriterNode("fast", 2, delay_s=0.2)])
+        fan_out - "primary" >> _EndNode()
+
+        start = time.perf_counter()
+        Flow(start=fan_out).run(memory)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.35)
+        self.assertEqual((memory.read("slow"), memory.read("fast"), memory.read("ended")), (1, 2, True))
+        wrote = [event["data"]["key"] for event in memory.iter_history() if event["event"] == "wrote"]
+        self.assertEqual(wrote, ["slow", "fast"])
+
+    def test_branches_do_not_see_each_others_writes(self):
+        memory = SharedMemory()
+        memory.write("slow", "before")
+        Flow(start=ParallelNode([_WriterNode("slow", "after", delay_s=0.05), _ReaderNode()])).run(memory)
+        self.assertEqual(memory.read("seen_by_reader"), "before")
+        self.assertEqual(memory.read("slow"), "after")
+
+    def test_conflicting_writes_keep_the_later_branch_and_warn(self):
+        memory = SharedMemory()
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            ParallelNode([_WriterNode("key", "first"), _WriterNode("key", "second", delay_s=0.05)]).run(memory)
+        self.assertEqual(memory.read("key"), "second")
+        self.assertTrue(any("both wrote 'key'" in str(item.message) for item in caught))
+
+    def test_branch_failure_is_raised_without_merging(self):
+        memory = SharedMemory()
+        with self.assertRaises(RuntimeError):
+            ParallelNode([_WriterNode("key", 1), _FailingNode()]).run(memory)
+        self.assertIsNone(memory.read("key"))
+
+    def test_process_backend_merges_like_threads(self):
+        memory = SharedMemory()
+        memory.write("slow", "before")
+        action = ParallelNode([_WriterNode("fast", 2, action="primary"), _ReaderNode()], backend="process").run(memory)
+        self.assertEqual(action, "primary")
+        self.assertEqual((memory.read("fast"), memory.read("seen_by_reader")), (2, "before"))
+
+
+class SchematicJoinTests(unittest.TestCase):
+    def test_late_schematic_is_linked_into_the_artifact_bundle(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for bucket in ("plots", "reports"):
+                os.makedirs(os.path.join(tmpdir, bucket))
+            svg_path = os.path.join(tmpdir, "schematic.svg")
+            with open(svg_path, "w") as handle:
+                handle.write("<svg/>")
+            sim = {"artifact_dir": tmpdir, "schematic_status": "pending", "artifact_manifest": {"plots": [], "reports": []}}
+
+            attach_schematic_artifacts(sim, {"schematic_svg_path": svg_path, "schematic_status": "generic_svg"})
+
+            self.assertEqual(sim["schematic_status"], "generic_svg")
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, "plots", "schematic.svg")))
+            with open(os.path.join(tmpdir, "reports", "artifact_manifest.json")) as handle:
+                self.assertEqual(json.load(handle)["plots"], [os.path.join(tmpdir, "plots", "schematic.svg")])
+            with open(os.path.join(tmpdir, "reports", "simulation_result.json")) as handle:
+                self.assertEqual(json.load(handle)["schematic_svg_path"], svg_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
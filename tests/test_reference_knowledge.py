@@ -1,13 +1,15 @@
 import json
+import os
 import tempfile
 import textwrap
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from agents.sizing_agent import SizingAgent
 from agents.topology_agent import TopologyAgent
 from agents.simulation_agent import SimulationAgent
-from core.reference_knowledge import ReferenceCatalog, yaml
+from core.reference_knowledge import ReferenceCatalog, ReferenceEntry, load_catalog_snapshot, load_reference_catalog, yaml
 from core.shared_memory import SharedMemory
 
 
@@ -81,6 +83,95 @@ class ReferenceCatalogTests(unittest.TestCase):
             hits = catalog.search(query="rc lowpass", topologies=["rc_lowpass"], content_types=["evaluation_criteria"])
             self.assertTrue(any(hit["id"] == "yaml-entry" for hit in hits))
 
+    def test_indexed_search_matches_linear_scan_on_shipped_references(self):
+        catalog = load_reference_catalog()
+        self.assertTrue(catalog.entries)
+        queries = ["", "amp", "current mirror compliance", "two stage miller phase margin", "adc reference buffer", "ldo"]
+        filters = [
+            {},
+            {"topologies": ["rc_lowpass"]},
+            {"topologies": ["current_mirror", "two_stage_miller"], "content_types": ["template"]},
+            {"vendor": "ti", "limit": 10},
+        ]
+        for query in queries:
+            for options in filters:
+                with self.subTest(query=query, **{key: str(value) for key, value in options.items()}):
+                    self.assertEqual(catalog.search(query, **options), catalog._search_linear(query, **options))
+
+    def test_substring_matches_and_query_cache_return_fresh_payloads(self):
+        catalog = ReferenceCatalog(
+            entries=[
+                _entry("amp-note", "Amplifier Notes", summary="Class AB output stage."),
+                _entry("filter-note", "Filter Notes", body="Pre-amplification before the filter."),
+            ]
+        )
+        hits = catalog.search("amp")
+        self.assertEqual([hit["id"] for hit in hits], ["amp-note", "filter-note"])
+        self.assertEqual([hit["score"] for hit in hits], [3.0, 0.75])
+
+        hits[0]["tags"].append("mutated")
+        self.assertEqual(catalog.search("amp"), catalog._search_linear("amp"))
+
+    def test_snapshot_is_reused_until_a_reference_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir) / "refs"
+            root.mkdir()
+            note = root / "note.json"
+            note.write_text(json.dumps({"id": "n1", "title": "Mirror Note", "topologies": ["current_mirror"]}), encoding="utf-8")
+            cache_dir = str(Path(tmpdir) / "cache")
+
+            first = load_catalog_snapshot([str(root)], cache_dir=cache_dir)
+            with mock.patch.object(ReferenceCatalog, "from_paths", side_effect=AssertionError("re-parsed")):
+                cached = load_catalog_snapshot([str(root)], cache_dir=cache_dir)
+            self.assertEqual(cached.search("mirror"), first.search("mirror"))
+
+            note.write_text(json.dumps({"id": "n1", "title": "Cascode Note", "topologies": ["current_mirror"]}), encoding="utf-8")
+            os.utime(note, ns=(note.stat().st_mtime_ns + 10**9,) * 2)
+            refreshed = load_catalog_snapshot([str(root)], cache_dir=cache_dir)
+            self.assertEqual([hit["title"] for hit in refreshed.search("cascode")], ["Cascode Note"])
+
+    def test_failed_snapshot_write_leaves_no_staging_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir) / "refs"
+            root.mkdir()
+            (root / "note.json").write_text(json.dumps({"id": "n1", "title": "Mirror Note"}), encoding="utf-8")
+            cache_dir = Path(tmpdir) / "cache"
+
+            with mock.patch("core.reference_knowledge.os.replace", side_effect=OSError("disk full")):
+                catalog = load_catalog_snapshot([str(root)], cache_dir=str(cache_dir))
+
+            self.assertEqual([hit["title"] for hit in catalog.search("mirror")], ["Mirror Note"])
+            self.assertEqual(list(cache_dir.iterdir()), [])
+
+    def test_bm25f_ranking_is_selectable_and_matches_whole_tokens(self):
+        catalog = ReferenceCatalog(
+            entries=[
+                _entry("class-ab-note", "Amplifier Notes", summary="Class AB output stage."),
+                _entry("amp-short", "Amp Cheat Sheet", summary="Amp biasing at a glance."),
+                _entry("filter-note", "Filter Notes", body="Amp before the filter."),
+            ]
+        )
+        hits = catalog.search("amp", ranking="bm25f")
+        self.assertEqual([hit["id"] for hit in hits], ["amp-short", "filter-note"])
+        self.assertGreater(hits[0]["score"], hits[1]["score"])
+        with mock.patch.dict(os.environ, {"I13_REFERENCE_RANKING": "bm25f"}):
+            self.assertEqual(catalog.search("amp"), hits)
+        self.assertEqual(len(catalog.search("amp", ranking="legacy")), 3)
+
+    def test_ranking_benchmark_reports_agreement_on_shipped_references(self):
+        from evaluation.reference_ranking_benchmark import benchmark_queries, compare_rankings
+
+        queries = benchmark_queries()[:8]
+        report = compare_rankings(load_reference_catalog(), queries, k=5, repeats=1)
+        self.assertTrue(report["legacy_indexed_matches_linear"])
+        self.assertEqual(report["query_count"], len(queries))
+        self.assertGreaterEqual(report["mean_overlap_at_k"], 0.0)
+        self.assertEqual(set(report["latency_ms"]), {"legacy_linear", "legacy_indexed", "bm25f"})
+
+
+def _entry(ref_id, title, summary="", body=""):
+    return ReferenceEntry(ref_id=ref_id, title=title, schema="note", content_type="note", summary=summary, body=body)
+
 
 class ReferenceDrivenAgentTests(unittest.TestCase):
     def test_topology_agent_can_pick_from_reference_catalog(self):
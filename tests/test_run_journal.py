@@ -0,0 +1,151 @@
+import json
+import os
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+
+from core.run_journal import RunJournal
+from evaluation import benchmark_runner
+from llm.local_llm_stub import LocalLLMStub
+
+
+class RunJournalTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = self._tmp.name
+
+    def test_resume_loads_completed_points_and_skips_a_torn_line(self):
+        journal = RunJournal.start(self.root, "sweep", {"values": [1.0, 2.0]})
+        journal.record("x=1.0", {"requested_spec": 1.0, "pass_fail": "PASSED"})
+        with open(journal.path, "a") as handle:
+            handle.write('{"type": "point", "key": "x=2.0", "res')
+
+        resumed = RunJournal.resume(self.root, "sweep")
+        self.assertEqual(resumed.header()["config"], {"values": [1.0, 2.0]})
+        self.assertEqual(list(resumed.completed), ["x=1.0"])
+        resumed.record("x=2.0", {"requested_spec": 2.0, "pass_fail": "FAILED"})
+        self.assertEqual(sorted(RunJournal.resume(self.root).completed), ["x=1.0", "x=2.0"])
+
+    def test_start_discards_an_earlier_journal_and_resume_checks_the_kind(self):
+        RunJournal.start(self.root, "sweep", {}).record("x=1.0", {})
+        self.assertEqual(RunJournal.resume(RunJournal.start(self.root, "grid", {}).directory).completed, {})
+        with self.assertRaises(ValueError):
+            RunJournal.resume(self.root, "sweep")
+        with self.assertRaises(FileNotFoundError):
+            RunJournal.resume(os.path.join(self.root, "missing"))
+
+
+class BenchmarkResumeTests(unittest.TestCase):
+    def test_resume_runs_only_missing_samples(self):
+        def fake_sample(task):
+            case_name, sample_idx, _ = task
+            return {"case": case_name, "sample_index": sample_idx, "success": True, "duration_s": 1.0, "cpu_time_s": 0.5}
+
+        with tempfile.TemporaryDirectory() as out_dir:
+            journal = RunJournal.start(
+                out_dir,
+                "benchmark",
+                {"cases": ["rc"], "samples_per_case": 3, "ks": [1], "prompt_jitter": False, "timestamp": "20260101_000000"},
+            )
+            journal.record("rc#0", fake_sample(("rc", 0, False)))
+            with mock.patch.dict(os.environ, {"BENCH_WORKERS": "1"}):
+                with mock.patch.object(benchmark_runner, "_run_benchmark_sample", side_effect=fake_sample) as run_sample:
+                    benchmark_runner.run_benchmark(resume_dir=out_dir)
+
+            self.assertEqual([call.args[0][1] for call in run_sample.call_args_list], [1, 2])
+            with open(os.path.join(out_dir, "benchmark_summary.json")) as handle:
+                report = json.load(handle)
+            self.assertEqual(report["overall"]["total_samples"], 3)
+            self.assertEqual(report["config"]["resumed_samples"], 1)
+            self.assertEqual(len(RunJournal.resume(out_dir).completed), 3)
+
+
+def _sleepy_sample(task):
+    # Module level so the worker processes can unpickle it; even samples finish last.
+    case_name, sample_idx, _ = task
+    start = time.time()
+    time.sleep(0.3 if sample_idx % 2 == 0 else 0.05)
+    return {"case": case_name, "sample_index": sample_idx, "success": True, "duration_s": time.time() - start, "cpu_time_s": 0.25}
+
+
+class BenchmarkWorkerTests(unittest.TestCase):
+    def test_two_workers_keep_sample_order_and_report_overlap(self):
+        with tempfile.TemporaryDirectory() as out_dir:
+            RunJournal.start(
+                out_dir,
+                "benchmark",
+                {"cases": ["rc"], "samples_per_case": 4, "ks": [1], "prompt_jitter": False, "timestamp": "20260101_000000"},
+            )
+            with mock.patch.dict(os.environ, {"BENCH_WORKERS": "2", "BENCH_ASYNC_LLM": "0"}):
+                with mock.patch.object(benchmark_runner, "_run_benchmark_sample", _sleepy_sample):
+                    benchmark_runner.run_benchmark(resume_dir=out_dir)
+            with open(os.path.join(out_dir, "benchmark_summary.json")) as handle:
+                report = json.load(handle)
+
+        overall = report["overall"]
+        self.assertEqual(report["config"]["workers"], 2)
+        self.assertEqual([item["sample_index"] for item in report["samples"]["rc"]], [0, 1, 2, 3])
+        self.assertGreaterEqual(overall["summed_sample_runtime_s"], 0.7)
+        self.assertLess(overall["wall_clock_s"], overall["summed_sample_runtime_s"])
+        self.assertAlmostEqual(overall["summed_cpu_time_s"], 1.0)
+
+
+_CASE_PROMPTS = {
+    "rc": "Choose the single best topology key for a low-pass filter.",
+    "mirror": "Choose the single best topology key for a current mirror.",
+    "diff_pair": "Choose the single best topology key for a differential amplifier.",
+}
+
+
+def _llm_sample(task, llm):
+    case_name, sample_idx, _ = task
+    start = time.time()
+    topology = llm.generate(_CASE_PROMPTS[case_name])["topology"]
+    return {
+        "case": case_name,
+        "sample_index": sample_idx,
+        "success": True,
+        "topology": topology,
+        "duration_s": time.time() - start,
+        "cpu_time_s": 0.0,
+    }
+
+
+class SharedLLMBenchmarkTests(unittest.TestCase):
+    def _run(self, env):
+        with tempfile.TemporaryDirectory() as out_dir:
+            RunJournal.start(
+                out_dir,
+                "benchmark",
+                {"cases": list(_CASE_PROMPTS), "samples_per_case": 1, "ks": [1], "prompt_jitter": False, "timestamp": "20260101_000000"},
+            )
+            stub = LocalLLMStub(latency_s=0.4)
+            with mock.patch.dict(os.environ, env), \
+                    mock.patch.object(benchmark_runner, "build_llm", return_value=types.SimpleNamespace(llm=stub)), \
+                    mock.patch.object(benchmark_runner, "_run_threaded_benchmark_sample", side_effect=_llm_sample), \
+                    mock.patch.object(benchmark_runner, "_run_benchmark_sample", side_effect=lambda task: _llm_sample(task, stub)):
+                benchmark_runner.run_benchmark(resume_dir=out_dir)
+            with open(os.path.join(out_dir, "benchmark_summary.json")) as handle:
+                return json.load(handle)
+
+    def test_samples_overlap_on_one_client_and_match_a_serial_run(self):
+        shared = self._run({"BENCH_ASYNC_LLM": "1", "BENCH_WORKERS": "3"})
+        serial = self._run({"BENCH_ASYNC_LLM": "0", "BENCH_WORKERS": "1"})
+
+        self.assertTrue(shared["config"]["shared_llm"])
+        # Three 0.4 s calls in flight together, not back to back.
+        self.assertGreaterEqual(shared["overall"]["summed_sample_runtime_s"], 1.2)
+        self.assertLess(shared["overall"]["wall_clock_s"], 0.8)
+
+        def topologies(report):
+            return {case: [item["topology"] for item in items] for case, items in report["samples"].items()}
+
+        self.assertEqual(topologies(shared), {"rc": ["rc_lowpass"], "mirror": ["current_mirror"], "diff_pair": ["diff_pair"]})
+        self.assertEqual(topologies(shared), topologies(serial))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+from core.schematic_artifacts import SchematicRenderQueue, complete_queued_schematics
+from core.shared_memory import SharedMemory
+from tools.netlist_to_schematic import _run_with_timeout, _try_lcapy
+
+
+def _fake_render(netlist_path, base_dir, topology=None, sizing=None, constraints=None):
+    svg_path = os.path.join(base_dir, "schematic.svg")
+    with open(svg_path, "w") as handle:
+        handle.write("<svg/>")
+    return {
+        "schematic_png_path": None,
+        "schematic_svg_path": svg_path,
+        "schematic_status": "topology_schematic",
+        "schematic_failure_reason": None,
+        "schematic_metadata_path": None,
+    }
+
+
+class SchematicRenderQueueTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        patcher = mock.patch("core.schematic_artifacts.render_schematic_artifacts", side_effect=_fake_render)
+        self.render = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _attempt(self, name, netlist):
+        base_dir = os.path.join(self._tmp.name, name)
+        for bucket in ("plots", "reports"):
+            os.makedirs(os.path.join(base_dir, bucket))
+        netlist_path = os.path.join(base_dir, "generated.sp")
+        with open(netlist_path, "w") as handle:
+            handle.write(netlist)
+        return base_dir, netlist_path
+
+    def test_identical_netlists_render_once(self):
+        queue = SchematicRenderQueue()
+        first_dir, first = self._attempt("a1", "R1 in out 1k\n.end\n")
+        second_dir, second = self._attempt("a2", "R1 in out 1k\n.end\n")
+        _, other = self._attempt("a3", "R1 in out 2k\n.end\n")
+
+        key = queue.submit(first, first_dir, topology="rc_lowpass")
+        self.assertEqual(queue.submit(second, second_dir, topology="rc_lowpass"), key)
+        other_key = queue.submit(other, second_dir, topology="rc_lowpass")
+        self.assertNotEqual(other_key, key)
+        self.assertEqual(queue.result(key)["schematic_svg_path"], os.path.join(first_dir, "schematic.svg"))
+        queue.result(other_key)
+        self.assertEqual(self.render.call_count, 2)
+
+        os.remove(os.path.join(first_dir, "schematic.svg"))
+        queue.submit(second, second_dir, topology="rc_lowpass")
+        self.assertEqual(queue.result(key)["schematic_svg_path"], os.path.join(second_dir, "schematic.svg"))
+        self.assertEqual(queue.stats(), {"unique_netlists": 2, "renders": 3, "pending": 0})
+
+    def test_end_of_run_completion_updates_every_attempt(self):
+        queue = SchematicRenderQueue()
+        earlier_dir, earlier = self._attempt("attempt-01", "R1 in out 1k\n.end\n")
+        latest_dir, latest = self._attempt("attempt-02", "R1 in out 2k\n.end\n")
+        with open(os.path.join(earlier_dir, "reports", "simulation_result.json"), "w") as handle:
+            json.dump({"artifact_dir": earlier_dir, "schematic_status": "pending", "artifact_manifest": {"plots": []}}, handle)
+
+        memory = SharedMemory()
+        memory.write(
+            "schematic_requests",
+            [
+                {"key": queue.submit(earlier, earlier_dir), "attempt_dir": earlier_dir},
+                {"key": queue.submit(latest, latest_dir), "attempt_dir": latest_dir},
+            ],
+        )
+        memory.write("simulation_results", {"artifact_dir": latest_dir, "schematic_status": "pending", "artifact_manifest": {"plots": []}})
+
+        completed = complete_queued_schematics(memory, queue=queue)
+
+        self.assertEqual([item["schematic_status"] for item in completed], ["topology_schematic"] * 2)
+        self.assertEqual(memory.read("simulation_results")["schematic_status"], "topology_schematic")
+        self.assertTrue(os.path.exists(os.path.join(latest_dir, "plots", "schematic.svg")))
+        with open(os.path.join(earlier_dir, "reports", "simulation_result.json")) as handle:
+            self.assertEqual(json.load(handle)["schematic_status"], "topology_schematic")
+
+    def test_a_later_run_with_the_same_netlist_gets_its_own_copies(self):
+        queue = SchematicRenderQueue()
+        first_dir, first = self._attempt("run1-attempt", "R1 in out 1k\n.end\n")
+        second_dir, second = self._attempt("run2-attempt", "R1 in out 1k\n.end\n")
+        for attempt_dir, netlist_path in ((first_dir, first), (second_dir, second)):
+            memory = SharedMemory()
+            memory.write("schematic_requests", [{"key": queue.submit(netlist_path, attempt_dir), "attempt_dir": attempt_dir}])
+            memory.write("simulation_results", {"artifact_dir": attempt_dir, "schematic_status": "pending", "artifact_manifest": {"plots": []}})
+            complete_queued_schematics(memory, queue=queue)
+
+        self.assertEqual(self.render.call_count, 1)
+        svg_path = memory.read("simulation_results")["schematic_svg_path"]
+        self.assertEqual(svg_path, os.path.join(second_dir, "schematic.svg"))
+        self.assertTrue(os.path.exists(svg_path))
+
+
+class RenderTimeoutTests(unittest.TestCase):
+    def test_timeout_works_off_the_main_thread(self):
+        outcome = {}
+
+        def worker():
+            outcome["value"] = _run_with_timeout(lambda: 42, 2)
+            try:
+                _run_with_timeout(lambda: time.sleep(0.5), 0.05)
+            except TimeoutError as exc:
+                outcome["timeout"] = str(exc)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(outcome["value"], 42)
+        self.assertIn("exceeded", outcome["timeout"])
+
+    def test_abandoned_lcapy_render_never_overwrites_the_fallback(self):
+        finished = threading.Event()
+
+        class SlowCircuit:
+            def __init__(self, text):
+                pass
+
+            def draw(self, path):
+                time.sleep(1.5)
+                try:
+                    with open(path, "w") as handle:
+                        handle.write("<svg>lcapy</svg>")
+                finally:
+                    finished.set()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            svg_path = os.path.join(tmp, "schematic.svg")
+            outcome = {}
+            fake_lcapy = types.SimpleNamespace(Circuit=SlowCircuit)
+            with mock.patch.dict("sys.modules", {"lcapy": fake_lcapy}), mock.patch.dict(
+                os.environ, {"I13_SCHEMATIC_LCAPY_TIMEOUT": "1"}
+            ):
+                thread = threading.Thread(
+                    target=lambda: outcome.update(_try_lcapy("R1 in out 1k\nC1 out 0 1n\n", os.path.join(tmp, "schematic.png"), svg_path))
+                )
+                thread.start()
+                thread.join()
+                with open(svg_path, "w") as handle:
+                    handle.write("<svg>fallback</svg>")
+                self.assertTrue(finished.wait(5))
+
+            self.assertEqual(outcome["schematic_status"], "failed")
+            with open(svg_path) as handle:
+                self.assertEqual(handle.read(), "<svg>fallback</svg>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core.shared_memory import SharedMemory, iter_history
+from main import _history_log_path
+
+
+class SharedMemoryTests(unittest.TestCase):
+    def test_snapshots_keep_their_version_and_share_history_copies(self):
+        memory = SharedMemory()
+        sizing = {"R": 1000.0}
+        memory.write("sizing", sizing)
+        before = memory.snapshot()
+
+        sizing["R"] = 2000.0
+        memory.write("sizing", sizing)
+        after = memory.snapshot()
+
+        self.assertEqual(before["sizing"]["R"], 1000.0)
+        self.assertEqual(after["sizing"]["R"], 2000.0)
+        self.assertGreater(after.version, before.version)
+        self.assertEqual(len(before["history"]), 1)
+        self.assertEqual(len(after["history"]), 2)
+        self.assertIs(memory.state["history"][-1]["data"]["sizing"], memory._committed["sizing"])
+        with self.assertRaises(TypeError):
+            after["sizing"]["R"] = 5.0
+
+    def test_working_state_copies_lazily_and_stays_local(self):
+        memory = SharedMemory()
+        memory.write("sizing", {"R": 1000.0})
+        memory.write("simulation_results", {"ac": list(range(1000))})
+
+        state = memory.working_state()
+        self.assertNotIn("simulation_results", dict(state))
+        state["sizing"]["R"] = 10.0
+        state["status"] = "refined"
+
+        self.assertEqual(memory.read("sizing")["R"], 1000.0)
+        self.assertEqual(state.get("sizing")["R"], 10.0)
+        self.assertIn("simulation_results", state)
+        self.assertEqual(state.get("missing", "default"), "default")
+        self.assertNotEqual(memory.read("status"), "refined")
+
+    def test_history_ring_is_bounded_and_full_log_streams_to_jsonl(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, "history", "run.jsonl")
+            memory = SharedMemory(history_log_path=log_path, history_limit=5)
+            for index in range(20):
+                memory.append_history("llm_call", {"index": index})
+
+            self.assertEqual(len(memory.state["history"]), 5)
+            self.assertEqual([item["data"]["index"] for item in memory.get_recent_history(3)], [17, 18, 19])
+            self.assertEqual([item["data"]["index"] for item in memory.iter_history()], list(range(20)))
+
+            final_state = memory.get_full_state()
+            memory.close()
+            self.assertEqual(final_state["history_event_count"], 20)
+            self.assertEqual(len(list(iter_history(final_state))), 20)
+            self.assertEqual(len(memory.snapshot()["history"]), 5)
+
+    def test_history_stays_unbounded_without_a_log_file(self):
+        memory = SharedMemory(history_limit=5)
+        for index in range(20):
+            memory.append_history("llm_call", {"index": index})
+        self.assertEqual(len(memory.state["history"]), 20)
+        self.assertEqual(len(list(iter_history(memory.get_full_state()))), 20)
+
+    def test_history_dir_keeps_only_the_newest_logs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for index in range(5):
+                path = os.path.join(tmp, f"old_{index}.jsonl")
+                with open(path, "w") as handle:
+                    handle.write("{}\n")
+                os.utime(path, (1000 + index, 1000 + index))
+            with mock.patch.dict(os.environ, {"I13_HISTORY_DIR": tmp, "I13_HISTORY_KEEP": "3", "I13_HISTORY_LOG": "1"}):
+                path = _history_log_path("rc")
+            self.assertEqual(os.path.dirname(path), tmp)
+            self.assertEqual(sorted(os.listdir(tmp)), ["old_3.jsonl", "old_4.jsonl"])
+
+    def test_pruning_spares_logs_of_runs_still_in_progress(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.dict(os.environ, {"I13_HISTORY_DIR": tmp, "I13_HISTORY_KEEP": "1", "I13_HISTORY_LOG": "1"}):
+                first = _history_log_path("rc")
+                with open(first, "w") as handle:
+                    handle.write("{}\n")
+                second = _history_log_path("mirror")
+            self.assertTrue(os.path.exists(first))
+            self.assertNotEqual(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
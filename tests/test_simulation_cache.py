@@ -0,0 +1,106 @@
+import os
+import stat
+import tempfile
+import unittest
+
+from core.ngspice_backend import SubprocessNgspice
+from core.simulation_cache import CachedNgspice, SimulationCache, normalize_netlist
+
+
+FAKE_NGSPICE = """#!/bin/sh
+if [ "$1" = "-v" ]; then echo "ngspice-fake 1.0"; exit 0; fi
+echo "run" >> "$(dirname "$0")/calls.txt"
+echo "v(out) = 1.0" > "$3"
+echo "1 1 0.5" > ac_out.csv
+echo "png" > schematic.png
+"""
+WRDATA = ".control\nwrdata ac_out.csv v(out)\n.endc\n"
+
+
+class SimulationCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.exe = os.path.join(self.root, "ngspice")
+        with open(self.exe, "w") as handle:
+            handle.write(FAKE_NGSPICE)
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IEXEC)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run_dir(self, name, netlist):
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        with open(os.path.join(path, "generated.sp"), "w") as handle:
+            handle.write(netlist)
+        return path
+
+    def _calls(self):
+        with open(os.path.join(self.root, "calls.txt")) as handle:
+            return len(handle.read().splitlines())
+
+    def test_identical_netlists_are_served_from_cache(self):
+        cache = SimulationCache(root=os.path.join(self.root, "cache"), max_bytes=10 * 1024 * 1024)
+        backend = CachedNgspice(SubprocessNgspice(self.exe), cache)
+
+        first = backend.run("generated.sp", cwd=self._run_dir("a", "* title a\nR1 in out 1k\n" + WRDATA + ".end\n"))
+        second_dir = self._run_dir("b", "* another title\nR1   in out 1k\n\n" + WRDATA + ".end\n")
+        second = backend.run("generated.sp", cwd=second_dir)
+
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(first.cache_key, second.cache_key)
+        self.assertEqual(self._calls(), 1)
+        self.assertTrue(os.path.exists(os.path.join(second_dir, "ac_out.csv")))
+        self.assertTrue(os.path.exists(second.log_path))
+
+        third = backend.run("generated.sp", cwd=self._run_dir("c", "R1 in out 2k\n" + WRDATA + ".end\n"))
+        self.assertFalse(third.cached)
+        self.assertEqual(self._calls(), 2)
+
+    def test_only_deck_outputs_are_stored_and_replayed(self):
+        cache = SimulationCache(root=os.path.join(self.root, "cache"), max_bytes=10 * 1024 * 1024)
+        backend = CachedNgspice(SubprocessNgspice(self.exe), cache)
+        netlist = "R1 in out 1k\n" + WRDATA + ".end\n"
+
+        backend.run("generated.sp", cwd=self._run_dir("a", netlist))
+        second_dir = self._run_dir("b", netlist)
+        second = backend.run("generated.sp", cwd=second_dir)
+
+        self.assertTrue(second.cached)
+        self.assertEqual(sorted(os.listdir(second_dir)), ["ac_out.csv", "generated.sp", "ngspice.log"])
+
+    def test_included_file_edits_change_the_key(self):
+        cache = SimulationCache(root=os.path.join(self.root, "cache"), max_bytes=10 * 1024 * 1024)
+        backend = CachedNgspice(SubprocessNgspice(self.exe), cache)
+        models = os.path.join(self.root, "models.lib")
+        netlist = f".include {models}\nR1 in out 1k\n" + WRDATA + ".end\n"
+        with open(models, "w") as handle:
+            handle.write(".model nch nmos level=1 vto=0.5\n")
+
+        first = backend.run("generated.sp", cwd=self._run_dir("a", netlist))
+        repeat = backend.run("generated.sp", cwd=self._run_dir("b", netlist))
+        with open(models, "w") as handle:
+            handle.write(".model nch nmos level=1 vto=0.7\n")
+        edited = backend.run("generated.sp", cwd=self._run_dir("c", netlist))
+        missing = backend.run("generated.sp", cwd=self._run_dir("d", ".include nowhere.lib\n" + WRDATA + ".end\n"))
+
+        self.assertTrue(repeat.cached)
+        self.assertFalse(edited.cached)
+        self.assertNotEqual(first.cache_key, edited.cache_key)
+        self.assertIsNone(missing.cache_key)
+        self.assertEqual(self._calls(), 3)
+
+    def test_eviction_keeps_store_under_size_budget(self):
+        cache = SimulationCache(root=os.path.join(self.root, "cache"), max_bytes=0)
+        backend = CachedNgspice(SubprocessNgspice(self.exe), cache)
+        backend.run("generated.sp", cwd=self._run_dir("a", "R1 in out 1k\n.end\n"))
+        self.assertEqual(cache._entries(), [])
+
+    def test_normalize_ignores_comments_and_spacing(self):
+        self.assertEqual(normalize_netlist("* t\nR1  a  b 1k \n\n"), "R1 a b 1k")
+
+
+if __name__ == "__main__":
+    unittest.main()
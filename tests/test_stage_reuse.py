@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from agents.topology_agent import TopologyAgent
+from core.demo_catalog import get_demo_case
+from core.reference_knowledge import load_reference_catalog
+from core.shared_memory import SharedMemory
+from core.stage_reuse import StageReuseCache, format_stage_reuse, stage_reuse_markers
+from core.sweep_registry import apply_sweep_value, sweep_override_note
+
+
+def _point_memory(case_name, sweep_key, value, forced=True):
+    case = get_demo_case(case_name)
+    memory = SharedMemory()
+    memory.write("specification", case["specification"] + sweep_override_note(sweep_key, value))
+    memory.write("constraints", apply_sweep_value(case_name, dict(case["constraints"]), sweep_key, value))
+    memory.write("case_metadata", {"forced_topology": case.get("forced_topology") if forced else None})
+    return memory
+
+
+class TopologyStageReuseTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.catalog = load_reference_catalog()
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache = StageReuseCache(os.path.join(self._tmp.name, "stage_cache"))
+
+    def _agent(self):
+        return TopologyAgent(reference_catalog=self.catalog, stage_cache=self.cache)
+
+    def test_forced_topology_is_selected_once_per_sweep(self):
+        with mock.patch.object(self.catalog, "search", wraps=self.catalog.search) as search:
+            first = _point_memory("rc", "fixed_cap_f", 4.7e-9)
+            self._agent().run_agent(first)
+            calls = search.call_count
+            second = _point_memory("rc", "fixed_cap_f", 22e-9)
+            self._agent().run_agent(second)
+
+        self.assertEqual(search.call_count, calls)
+        for key in TopologyAgent.REUSED_STATE_KEYS:
+            self.assertEqual(second.read(key), first.read(key), msg=key)
+        markers = stage_reuse_markers(second.get_full_state(), second.iter_history())
+        self.assertEqual(markers["topology"], "reused")
+        self.assertEqual(
+            format_stage_reuse(markers),
+            "topology=reused;sizing=skipped;constraints=skipped;netlist=skipped;simulation=skipped",
+        )
+
+    def test_unforced_selection_is_keyed_on_every_constraint(self):
+        agent = self._agent()
+        first = agent.dependency_inputs(_point_memory("rc", "target_fc_hz", 500.0, forced=False))
+        second = agent.dependency_inputs(_point_memory("rc", "target_fc_hz", 5000.0, forced=False))
+        self.assertNotEqual(self.cache.key("topology", first), self.cache.key("topology", second))
+
+        forced = [agent.dependency_inputs(_point_memory("rc", "target_fc_hz", value)) for value in (500.0, 5000.0)]
+        self.assertEqual(forced[0], forced[1])
+
+    def test_reference_queries_ignore_sweep_override_notes(self):
+        with mock.patch.object(self.catalog, "search", wraps=self.catalog.search) as search:
+            TopologyAgent(reference_catalog=self.catalog).run_agent(_point_memory("rc", "target_fc_hz", 500.0, forced=False))
+
+        queries = [call.kwargs.get("query") or "" for call in search.call_args_list]
+        self.assertTrue(queries)
+        self.assertFalse([query for query in queries if "Sweep override" in query])
+
+
+if __name__ == "__main__":
+    unittest.main()
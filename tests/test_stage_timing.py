@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from core.shared_memory import SharedMemory
+from core.stage_timing import NODE_TIMING_EVENT, node_timings_from_history, record_subprocess_time, write_timing_artifacts
+from flow.pocketflow import Flow, Node
+
+
+class _SleepyNode(Node):
+    def exec(self, prep_res):
+        time.sleep(0.02)
+        record_subprocess_time(0.015)
+        return "ok"
+
+    def post(self, shared, prep_res, exec_res):
+        return "next"
+
+
+class _FlakyNode(Node):
+    def __init__(self):
+        super().__init__(max_retries=3)
+        self.attempts = 0
+
+    def exec(self, prep_res):
+        self.attempts += 1
+        if self.attempts < 3:
+            raise RuntimeError("transient")
+        return "ok"
+
+    def post(self, shared, prep_res, exec_res):
+        shared.increment_iteration()
+        return "done"
+
+
+def _flow():
+    first = _SleepyNode()
+    first - "next" >> _FlakyNode()
+    return Flow(start=first)
+
+
+class StageTimingTests(unittest.TestCase):
+    def test_flow_records_one_timing_event_per_node(self):
+        memory = SharedMemory()
+        _flow().run(memory)
+
+        records = node_timings_from_history(memory.iter_history())
+        self.assertEqual([record["node"] for record in records], ["_SleepyNode", "_FlakyNode"])
+        sleepy, flaky = records
+        self.assertGreaterEqual(sleepy["wall_s"], 0.02)
+        self.assertAlmostEqual(sleepy["subprocess_s"], 0.015)
+        self.assertEqual(sleepy["subprocess_calls"], 1)
+        self.assertEqual(sleepy["action"], "next")
+        self.assertEqual(flaky["retries"], 2)
+        self.assertEqual(flaky["iteration"], 0)
+        self.assertGreaterEqual(flaky["start_s"], sleepy["start_s"] + sleepy["wall_s"])
+
+    def test_instrumentation_can_be_disabled(self):
+        memory = SharedMemory()
+        with mock.patch.dict(os.environ, {"I13_STAGE_TIMING": "0"}):
+            _flow().run(memory)
+        self.assertFalse(any(event["event"] == NODE_TIMING_EVENT for event in memory.iter_history()))
+
+    def test_timing_artifacts_include_summary_and_chrome_trace(self):
+        memory = SharedMemory()
+        _flow().run(memory)
+        records = node_timings_from_history(memory.iter_history())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = write_timing_artifacts(records, tmpdir)
+            with open(paths["timing_path"]) as handle:
+                timing = json.load(handle)
+            with open(paths["trace_path"]) as handle:
+                trace = json.load(handle)
+
+        self.assertEqual(timing["summary"]["node_count"], 2)
+        self.assertEqual(timing["summary"]["by_node"]["_FlakyNode"]["retries"], 2)
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual({event["name"] for event in spans}, {"_SleepyNode", "_FlakyNode", "iteration 0"})
+        self.assertTrue(all(event["dur"] >= 0 for event in spans))
+        self.assertIsNone(write_timing_artifacts([], "unused"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+from core.lazy_imports import HEAVY_MODULES, ImportProfiler, lazy_import
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LIST_CASES_PROBE = """
+import contextlib, io, json, runpy, sys
+sys.argv = ["main.py", "list-cases"]
+with contextlib.redirect_stdout(io.StringIO()):
+    runpy.run_path("main.py", run_name="__main__")
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+class StartupTests(unittest.TestCase):
+    def test_list_cases_stays_within_startup_budget(self):
+        budget_s = float(os.getenv("I13_STARTUP_BUDGET_S", "2.0"))
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "main.py", "list-cases"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        elapsed = time.perf_counter() - start
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertLess(elapsed, budget_s)
+
+    def test_list_cases_does_not_import_heavy_modules(self):
+        result = subprocess.run(
+            [sys.executable, "-c", _LIST_CASES_PROBE],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+        self.assertFalse(loaded & set(HEAVY_MODULES))
+        self.assertNotIn("agents.simulation_agent", loaded)
+
+    def test_lazy_module_defers_import_until_first_use(self):
+        sys.modules.pop("wave", None)
+        module = lazy_import("wave")
+        self.assertIs(lazy_import("wave"), module)
+        self.assertFalse(module.loaded)
+        self.assertNotIn("wave", sys.modules)
+        self.assertTrue(callable(module.open))
+        self.assertTrue(module.loaded)
+        self.assertIn("wave", sys.modules)
+
+    def test_import_profiler_records_nested_timings(self):
+        profiler = ImportProfiler()
+        sys.meta_path.insert(0, profiler)
+        try:
+            sys.modules.pop("tabnanny", None)
+            import tabnanny  # noqa: F401
+        finally:
+            sys.meta_path.remove(profiler)
+        names = [record["module"] for record in profiler.records]
+        self.assertIn("tabnanny", names)
+        record = next(item for item in profiler.records if item["module"] == "tabnanny")
+        self.assertGreaterEqual(record["cumulative_s"], record["self_s"])
+        self.assertIn("heavy modules loaded", profiler.report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from core.waveforms import WaveformSet, WaveformStore, add_rawfile_outputs, load_rawfile
+
+
+def _write_binary_rawfile(path, plotname, variables, rows, is_complex=False):
+    header = [
+        "Title: test circuit",
+        "Date: Thu Jan  1 00:00:00 2026",
+        f"Plotname: {plotname}",
+        f"Flags: {'complex' if is_complex else 'real'}",
+        f"No. Variables: {len(variables)}",
+        f"No. Points: {len(rows)}",
+        "Variables:",
+    ]
+    header.extend(f"\t{idx}\t{name}\t{kind}" for idx, (name, kind) in enumerate(variables))
+    header.append("Binary:")
+    payload = bytearray("\n".join(header).encode("latin-1") + b"\n")
+    for row in rows:
+        for value in row:
+            if is_complex:
+                payload += struct.pack("<dd", complex(value).real, complex(value).imag)
+            else:
+                payload += struct.pack("<d", value)
+    with open(path, "wb") as handle:
+        handle.write(bytes(payload))
+
+
+class WaveformSetTests(unittest.TestCase):
+    def test_add_rawfile_outputs_mirrors_wrdata_lines(self):
+        netlist = "\n".join(
+            [
+                "* rc",
+                ".control",
+                "ac dec 100 1 1e6",
+                "wrdata ac_out.csv frequency vm(out)",
+                "dc VOUT 0 1 0.1",
+                "wrdata dc_out.csv v(out) iout",
+                "quit",
+                ".endc",
+            ]
+        )
+        text = add_rawfile_outputs(netlist)
+        lines = [line.strip() for line in text.splitlines()]
+        self.assertEqual(lines[lines.index(".control") + 1], "set filetype=binary")
+        self.assertEqual(lines[lines.index("wrdata ac_out.csv frequency vm(out)") + 1], "write ac_out.raw frequency vm(out)")
+        self.assertEqual(lines[lines.index("wrdata dc_out.csv v(out) iout") + 1], "write dc_out.raw v(out) iout")
+
+    def test_binary_real_and_complex_plots_load_all_vectors(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            _write_binary_rawfile(
+                os.path.join(tmp, "tran_out.raw"),
+                "Transient Analysis",
+                [("time", "time"), ("v(in)", "voltage"), ("v(out)", "voltage")],
+                [(idx * 1e-6, 1.0, 0.1 * idx) for idx in range(50)],
+            )
+            _write_binary_rawfile(
+                os.path.join(tmp, "ac_out.raw"),
+                "AC Analysis",
+                [("frequency", "frequency"), ("vm(out)", "voltage")],
+                [(10.0 ** idx, 1.0 / (1 + idx)) for idx in range(6)],
+                is_complex=True,
+            )
+
+            plots = load_rawfile(os.path.join(tmp, "tran_out.raw"))
+            self.assertEqual(len(plots), 1)
+            self.assertEqual(plots[0].variables, ["time", "v(in)", "v(out)"])
+            self.assertEqual(plots[0].points, 50)
+
+            waveforms = WaveformSet.from_directory(tmp)
+            self.assertEqual(sorted(waveforms.names()), ["ac_out", "tran_out"])
+            tran = waveforms.series("tran_out", as_lists=True)
+            self.assertAlmostEqual(tran["x"][10], 10e-6)
+            self.assertAlmostEqual(tran["y"][10], 1.0)
+            self.assertAlmostEqual(list(waveforms.vector("tran_out", "v(in)"))[3], 1.0)
+
+            ac = waveforms.series("ac_out", as_lists=True)
+            self.assertEqual(ac["x"], [1.0, 10.0, 100.0, 1000.0, 10000.0, 100000.0])
+            self.assertAlmostEqual(ac["y"][1], 0.5)
+            self.assertIsInstance(ac["y"][1], float)
+
+    def test_ascii_rawfile_is_supported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "dc_out.raw")
+            with open(path, "w") as handle:
+                handle.write(
+                    "Title: t\nPlotname: DC transfer characteristic\nFlags: real\n"
+                    "No. Variables: 2\nNo. Points: 3\nVariables:\n"
+                    "\t0\tv-sweep\tvoltage\n\t1\tiout\tcurrent\nValues:\n"
+                    " 0\t0.0\n\t1e-6\n\n 1\t0.5\n\t2e-6\n\n 2\t1.0\n\t3e-6\n"
+                )
+            series = WaveformSet.from_directory(tmp).series("dc_out", as_lists=True)
+            self.assertEqual(series["x"], [0.0, 0.5, 1.0])
+            self.assertEqual(series["y"], [1e-6, 2e-6, 3e-6])
+
+    def test_store_prefers_rawfile_over_csv(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "tran_out.csv")
+            with open(csv_path, "w") as handle:
+                handle.write("0 0 9\n1 1 9\n")
+            self.assertEqual(WaveformStore(tmp).series(csv_path), {"x": [0.0, 1.0], "y": [9.0, 9.0]})
+            _write_binary_rawfile(
+                os.path.join(tmp, "tran_out.raw"),
+                "Transient Analysis",
+                [("time", "time"), ("v(out)", "voltage")],
+                [(0.0, 1.0), (1.0, 2.0)],
+            )
+            store = WaveformStore(tmp)
+            self.assertEqual(store.series(csv_path), {"x": [0.0, 1.0], "y": [1.0, 2.0]})
+            self.assertEqual(store.preview(csv_path, max_lines=1), ["0.000000e+00\t1.000000e+00"])
+            self.assertEqual(store.files_read, [])
+
+    def test_store_reads_each_file_once_and_feeds_collect_analysis_metrics(self):
+        from core.verification_pipeline import collect_analysis_metrics
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "dc_out.csv"), "w") as handle:
+                handle.write("".join(f" {0.1 * idx:.6e}  {0.1 * idx:.6e}  {0.1 * idx:.6e}  {2e-5 * idx:.6e}\n" for idx in range(8)))
+            log_path = os.path.join(tmp, "ngspice.log")
+            with open(log_path, "w") as handle:
+                handle.write("Circuit: mirror\n@mout[gm] = 1.0e-4\n")
+
+            store = WaveformStore(tmp)
+            series = store.series("dc_out.csv")
+            self.assertEqual(len(series["x"]), 8)
+            self.assertAlmostEqual(series["y"][-1], 1.4e-4)
+            self.assertEqual(len(store.preview("dc_out.csv", max_lines=3)), 3)
+            self.assertAlmostEqual(store.column("dc_out.csv", 1)[2], 0.2)
+            self.assertEqual(store.text_preview(log_path, max_lines=1), ["Circuit: mirror"])
+
+            metrics = collect_analysis_metrics(
+                topology="current_mirror",
+                plan={"analyses": ["dc"]},
+                constraints={"target_iout_a": 100e-6},
+                sizing={},
+                sim={},
+                log_text=store.text(log_path),
+                waveforms=store,
+            )
+            self.assertTrue(metrics["per_analysis"]["dc"]["executed"])
+            self.assertAlmostEqual(metrics["per_analysis"]["dc"]["metrics"]["compliance_voltage_v"], 0.5)
+            self.assertEqual(
+                sorted(os.path.basename(path) for path in store.files_read),
+                ["dc_out.csv", "ngspice.log"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,8 +16,10 @@ import json
 import math
 import os
 import re
+import shutil
 import signal
 import tempfile
+import threading
 from pathlib import Path
 
 os.environ.setdefault("MPLCONFIGDIR", os.path.join(tempfile.gettempdir(), "i13-mplconfig"))
@@ -212,22 +214,21 @@ def _device_value(devices, prefix, fallback=""):
 
 
 def _make_axes(width=11.0, height=6.0):
-    import matplotlib
+    # A standalone Figure keeps no pyplot global state, so schematics can be
+    # drawn from background threads while other code plots with pyplot.
+    from matplotlib.figure import Figure
 
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-
-    fig, ax = plt.subplots(figsize=(width, height))
+    fig = Figure(figsize=(width, height))
+    ax = fig.subplots()
     ax.set_aspect("equal")
     ax.axis("off")
-    return plt, fig, ax
+    return fig, ax
 
 
-def _save(plt, fig, png_path: str, svg_path: str) -> tuple[str, str]:
+def _save(fig, png_path: str, svg_path: str) -> tuple[str, str]:
     Path(png_path).parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(png_path, dpi=180, bbox_inches="tight", facecolor="white")
     fig.savefig(svg_path, bbox_inches="tight", facecolor="white")
-    plt.close(fig)
     return (
         png_path if os.path.exists(png_path) else None,
         svg_path if os.path.exists(svg_path) else None,
@@ -455,7 +456,7 @@ def _render_topology_specific(kind: str, text: str, png_path: str, svg_path: str
 
 
 def _render_rc_lowpass(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=8.5, height=4.5)
+    fig, ax = _make_axes(width=8.5, height=4.5)
     ax.set_xlim(-0.4, 8.5)
     ax.set_ylim(-1.5, 2.5)
 
@@ -482,12 +483,12 @@ def _render_rc_lowpass(devices, png_path, svg_path, sizing, constraints):
     title_extra = f"  •  target fc = {_humanize(fc_target, 'Hz')}" if fc_target else ""
     _label(ax, 4.0, 2.25, f"First-Order RC Low-Pass{title_extra}", fontsize=13, weight="bold", color="#0f172a")
 
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_rlc_bandpass(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=10.0, height=5.0)
+    fig, ax = _make_axes(width=10.0, height=5.0)
     ax.set_xlim(-0.4, 10.0)
     ax.set_ylim(-1.6, 2.6)
 
@@ -524,12 +525,12 @@ def _render_rlc_bandpass(devices, png_path, svg_path, sizing, constraints):
     if bw:
         title_extra += f"  •  BW = {_humanize(bw, 'Hz')}"
     _label(ax, 4.8, 2.35, f"Second-Order RLC Band-Pass{title_extra}", fontsize=12.5, weight="bold", color="#0f172a")
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_rlc_lowpass(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=10.0, height=5.0)
+    fig, ax = _make_axes(width=10.0, height=5.0)
     ax.set_xlim(-0.4, 10.0)
     ax.set_ylim(-1.6, 2.6)
 
@@ -546,12 +547,12 @@ def _render_rlc_lowpass(devices, png_path, svg_path, sizing, constraints):
     _draw_ground(ax, 7.4, 0.0)
 
     _label(ax, 4.8, 2.35, "Second-Order RLC Low-Pass", fontsize=12.5, weight="bold", color="#0f172a")
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_rlc_highpass(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=10.0, height=5.0)
+    fig, ax = _make_axes(width=10.0, height=5.0)
     ax.set_xlim(-0.4, 10.0)
     ax.set_ylim(-1.6, 2.6)
     _draw_io_terminal(ax, 0.4, 1.4, "VIN", side="left")
@@ -566,12 +567,12 @@ def _render_rlc_highpass(devices, png_path, svg_path, sizing, constraints):
     _draw_resistor(ax, 6.4, 1.4, 6.4, 0.0, label_text=f"R = {_device_value(devices, 'R', '')}")
     _draw_ground(ax, 6.4, 0.0)
     _label(ax, 4.8, 2.35, "Second-Order RLC High-Pass", fontsize=12.5, weight="bold", color="#0f172a")
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_common_source(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=9.5, height=6.0)
+    fig, ax = _make_axes(width=9.5, height=6.0)
     ax.set_xlim(-0.4, 9.5)
     ax.set_ylim(-2.2, 4.2)
 
@@ -627,12 +628,12 @@ def _render_common_source(devices, png_path, svg_path, sizing, constraints):
         title += "  •  " + ", ".join(extras)
     _label(ax, 4.6, 4.0, title, fontsize=12, weight="bold", color="#0f172a")
 
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_common_drain(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=9.5, height=6.0)
+    fig, ax = _make_axes(width=9.5, height=6.0)
     ax.set_xlim(-0.4, 9.5)
     ax.set_ylim(-2.4, 4.2)
 
@@ -660,12 +661,12 @@ def _render_common_drain(devices, png_path, svg_path, sizing, constraints):
         _draw_capacitor(ax, out_x, out_y - 0.4, out_x, -1.5, label_text=f"CL = {_humanize(cl, 'F')}")
         _draw_ground(ax, out_x, -1.5)
     _label(ax, 4.5, 4.0, "Common-Drain Source Follower", fontsize=12, weight="bold", color="#0f172a")
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_current_mirror(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=9.5, height=6.0)
+    fig, ax = _make_axes(width=9.5, height=6.0)
     ax.set_xlim(-0.4, 9.5)
     ax.set_ylim(-2.6, 4.2)
 
@@ -739,12 +740,12 @@ def _render_current_mirror(devices, png_path, svg_path, sizing, constraints):
         title += "  •  " + ", ".join(extras)
     _label(ax, 4.5, 4.0, title, fontsize=12, weight="bold", color="#0f172a")
 
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_diff_pair(devices, png_path, svg_path, sizing, constraints):
-    plt, fig, ax = _make_axes(width=10.5, height=6.0)
+    fig, ax = _make_axes(width=10.5, height=6.0)
     ax.set_xlim(-0.4, 10.5)
     ax.set_ylim(-2.6, 4.4)
 
@@ -793,13 +794,13 @@ def _render_diff_pair(devices, png_path, svg_path, sizing, constraints):
     _draw_ground(ax, tail_x, -2.2)
 
     _label(ax, 5.0, 4.2, "NMOS Differential Pair", fontsize=12.5, weight="bold", color="#0f172a")
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
 def _render_opamp_block(devices, png_path, svg_path, sizing, constraints):
     """Block-level diagram for folded-cascode / two-stage / telescopic op amps."""
-    plt, fig, ax = _make_axes(width=11.0, height=6.0)
+    fig, ax = _make_axes(width=11.0, height=6.0)
     ax.set_xlim(-0.4, 11.0)
     ax.set_ylim(-1.5, 4.4)
     from matplotlib.patches import FancyBboxPatch
@@ -867,7 +868,7 @@ def _render_opamp_block(devices, png_path, svg_path, sizing, constraints):
         title += "  •  " + ", ".join(extras)
     _label(ax, 5.5, 4.2, title, fontsize=12, weight="bold", color="#0f172a")
 
-    png, svg = _save(plt, fig, png_path, svg_path)
+    png, svg = _save(fig, png_path, svg_path)
     return _topology_result(png, svg)
 
 
@@ -901,19 +902,28 @@ def _try_lcapy(text: str, png_path: str, svg_path: str) -> dict:
     if any(device["kind"] in {"M", "Q"} for device in devices):
         return _failed("MOS/BJT schematic is routed to fallback graph renderer")
     timeout_s = int(os.getenv("I13_SCHEMATIC_LCAPY_TIMEOUT", "8"))
+    # lcapy draws into a private staging dir; a render abandoned on timeout
+    # can then never overwrite the fallback schematic written in its place.
+    staging = tempfile.mkdtemp(prefix="i13-lcapy-")
+    staged_svg = os.path.join(staging, os.path.basename(svg_path))
+    staged_png = os.path.join(staging, os.path.basename(png_path))
     try:
         _ensure_tex_path()
         from lcapy import Circuit
 
         def render():
             circuit = Circuit(text)
-            circuit.draw(svg_path)
+            circuit.draw(staged_svg)
             try:
-                circuit.draw(png_path)
+                circuit.draw(staged_png)
             except Exception:
                 pass
 
         _run_with_timeout(render, timeout_s)
+        Path(png_path).parent.mkdir(parents=True, exist_ok=True)
+        for staged, final in ((staged_svg, svg_path), (staged_png, png_path)):
+            if os.path.exists(staged):
+                shutil.move(staged, final)
         return {
             "schematic_png_path": png_path if os.path.exists(png_path) else None,
             "schematic_svg_path": svg_path if os.path.exists(svg_path) else None,
@@ -922,11 +932,17 @@ def _try_lcapy(text: str, png_path: str, svg_path: str) -> dict:
         }
     except Exception as exc:
         return _failed(str(exc))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
 
 
 def _run_with_timeout(func, timeout_s: int):
-    if timeout_s <= 0 or not hasattr(signal, "SIGALRM"):
+    if timeout_s <= 0:
         return func()
+    if not hasattr(signal, "SIGALRM") or threading.current_thread() is not threading.main_thread():
+        # SIGALRM can only be armed from the main thread; background renders
+        # wait on a helper thread instead (a timed-out render is abandoned).
+        return _run_in_thread_with_timeout(func, timeout_s)
 
     def handler(signum, frame):
         raise TimeoutError(f"lcapy render exceeded {timeout_s}s")
@@ -940,15 +956,31 @@ def _run_with_timeout(func, timeout_s: int):
         signal.signal(signal.SIGALRM, old_handler)
 
 
+def _run_in_thread_with_timeout(func, timeout_s: int):
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = func()
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    worker = threading.Thread(target=target, name="i13-lcapy-render", daemon=True)
+    worker.start()
+    worker.join(timeout_s)
+    if worker.is_alive():
+        raise TimeoutError(f"lcapy render exceeded {timeout_s}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome.get("result")
+
+
 def _draw_fallback_graph(text: str, png_path: str, svg_path: str) -> dict:
     devices = parse_devices(text)
     if not devices:
         return _failed("no drawable devices found")
     try:
-        import matplotlib
-
-        matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
         from matplotlib.patches import FancyArrowPatch, Rectangle
     except Exception as exc:
         return _failed(f"matplotlib unavailable: {exc}")
@@ -956,7 +988,8 @@ def _draw_fallback_graph(text: str, png_path: str, svg_path: str) -> dict:
     roles = _node_roles(devices)
     fig_w = min(16, max(10, 1.25 * len(devices) + 4))
     fig_h = 7.0
-    fig, ax = plt.subplots(figsize=(fig_w, fig_h))
+    fig = Figure(figsize=(fig_w, fig_h))
+    ax = fig.subplots()
     ax.set_xlim(-1.0, max(8.5, len(devices) * 1.35 + 2.5))
     ax.set_ylim(-3.2, 3.2)
     ax.axis("off")
@@ -988,7 +1021,6 @@ def _draw_fallback_graph(text: str, png_path: str, svg_path: str) -> dict:
     Path(png_path).parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(png_path, dpi=160, bbox_inches="tight")
     fig.savefig(svg_path, bbox_inches="tight")
-    plt.close(fig)
     return {
         "schematic_png_path": png_path if os.path.exists(png_path) else None,
         "schematic_svg_path": svg_path if os.path.exists(svg_path) else None,
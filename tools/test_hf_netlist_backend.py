@@ -9,6 +9,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from llm.hf_space_client import default_hf_client_pool
 from llm.netlist_backends import cleanup_spice_netlist, stringify_backend_response
 
 
@@ -61,26 +62,8 @@ def main() -> int:
         return 0
 
     try:
-        from gradio_client import Client
-
-        kwargs = {}
-        token = os.getenv("HF_TOKEN", "").strip()
-        if token:
-            kwargs["hf_token"] = token
-        client = Client(SPACE_ID, **kwargs)
-        errors = []
-        response = None
-        for call in (
-            lambda: client.predict(prompt, api_name="/predict"),
-            lambda: client.predict(prompt),
-        ):
-            try:
-                response = call()
-                break
-            except Exception as exc:
-                errors.append(str(exc))
-        if response is None:
-            raise RuntimeError("; ".join(errors) or "HF Space prediction failed")
+        # Live check of the Space itself, so this goes through the client pool but not the response cache.
+        response = default_hf_client_pool().predict(SPACE_ID, prompt, token=os.getenv("HF_TOKEN", "").strip())
 
         raw = stringify_backend_response(response)
         cleaned = cleanup_spice_netlist(raw, required_analyses=["op", "ac"])
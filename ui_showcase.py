@@ -29,6 +29,7 @@ from core.demo_catalog import (
 )
 from core.demo_safe import summarize_sizing
 from core.reference_usage import summarize_reference_usage
+from core.shared_memory import iter_history
 from core.showcase_artifacts import (
     LATEST_ROOT,
     artifacts_for_row,
@@ -459,7 +460,14 @@ def _ui_values_from_constraints(case_key: str, constraints: dict) -> dict:
     return values
 
 
-def run_ui_sweep(case_key: str, sweep_param: str, center_value: float, backend: str, values: list[float] = None) -> dict:
+def run_ui_sweep(
+    case_key: str,
+    sweep_param: str,
+    center_value: float,
+    backend: str,
+    values: list[float] = None,
+    jobs: int = None,
+) -> dict:
     resolved_case = CASE_OPTIONS[case_key]
     actual_param = sweep_param
     values = values or sorted({center_value * 0.5, center_value, center_value * 2.0})
@@ -471,6 +479,7 @@ def run_ui_sweep(case_key: str, sweep_param: str, center_value: float, backend:
             values,
             output_dir=str(output_dir),
             update_latest=False,
+            jobs=jobs,
         )
     new_group = sweep_group_from_output(f"{case_key}_{actual_param}", str(root), rows)
     prior_rows, prior_groups = _prior_showcase_state(exclude_sweep=new_group.get("name"))
@@ -683,7 +692,7 @@ def _backend_provenance(final_state: dict) -> dict:
     usage = summarize_reference_usage(final_state)
     llm_calls = [
         (item.get("data") or {}).get("task") or (item.get("data") or {}).get("agent")
-        for item in final_state.get("history") or []
+        for item in iter_history(final_state)
         if item.get("event") == "llm_call"
     ]
     return {